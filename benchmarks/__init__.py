@@ -0,0 +1,3 @@
+"""
+Ce fichier marque le répertoire benchmarks comme un package Python
+"""
@@ -0,0 +1,41 @@
+"""
+Benchmark de la préparation des sprites: copies indépendantes contre vues (subsurface) sur les sprite sheets
+
+Utilisation: python -m benchmarks.bench_atlas_sprites
+"""
+import time
+
+from benchmarks.commun import afficher_resultats
+
+from src.sprites import sprites, get_sprite, copier_sprite
+
+NB_REPETITIONS = 200
+
+def mesurer(fonction_extraction):
+    """
+    Extrait NB_REPETITIONS fois tous les sprites du jeu.
+
+    Returns:
+        tuple: (temps moyen d'extraction de tous les sprites en ms, octets de pixels alloués)
+    """
+    debut = time.perf_counter()
+    for _ in range(NB_REPETITIONS):
+        images = {name: fonction_extraction(name) for name in sprites}
+    duree = (time.perf_counter() - debut) / NB_REPETITIONS * 1000
+
+    # Une subsurface partage les pixels de sa sprite sheet: seules les surfaces sans parent allouent
+    octets = sum(image.get_bytesize() * image.get_width() * image.get_height()
+                 for image in images.values() if image.get_parent() is None)
+    return duree, octets
+
+def main():
+    """Lance le benchmark et affiche les résultats."""
+    lignes = []
+    for nom, fonction_extraction in (('copies', copier_sprite), ('subsurfaces', get_sprite)):
+        duree, octets = mesurer(fonction_extraction)
+        lignes.append((nom, len(sprites), duree, octets))
+    afficher_resultats(f'Extraction de tous les sprites ({NB_REPETITIONS} répétitions)', lignes,
+                       ['méthode', 'sprites', 'temps (ms)', 'octets alloués'])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark du contrôleur automatique: coût de la prédiction des trajectoires par image
+
+Mesure ControleurAutomatique.position_x dans une partie en cours avec 1 à 1000 balles:
+prédiction recalculée à chaque image (pire cas: une balle rebondit à chaque image) et coût
+moyen en jeu (prédiction gardée tant que les vitesses et les briques ne changent pas).
+Objectif: bien moins d'une milliseconde par image; le code de sortie vaut 1 si une mesure
+dépasse OBJECTIF_MS.
+
+Utilisation: python -m benchmarks.bench_controleur_automatique
+"""
+import sys
+import time
+
+from benchmarks.commun import afficher_resultats, creer_balles_aleatoires
+
+from src.controleurs import ControleurAutomatique
+from src.jeu import Jeu
+from src.sons import activer_sons
+
+NOMBRES_BALLES = (1, 10, 100, 1000)
+NB_IMAGES = 300
+OBJECTIF_MS = 1.0  # Temps maximal par image, recalcul compris
+
+def mesurer(nb_balles):
+    """
+    Joue NB_IMAGES images avec nb_balles balles en mouvement.
+
+    Returns:
+        tuple: (temps moyen par image avec recalcul systématique, temps moyen en jeu), en ms
+    """
+    controleur = ControleurAutomatique()
+    jeu = Jeu(controleur=controleur, affichage_actif=False, verbeux=False, graine=1)
+    jeu.balles.pop()
+    jeu.balles.extend(creer_balles_aleatoires(nb_balles))
+
+    recalcul = en_jeu = 0.0
+    for _ in range(NB_IMAGES):
+        jeu.vies = 3  # La partie ne doit pas s'arrêter pendant la mesure
+        manquantes = nb_balles - len(jeu.balles)
+        if manquantes > 0:
+            jeu.balles.extend(creer_balles_aleatoires(manquantes, graine=len(jeu.balles)))
+        debut = time.perf_counter()
+        controleur._cle = None  # Force une nouvelle prédiction
+        controleur.position_x(jeu)
+        recalcul += time.perf_counter() - debut
+
+        # Coût réel: la prédiction de l'image précédente est réutilisée si rien n'a rebondi
+        jeu.mise_a_jour()
+        debut = time.perf_counter()
+        controleur.position_x(jeu)
+        en_jeu += time.perf_counter() - debut
+    return recalcul / NB_IMAGES * 1000, en_jeu / NB_IMAGES * 1000
+
+def main():
+    """Lance le benchmark et affiche les résultats."""
+    activer_sons(False)
+    lignes = []
+    for nb_balles in NOMBRES_BALLES:
+        lignes.append((nb_balles, *mesurer(nb_balles)))
+    afficher_resultats(f'ControleurAutomatique.position_x ({NB_IMAGES} images)', lignes,
+                       ['balles', 'recalcul (ms)', 'en jeu (ms)'])
+    depassements = [nb_balles for nb_balles, *temps in lignes if max(temps) > OBJECTIF_MS]
+    if depassements:
+        print(f"Objectif de {OBJECTIF_MS:g} ms dépassé avec {', '.join(map(str, depassements))} balle(s)")
+    sys.exit(1 if depassements else 0)
+
+if __name__ == '__main__':
+    main()
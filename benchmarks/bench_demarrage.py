@@ -0,0 +1,69 @@
+"""
+Benchmark du démarrage à froid: temps jusqu'à la première image de l'écran de démarrage
+
+Chaque mesure lance un nouvel interpréteur Python (imports, initialisation de pygame,
+chargement des ressources), puis s'arrête à la première présentation de l'écran.
+Mesure aussi l'import seul de TYPES_BRIQUES, comme le ferait un outil sans fenêtre.
+
+Utilisation: python -m benchmarks.bench_demarrage
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.commun import RACINE, afficher_resultats
+
+NB_MESURES = 5
+
+# Arrête le jeu à la première image présentée et affiche le temps écoulé depuis le début du script
+PREMIERE_IMAGE = '''
+import os, time
+debut = time.perf_counter()
+import pygame
+def premiere_image(*args):
+    print((time.perf_counter() - debut) * 1000)
+    os._exit(0)
+pygame.display.flip = premiere_image
+import main
+main.main()
+'''
+
+# Importe seulement les données des briques et indique si une fenêtre a été créée
+IMPORT_DONNEES = '''
+import time
+debut = time.perf_counter()
+from src.sprites import TYPES_BRIQUES
+duree = (time.perf_counter() - debut) * 1000
+import pygame
+print(duree, pygame.display.get_init() and pygame.display.get_surface() is not None)
+'''
+
+def lancer(code):
+    """
+    Exécute un script dans un nouvel interpréteur.
+
+    Returns:
+        tuple: (sortie du script découpée en mots, durée totale du processus en ms)
+    """
+    debut = time.perf_counter()
+    resultat = subprocess.run([sys.executable, '-c', code], cwd=RACINE, capture_output=True, text=True, check=True)
+    duree = (time.perf_counter() - debut) * 1000
+    return resultat.stdout.split()[-2:] if code is IMPORT_DONNEES else resultat.stdout.split()[-1:], duree
+
+def main():
+    """Lance le benchmark et affiche les résultats (médianes)."""
+    premiere_image = [lancer(PREMIERE_IMAGE) for _ in range(NB_MESURES)]
+    import_donnees = [lancer(IMPORT_DONNEES) for _ in range(NB_MESURES)]
+
+    lignes = [
+        ('première image', statistics.median(float(sortie[0]) for sortie, _ in premiere_image),
+         statistics.median(duree for _, duree in premiere_image), '-'),
+        ('TYPES_BRIQUES', statistics.median(float(sortie[0]) for sortie, _ in import_donnees),
+         statistics.median(duree for _, duree in import_donnees), import_donnees[0][0][1]),
+    ]
+    afficher_resultats(f'Démarrage à froid (médiane de {NB_MESURES} lancements)', lignes,
+                       ['mesure', 'script (ms)', 'processus (ms)', 'fenêtre créée'])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark de l'environnement d'apprentissage: pas de simulation par seconde pour une partie
+seule, pour des parties vectorisées dans un processus et réparties sur plusieurs processus
+
+La raquette suit la balle la plus menaçante décrite par l'observation (politique simple
+mais réaliste: les parties progressent normalement dans les niveaux).
+
+Utilisation: python -m benchmarks.bench_environnement
+"""
+import os
+import time
+
+from benchmarks.commun import afficher_resultats
+
+import numpy as np
+from src.constantes import XMAX
+from src.environnement import EnvironnementJeu, EnvironnementsVectorises
+
+NB_PAS = 20000  # Pas de simulation mesurés par configuration (toutes parties confondues)
+NOMBRE_PARTIES = 16
+
+def politique(observations):
+    """Vise l'abscisse de la première balle observée (la plus menaçante)."""
+    return observations[..., 5] * XMAX
+
+def mesurer_seul():
+    """Mesure EnvironnementJeu.step sur une seule partie."""
+    env = EnvironnementJeu()
+    observation = env.reset(0)
+    debut = time.perf_counter()
+    for _ in range(NB_PAS):
+        observation, _, termine, _ = env.step(politique(observation))
+        if termine:
+            observation = env.reset()
+    return NB_PAS / (time.perf_counter() - debut)
+
+def mesurer_vectorise(processus):
+    """
+    Mesure EnvironnementsVectorises.step avec NOMBRE_PARTIES parties.
+
+    Returns:
+        tuple: (processus effectivement utilisés, pas/s) - 0 processus si les parties sont jouées
+               dans le processus courant (voir EnvironnementsVectorises)
+    """
+    envs = EnvironnementsVectorises(NOMBRE_PARTIES, processus=processus)
+    processus = envs.processus
+    observations = envs.reset(0)
+    debut = time.perf_counter()
+    for _ in range(NB_PAS // NOMBRE_PARTIES):
+        observations, _, _, _ = envs.step(politique(observations))
+    duree = time.perf_counter() - debut
+    envs.close()
+    return processus, NB_PAS // NOMBRE_PARTIES * NOMBRE_PARTIES / duree
+
+def main():
+    """Lance le benchmark et affiche les résultats."""
+    lignes = [('1 partie', 0, mesurer_seul())]
+    lignes.append((f'{NOMBRE_PARTIES} parties', *mesurer_vectorise(0)))
+    # Un cœur reste au processus principal (au-delà, les parties restent dans le processus courant)
+    nb_coeurs = os.cpu_count() or 1
+    for processus in sorted({2, max(nb_coeurs - 1, 2)}):
+        lignes.append((f'{NOMBRE_PARTIES} parties (processus={processus})', *mesurer_vectorise(processus)))
+    afficher_resultats(f'Environnement d\'apprentissage ({nb_coeurs} cœur(s))', lignes,
+                       ['configuration', 'processus', 'pas/s'])
+
+if __name__ == '__main__':
+    main()
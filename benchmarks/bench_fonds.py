@@ -0,0 +1,81 @@
+"""
+Benchmark des images de fond: blit d'un fond converti ou non et entrée dans un niveau
+
+Compare le blit plein écran d'un fond tel que décodé (32 bits avec alpha) et du même fond
+converti au format de la fenêtre (src.fonds), puis le chargement d'un niveau quand son fond
+est décodé à l'entrée, décodé à l'avance par le thread de préchargement ou déjà en cache.
+
+Utilisation: python -m benchmarks.bench_fonds
+"""
+import time
+
+from benchmarks.commun import afficher_resultats
+
+import pygame
+from src import fonds as module_fonds
+from src.fonds import fonds, precharger_fond
+from src.gestion_niveaux import charger_niveau
+from src.moteur import ecran, initialiser
+from src.niveaux import NIVEAUX
+from src.sprites import TYPES_BRIQUES
+
+NB_BLITS = 2000
+NB_ENTREES = 50
+
+def mesurer_blit(surface):
+    """
+    Returns:
+        float: Temps moyen d'un blit de surface sur l'écran, en ms
+    """
+    debut = time.perf_counter()
+    for _ in range(NB_BLITS):
+        ecran().blit(surface, (0, 0))
+    return (time.perf_counter() - debut) / NB_BLITS * 1000
+
+def mesurer_entree(mode):
+    """
+    Mesure charger_niveau pour chaque niveau.
+
+    Args:
+        mode (str): 'décodage' (cache vide), 'préchargé' (fond décodé par le thread pendant le
+                    niveau précédent) ou 'en cache' (fond déjà converti)
+
+    Returns:
+        float: Temps moyen d'entrée dans un niveau, en ms
+    """
+    total = 0.0
+    for _ in range(NB_ENTREES):
+        for niveau in sorted(NIVEAUX):
+            chemin = NIVEAUX[niveau]['arriere_plan']
+            suivant = NIVEAUX.get(niveau + 1, NIVEAUX[niveau])['arriere_plan']
+            # Le décodage anticipé lancé par l'entrée précédente se termine hors mesure
+            for decodage in list(module_fonds._decodages.values()):
+                decodage.result()
+            if mode == 'en cache':
+                fonds[chemin], fonds[suivant]  # Aucun décodage pendant la mesure
+            else:
+                fonds.clear()
+                module_fonds._decodages.clear()
+            if mode == 'préchargé':
+                precharger_fond(chemin)
+                module_fonds._decodages[chemin].result()  # Le niveau précédent a laissé le temps de décoder
+            debut = time.perf_counter()
+            charger_niveau(niveau, TYPES_BRIQUES)
+            total += time.perf_counter() - debut
+    return total / (NB_ENTREES * len(NIVEAUX)) * 1000
+
+def main():
+    """Lance le benchmark et affiche les résultats."""
+    initialiser()
+    chemin = NIVEAUX[1]['arriere_plan']
+    lignes = [
+        ('blit décodé', mesurer_blit(pygame.image.load(chemin))),
+        ('blit converti', mesurer_blit(fonds[chemin])),
+    ]
+    afficher_resultats(f'Blit plein écran du fond ({NB_BLITS} blits)', lignes, ['fond', 'temps (ms)'])
+
+    lignes = [(mode, mesurer_entree(mode)) for mode in ('décodage', 'préchargé', 'en cache')]
+    afficher_resultats(f'charger_niveau ({NB_ENTREES} fois chaque niveau)', lignes, ['fond', 'temps (ms)'])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark des collisions balle/briques: parcours de toutes les briques contre grille spatiale
+
+Utilisation: python -m benchmarks.bench_grille_spatiale
+"""
+import random
+import time
+
+from benchmarks.commun import creer_balles_aleatoires, afficher_resultats
+
+from src.constantes import XMAX
+from src.gestion_briques import generer_briques
+from src.grille_spatiale import GrilleSpatiale
+from src.raquette import Raquette
+from src.sprites import TYPES_BRIQUES
+
+NOMBRES_BALLES = (1, 16, 256)
+NB_IMAGES = 120
+NIVEAU = 7
+VIE_BENCHMARK = 10 ** 9
+
+def generer_niveau(graine):
+    """
+    Génère les briques d'un niveau de façon reproductible.
+
+    Les briques reçoivent une vie très élevée pour que la charge reste constante
+    pendant toute la mesure (aucune brique ne disparaît).
+    """
+    liste_briques = []
+    generer_briques(['bleue', 'jaune'], liste_briques, XMAX, TYPES_BRIQUES, NIVEAU, random.Random(graine))
+    for brique in liste_briques:
+        brique.vie = VIE_BENCHMARK
+    return liste_briques
+
+def collisions_liste(balles, liste_briques, grille):
+    """Ancien chemin: chaque balle est testée contre toutes les briques."""
+    for balle in balles:
+        for brique in liste_briques:
+            if brique.en_vie():
+                brique.collision_balle(balle)
+
+def collisions_grille(balles, liste_briques, grille):
+    """Nouveau chemin: chaque balle n'est testée que contre les briques de ses cellules."""
+    for balle in balles:
+        for brique in grille.briques_proches_balle(balle):
+            if brique.en_vie():
+                brique.collision_balle(balle)
+                if not brique.en_vie():
+                    grille.retirer(brique)
+
+def mesurer(fonction_collisions, nb_balles):
+    """
+    Simule NB_IMAGES images et mesure le temps passé dans les collisions avec les briques.
+
+    Returns:
+        tuple: (temps moyen par image en ms, nombre de collisions)
+    """
+    liste_briques = generer_niveau(1)
+    grille = GrilleSpatiale(liste_briques)
+    balles = creer_balles_aleatoires(nb_balles, graine=2)
+    raquette = Raquette()
+
+    # Graine fixe pour les tirages de bonus, identique pour les deux chemins
+    random.seed(3)
+    total = 0.0
+    for _ in range(NB_IMAGES):
+        for balle in balles:
+            if balle.deplacer(raquette):
+                # Relancer les balles perdues pour garder une charge constante
+                balle.sur_raquette = False
+                balle.y = 100
+                balle.vitesse_par_angle(60)
+        debut = time.perf_counter()
+        fonction_collisions(balles, liste_briques, grille)
+        total += time.perf_counter() - debut
+
+    collisions = sum(VIE_BENCHMARK - brique.vie for brique in liste_briques)
+    return total / NB_IMAGES * 1000, collisions
+
+def main():
+    """Lance le benchmark et affiche les résultats."""
+    nb_briques = len(generer_niveau(1))
+    lignes = []
+    for nb_balles in NOMBRES_BALLES:
+        temps_liste, collisions_liste_ = mesurer(collisions_liste, nb_balles)
+        temps_grille, collisions_grille_ = mesurer(collisions_grille, nb_balles)
+        lignes.append((nb_balles, temps_liste, temps_grille, temps_liste / temps_grille,
+                       f'{collisions_liste_}/{collisions_grille_}'))
+    afficher_resultats(f'Collisions balle/briques ({nb_briques} briques, {NB_IMAGES} images)', lignes,
+                       ['balles', 'liste (ms)', 'grille (ms)', 'accélération', 'collisions'])
+
+if __name__ == '__main__':
+    main()
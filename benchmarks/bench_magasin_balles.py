@@ -0,0 +1,62 @@
+"""
+Benchmark d'une image complète (mise_a_jour + affichage) avec un grand nombre de balles
+
+Compare le magasin vectorisé au déplacement balle par balle (seuil de vectorisation
+désactivé). Objectif: tenir 60 images par seconde (16,7 ms) avec 2000 balles.
+
+Utilisation: python -m benchmarks.bench_magasin_balles
+"""
+import random
+import time
+
+from benchmarks.commun import afficher_resultats
+
+import pygame
+from src import magasin_balles
+from src.balle import Balle
+from src.jeu import Jeu
+
+NOMBRES_BALLES = (100, 500, 2000)
+NB_IMAGES = 300
+
+def mesurer(nb_balles, vectorise):
+    """
+    Joue NB_IMAGES images avec nb_balles balles en mouvement.
+
+    Returns:
+        float: Temps moyen par image en ms
+    """
+    seuil = magasin_balles.SEUIL_VECTORISATION
+    if not vectorise:
+        magasin_balles.SEUIL_VECTORISATION = float('inf')
+    try:
+        jeu = Jeu(verbeux=False, graine=1)
+        rng = random.Random(2)
+
+        total = 0.0
+        for _ in range(NB_IMAGES):
+            pygame.event.pump()
+            jeu.vies = 3  # La partie ne doit pas s'arrêter pendant la mesure
+            # Remplacer les balles perdues pour garder nb_balles balles en jeu
+            jeu.balles.extend(Balle(rng.uniform(10, 230), rng.uniform(60, 140), rng.uniform(-2, 2), rng.uniform(-3, -1))
+                              for _ in range(nb_balles - len(jeu.balles)))
+            debut = time.perf_counter()
+            jeu.mise_a_jour()
+            jeu.affichage()
+            total += time.perf_counter() - debut
+        return total / NB_IMAGES * 1000
+    finally:
+        magasin_balles.SEUIL_VECTORISATION = seuil
+
+def main():
+    """Lance le benchmark et affiche les résultats."""
+    lignes = []
+    for nb_balles in NOMBRES_BALLES:
+        temps_scalaire = mesurer(nb_balles, False)
+        temps_vectorise = mesurer(nb_balles, True)
+        lignes.append((nb_balles, temps_scalaire, temps_vectorise, 1000 / temps_vectorise))
+    afficher_resultats(f'Image complète sans présentation ({NB_IMAGES} images)', lignes,
+                       ['balles', 'par balle (ms)', 'vectorisé (ms)', 'images/s'])
+
+if __name__ == '__main__':
+    main()
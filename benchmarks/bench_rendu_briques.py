@@ -0,0 +1,62 @@
+"""
+Benchmark de l'affichage de toutes les briques d'un niveau
+
+Compare la recherche du sprite par nom à chaque image (f-string + dictionnaire, ancien
+Brique.afficher) au sprite précalculé de chaque brique, changé seulement quand sa vie change.
+
+Utilisation: python -m benchmarks.bench_rendu_briques
+"""
+import random
+import time
+
+from benchmarks.commun import afficher_resultats
+
+import pygame
+from src.constantes import XMAX, YMAX
+from src.gestion_briques import generer_briques
+from src.niveaux import NIVEAUX
+from src.sprites import TYPES_BRIQUES, sprites, sprite_images
+from src.table_briques import TableBriques
+
+NB_IMAGES = 500
+
+def afficher_par_nom(brique, surface):
+    """Affiche une brique en recherchant son sprite par nom (ancienne méthode)."""
+    if brique.en_vie():
+        sprite_name = f'brique{brique.type_brique}_{brique.vie}_{brique.couleur}'
+        if sprite_name in sprites:
+            surface.blit(sprite_images[sprite_name], (brique.x - brique.width/2, brique.y - brique.height/2))
+
+def afficher_precalcule(brique, surface):
+    """Affiche une brique avec son sprite précalculé."""
+    brique.afficher(surface)
+
+def mesurer(liste_briques, fonction_affichage):
+    """
+    Affiche NB_IMAGES fois toutes les briques du niveau.
+
+    Returns:
+        float: Temps moyen par image en ms
+    """
+    surface = pygame.Surface((XMAX, YMAX)).convert()
+    debut = time.perf_counter()
+    for _ in range(NB_IMAGES):
+        for brique in liste_briques:
+            fonction_affichage(brique, surface)
+    return (time.perf_counter() - debut) / NB_IMAGES * 1000
+
+def main():
+    """Lance le benchmark et affiche les résultats."""
+    lignes = []
+    for niveau in sorted(NIVEAUX):
+        liste_briques = TableBriques()
+        generer_briques(NIVEAUX[niveau]['couleurs_briques'], liste_briques, XMAX, TYPES_BRIQUES, niveau,
+                        random.Random(niveau))
+        par_nom = mesurer(liste_briques, afficher_par_nom)
+        precalcule = mesurer(liste_briques, afficher_precalcule)
+        lignes.append((niveau, len(liste_briques), par_nom, precalcule, par_nom / precalcule))
+    afficher_resultats(f'Affichage de toutes les briques d\'un niveau ({NB_IMAGES} images)', lignes,
+                       ['niveau', 'briques', 'par nom (ms)', 'précalculé (ms)', 'accélération'])
+
+if __name__ == '__main__':
+    main()
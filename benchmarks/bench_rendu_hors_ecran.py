@@ -0,0 +1,79 @@
+"""
+Benchmark de la capture d'images hors écran: coût par image de RenduHorsEcran.capturer
+(RVB, réduit, niveaux de gris) comparé à une copie (surfarray.array3d) et à un PNG
+
+Utilisation: python -m benchmarks.bench_rendu_hors_ecran
+"""
+import io
+import time
+
+from benchmarks.commun import afficher_resultats
+
+import pygame
+from src.moteur import initialiser
+from src.controleurs import ControleurScripte
+from src.jeu import Jeu
+from src.rendu_hors_ecran import RenduHorsEcran
+from src.sons import activer_sons
+
+NB_IMAGES = 2000
+NB_IMAGES_PNG = 100  # Le PNG est trop lent pour autant d'images que les autres mesures
+
+def nouvelle_partie():
+    """Crée la partie mesurée: la même pour chaque configuration (même graine, même contrôleur)."""
+    return Jeu(controleur=ControleurScripte(graine=1), verbeux=False, graine=1)
+
+def mesurer(capture, jeu, nb_images=NB_IMAGES):
+    """
+    Mesure le temps moyen d'une capture (la partie avance d'un pas entre deux captures, hors mesure).
+
+    Args:
+        capture (callable): Capture d'une image de jeu
+        jeu (Jeu): Partie neuve (nouvelle_partie), qui avance pendant la mesure
+        nb_images (int): Nombre d'images mesurées
+
+    Returns:
+        float: Temps moyen par image en µs
+    """
+    total = 0.0
+    for _ in range(nb_images):
+        if all(balle.sur_raquette for balle in jeu.balles):
+            jeu.lancer_balles(30, 150)
+        jeu.mise_a_jour()
+        debut = time.perf_counter()
+        capture()
+        total += time.perf_counter() - debut
+    return total / nb_images * 1e6
+
+def main():
+    """Lance le benchmark et affiche les résultats."""
+    initialiser()
+    activer_sons(False)
+
+    lignes = []
+    for nom, options in [('RVB 240x160', {}), ('RVB 120x80', {'reduction': 2}),
+                         ('gris 240x160', {'niveaux_de_gris': True}),
+                         ('gris 120x80', {'niveaux_de_gris': True, 'reduction': 2}),
+                         ('gris 60x40', {'niveaux_de_gris': True, 'reduction': 4})]:
+        rendu, jeu = RenduHorsEcran(**options), nouvelle_partie()
+        lignes.append((nom, mesurer(lambda: rendu.capturer(jeu), jeu)))
+
+    # Références: rendu dans la surface puis copie du tableau, ou enregistrement d'un PNG
+    rendu = RenduHorsEcran()
+    jeu = nouvelle_partie()
+
+    def copie():
+        rendu.dessiner(jeu)
+        pygame.surfarray.array3d(rendu.surface)
+
+    def png():
+        rendu.dessiner(jeu)
+        pygame.image.save(rendu.surface, io.BytesIO(), 'image.png')
+
+    lignes.append(('copie array3d', mesurer(copie, jeu)))
+    jeu = nouvelle_partie()
+    lignes.append(('PNG', mesurer(png, jeu, NB_IMAGES_PNG)))
+    afficher_resultats('Capture d\'une image du jeu (rendu compris)', lignes, ['sortie', 'µs/image'])
+
+if __name__ == '__main__':
+    main()
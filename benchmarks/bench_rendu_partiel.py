@@ -0,0 +1,93 @@
+"""
+Benchmark du temps d'affichage par image: présentation complète (flip) contre rendu partiel
+
+Le temps de composition (Jeu.affichage) et le temps de présentation (flip ou update)
+sont mesurés séparément: avec une fenêtre pygame.SCALED, SDL présente toujours la
+texture entière, seul le temps de composition profite alors du rendu partiel (peu
+d'objets mobiles: quelques petites zones effacées au lieu de tout le fond). Avec beaucoup
+de balles, les zones couvrent la plus grande partie de l'écran et le rendu partiel revient
+à des images complètes (voir PART_MAX_RENDU_PARTIEL).
+
+Utilisation: python -m benchmarks.bench_rendu_partiel
+"""
+import random
+import time
+
+from benchmarks.commun import afficher_resultats
+
+import pygame
+from src.balle import Balle
+from src.constantes import XMAX
+from src.jeu import Jeu
+
+NB_IMAGES = 1200
+NOMBRES_BALLES = (1, 16, 400)
+
+def lancer_balles(jeu):
+    """Lance les balles posées sur la raquette avec un angle aléatoire."""
+    for balle in jeu.balles:
+        if balle.sur_raquette:
+            balle.sur_raquette = False
+            balle.vitesse_par_angle(random.randint(30, 150))
+
+def ajouter_balles(jeu, nb_balles):
+    """Remplace les balles perdues: la charge reste de nb_balles balles pendant toute la mesure."""
+    while len(jeu.balles) < nb_balles:
+        jeu.balles.append(Balle(random.uniform(10, XMAX - 10), 100, random.uniform(-2, 2), -2))
+
+def mesurer(rendu_partiel, nb_balles):
+    """
+    Joue NB_IMAGES images et mesure le temps d'affichage et de présentation.
+
+    Returns:
+        tuple: (composition moyenne en ms, présentation moyenne en ms, nombre moyen de zones présentées,
+                part des images présentées en entier)
+    """
+    random.seed(1)
+    jeu = Jeu(rendu_partiel=rendu_partiel, verbeux=False, graine=1)
+    lancer_balles(jeu)
+    ajouter_balles(jeu, nb_balles)
+
+    composition = 0.0
+    presentation = 0.0
+    nb_zones = 0
+    nb_completes = 0
+    for _ in range(NB_IMAGES):
+        pygame.event.pump()
+        jeu.vies = 3  # La partie ne doit pas s'arrêter pendant la mesure
+        jeu.mise_a_jour()
+        lancer_balles(jeu)
+        ajouter_balles(jeu, nb_balles)
+
+        debut = time.perf_counter()
+        zones_modifiees = jeu.affichage()
+        milieu = time.perf_counter()
+        if zones_modifiees is None:
+            pygame.display.flip()
+            nb_zones += 1
+            nb_completes += 1
+        else:
+            pygame.display.update(zones_modifiees)
+            nb_zones += len(zones_modifiees)
+        fin = time.perf_counter()
+
+        composition += milieu - debut
+        presentation += fin - milieu
+
+    return (composition / NB_IMAGES * 1000, presentation / NB_IMAGES * 1000, nb_zones / NB_IMAGES,
+            nb_completes / NB_IMAGES)
+
+def main():
+    """Lance le benchmark et affiche les résultats."""
+    lignes = []
+    for nb_balles in NOMBRES_BALLES:
+        for rendu_partiel in (False, True):
+            composition, presentation, zones, completes = mesurer(rendu_partiel, nb_balles)
+            lignes.append((nb_balles, 'partiel' if rendu_partiel else 'flip',
+                           composition, presentation, composition + presentation, zones, completes))
+    afficher_resultats(f'Affichage + présentation par image ({NB_IMAGES} images, pilote vidéo dummy)', lignes,
+                       ['balles', 'mode', 'composition', 'présentation', 'total (ms)', 'zones/image',
+                        'images complètes'])
+
+if __name__ == '__main__':
+    main()
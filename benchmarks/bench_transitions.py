@@ -0,0 +1,105 @@
+"""
+Benchmark des changements d'écran: menu → partie → game over → menu
+
+Mesure pour chaque transition le temps jusqu'à la première image présentée du nouvel écran
+(polices, boutons, textes, fond, niveau). Compare les polices rouvertes à chaque écran
+(registre vidé avant chaque transition, comme avant le registre) et les polices partagées,
+préchargées au démarrage.
+
+Utilisation: python -m benchmarks.bench_transitions
+"""
+import statistics
+import time
+
+from benchmarks.commun import afficher_resultats
+
+import pygame
+from src.ecran_demarrage import afficher_ecran_demarrage
+from src.ecran_fin_partie import afficher_ecran_game_over
+from src.ecrans import polices_ouvertes, precharger_polices
+from src.jeu import Jeu
+from src.moteur import initialiser
+from src.sons import activer_sons
+
+NB_CYCLES = 20
+TRANSITIONS = ('menu', 'partie', 'game over')
+
+class PremiereImage(Exception):
+    """Levée à la première présentation d'un écran pour sortir de sa boucle."""
+
+def premiere_image(*args):
+    """Remplace pygame.display.flip: interrompt l'écran dès sa première image."""
+    raise PremiereImage
+
+def jusqu_a_premiere_image(afficher_ecran, *args):
+    """
+    Affiche un écran jusqu'à sa première image.
+
+    Returns:
+        float: Durée en ms
+    """
+    debut = time.perf_counter()
+    try:
+        afficher_ecran(*args)
+    except PremiereImage:
+        pass
+    return (time.perf_counter() - debut) * 1000
+
+def cycle(partagees):
+    """
+    Enchaîne menu → partie → game over (le retour au menu est la transition du cycle suivant).
+
+    Args:
+        partagees (bool): Si False, le registre des polices est vidé avant chaque transition
+
+    Returns:
+        list: Durée de chaque transition (voir TRANSITIONS), en ms
+    """
+    durees = []
+    jeu = None
+
+    def partie():
+        nonlocal jeu
+        jeu = Jeu(verbeux=False, graine=0)
+        jeu.affichage()
+        premiere_image()
+
+    for transition in TRANSITIONS:
+        if not partagees:
+            polices_ouvertes.clear()
+        if transition == 'menu':
+            durees.append(jusqu_a_premiere_image(afficher_ecran_demarrage))
+        elif transition == 'partie':
+            durees.append(jusqu_a_premiere_image(partie))
+        else:
+            durees.append(jusqu_a_premiere_image(afficher_ecran_game_over, jeu.background_image))
+    return durees
+
+def mesurer(partagees):
+    """
+    Répète NB_CYCLES cycles.
+
+    Returns:
+        list: Médiane de chaque transition puis du cycle complet, en ms
+    """
+    polices_ouvertes.clear()
+    if partagees:
+        precharger_polices()
+    cycles = [cycle(partagees) for _ in range(NB_CYCLES)]
+    return [statistics.median(durees) for durees in zip(*cycles)] + \
+           [statistics.median(sum(durees) for durees in cycles)]
+
+def main():
+    """Lance le benchmark et affiche les résultats."""
+    initialiser()
+    activer_sons(False)
+    pygame.display.flip = premiere_image
+
+    rouvertes = mesurer(partagees=False)
+    partagees = mesurer(partagees=True)
+    lignes = [(nom, avant, apres) for nom, avant, apres in zip(TRANSITIONS + ('cycle',), rouvertes, partagees)]
+    afficher_resultats(f"Transitions jusqu'à la première image (médiane de {NB_CYCLES} cycles)", lignes,
+                       ['transition', 'rouvertes (ms)', 'partagées (ms)'])
+
+if __name__ == '__main__':
+    main()
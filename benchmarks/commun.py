@@ -0,0 +1,53 @@
+"""
+Fonctions communes aux benchmarks (à importer avant tout module de src)
+"""
+import os
+import random
+import sys
+
+# Les benchmarks tournent sans fenêtre ni carte son
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Les chemins des assets sont relatifs à la racine du dépôt
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(RACINE)
+if RACINE not in sys.path:
+    sys.path.insert(0, RACINE)
+
+def creer_balles_aleatoires(nombre, graine=0):
+    """
+    Crée des balles en mouvement réparties aléatoirement sur l'écran.
+
+    Args:
+        nombre (int): Nombre de balles à créer
+        graine (int): Graine du générateur aléatoire
+
+    Returns:
+        list: Liste des balles créées
+    """
+    from src.balle import Balle
+    from src.constantes import XMAX, YMAX
+
+    rng = random.Random(graine)
+    balles = []
+    for _ in range(nombre):
+        balle = Balle(rng.uniform(8, XMAX - 8), rng.uniform(8, YMAX - 30),
+                      rng.uniform(-2, 2), rng.uniform(-3, -1))
+        balles.append(balle)
+    return balles
+
+def afficher_resultats(titre, lignes, colonnes):
+    """
+    Affiche un tableau de résultats aligné.
+
+    Args:
+        titre (str): Titre du tableau
+        lignes (list): Liste de tuples de valeurs
+        colonnes (list): Noms des colonnes
+    """
+    print(titre)
+    print('  '.join(f'{nom:>14}' for nom in colonnes))
+    for ligne in lignes:
+        print('  '.join(f'{valeur:>14.3f}' if isinstance(valeur, float) else f'{valeur:>14}'
+                        for valeur in ligne))
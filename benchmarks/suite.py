@@ -0,0 +1,379 @@
+"""
+Suite de benchmarks reproductible des chemins critiques (simulation et rendu)
+
+Chaque cas est mesuré en plusieurs répétitions; la médiane et le minimum par itération
+sont enregistrés en JSON pour comparer deux exécutions et signaler les régressions.
+
+Utilisation:
+    python -m benchmarks.suite --sortie resultats.json [--filtre mise_a_jour]
+    python -m benchmarks.suite --comparer ancien.json nouveau.json [--seuil 10]
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.commun import RACINE, afficher_resultats
+
+import numpy as np
+import pygame
+from src.balle import Balle
+from src.boutons import Bouton
+from src.brique import Brique
+from src.constantes import XMAX, YMAX
+from src.controleurs import ControleurScripte
+from src.couche_briques import CoucheBriques
+from src.ecrans import charger_police
+from src.gestion_briques import generer_briques
+from src.grille_spatiale import GrilleSpatiale
+from src.jeu import Jeu
+from src.niveaux import NIVEAUX
+from src.raquette import Raquette
+from src.sons import activer_sons
+from src.sprites import TYPES_BRIQUES, COULEURS_DISPONIBLES
+from src.table_briques import TableBriques
+
+NB_REPETITIONS = 5
+SEUIL_REGRESSION = 10.0  # Pourcentage de ralentissement signalé par --comparer
+VIE_BENCHMARK = 10 ** 9  # Les briques synthétiques ne disparaissent pas pendant la mesure
+POSITION_TEMOIN = (-1000, -1000)  # Brique hors de l'écran qui empêche le niveau de se terminer
+
+NOMBRES_BALLES = (1, 10, 100, 1000)
+NOMBRES_BRIQUES = (0, 200, 2000)
+
+# --- Mondes synthétiques --------------------------------------------------------------
+
+def creer_brique_synthetique(rng, position=None):
+    """
+    Crée une brique de vie très élevée (elle ne disparaît pas pendant la mesure).
+
+    Args:
+        rng (Random): Générateur aléatoire
+        position (tuple, optional): Centre de la brique (par défaut, au hasard dans la moitié haute)
+    """
+    type_brique = rng.choice(list(TYPES_BRIQUES))
+    if position is None:
+        position = (rng.uniform(16, XMAX - 16), rng.uniform(8, YMAX / 2))
+    brique = Brique(*position, type_brique, rng.choice(COULEURS_DISPONIBLES))
+    brique.vie = VIE_BENCHMARK  # Affichée avec le sprite de sa vie maximale
+    return brique
+
+def creer_briques_synthetiques(nombre, rng):
+    """
+    Crée une table de briques réparties aléatoirement dans la moitié haute de l'écran.
+
+    Au-delà de quelques dizaines, les briques se chevauchent: c'est un monde de charge,
+    pas un niveau jouable. Une brique témoin, hors de l'écran, est ajoutée à la fin de la
+    table: le niveau n'est jamais terminé, même sans brique (voir creer_monde).
+
+    Args:
+        nombre (int): Nombre de briques (sans la brique témoin)
+        rng (Random): Générateur aléatoire
+
+    Returns:
+        TableBriques: Les briques (de vie très élevée)
+    """
+    table = TableBriques(capacite=nombre + 1)
+    for _ in range(nombre):
+        table.append(creer_brique_synthetique(rng))
+    table.append(creer_brique_synthetique(rng, POSITION_TEMOIN))
+    return table
+
+def creer_balle_synthetique(rng):
+    """Crée une balle en mouvement dans la moitié basse de l'écran."""
+    return Balle(rng.uniform(8, XMAX - 8), rng.uniform(YMAX / 2, YMAX - 30),
+                 rng.uniform(-2, 2), rng.uniform(-3, -1))
+
+def creer_monde(nb_balles, nb_briques, graine=0, rendu_partiel=False):
+    """
+    Crée une partie dont les balles et les briques sont remplacées par un monde synthétique.
+
+    Args:
+        nb_balles (int): Nombre de balles en jeu
+        nb_briques (int): Nombre de briques
+        graine (int): Graine du monde (mêmes objets à chaque exécution)
+        rendu_partiel (bool): Mode de rendu de la partie
+
+    Returns:
+        tuple: (jeu, rng) - la partie et le générateur utilisé pour remplacer les balles perdues
+    """
+    rng = random.Random(graine)
+    jeu = Jeu(rendu_partiel=rendu_partiel, controleur=ControleurScripte(graine=graine), verbeux=False,
+              graine=graine)
+
+    jeu.liste_briques = creer_briques_synthetiques(nb_briques, rng)
+    jeu.grille = GrilleSpatiale(jeu.liste_briques)
+    # La brique témoin garde le niveau en cours sans jamais être testée par les collisions
+    jeu.grille.retirer(jeu.liste_briques[nb_briques])
+    jeu.couche_briques = CoucheBriques(jeu.background_image, jeu.bg_x, jeu.bg_y, jeu.liste_briques)
+
+    jeu.balles.pop()
+    jeu.balles.extend(creer_balle_synthetique(rng) for _ in range(nb_balles))
+    return jeu, rng
+
+def completer_monde(jeu, nb_balles, rng):
+    """Remet le monde dans son état de mesure: vies et nombre de balles (hors chronométrage)."""
+    jeu.vies = 3
+    manquantes = nb_balles - len(jeu.balles)
+    if manquantes > 0:
+        jeu.balles.extend(creer_balle_synthetique(rng) for _ in range(manquantes))
+
+# --- Mesure ------------------------------------------------------------------------
+
+def mesurer(fabrique, iterations, repetitions=NB_REPETITIONS):
+    """
+    Mesure une opération: repetitions blocs de iterations appels.
+
+    Chaque répétition repart d'un état neuf et identique (créé par fabrique, hors chronométrage):
+    les mêmes calculs sont mesurés d'une exécution à l'autre.
+
+    Args:
+        fabrique (callable): Renvoie (preparer, executer) pour une répétition. preparer est appelé
+                             avant chaque itération, hors chronométrage (peut être None).
+        iterations (int): Nombre d'appels par répétition
+        repetitions (int): Nombre de répétitions
+
+    Returns:
+        dict: Médiane et minimum (sur les répétitions) du temps par itération, en ms
+    """
+    temps = []
+    for _ in range(repetitions):
+        preparer, executer = fabrique()
+        total = 0
+        for _ in range(iterations):
+            if preparer is not None:
+                preparer()
+            debut = time.perf_counter_ns()
+            executer()
+            total += time.perf_counter_ns() - debut
+        temps.append(total / iterations / 1e6)
+    return {'median_ms': statistics.median(temps), 'min_ms': min(temps),
+            'iterations': iterations, 'repetitions': repetitions}
+
+def mesurer_mise_a_jour(nb_balles, nb_briques):
+    """Mesure Jeu.mise_a_jour dans un monde synthétique."""
+    def fabrique():
+        jeu, rng = creer_monde(nb_balles, nb_briques)
+        return (lambda: completer_monde(jeu, nb_balles, rng)), jeu.mise_a_jour
+
+    # Les mondes les plus chargés coûtent jusqu'à une seconde par pas
+    return mesurer(fabrique, 5 if nb_balles * nb_briques > 100000 else 30)
+
+def mesurer_affichage(nb_balles, rendu_partiel):
+    """Mesure Jeu.affichage (composition seule, sans présentation) après chaque pas de simulation."""
+    def fabrique():
+        jeu, rng = creer_monde(nb_balles, 200, rendu_partiel=rendu_partiel)
+
+        def preparer():
+            completer_monde(jeu, nb_balles, rng)
+            jeu.mise_a_jour()
+
+        return preparer, jeu.affichage
+
+    return mesurer(fabrique, 30)
+
+def mesurer_generer_briques(niveau):
+    """Mesure generer_briques pour un niveau (graines 0, 1, 2... à chaque répétition)."""
+    couleurs = NIVEAUX[niveau]['couleurs_briques']
+
+    def fabrique():
+        graines = iter(range(10 ** 9))
+
+        def executer():
+            generer_briques(couleurs, TableBriques(), XMAX, TYPES_BRIQUES, niveau, random.Random(next(graines)))
+
+        return None, executer
+
+    return mesurer(fabrique, 50)
+
+def mesurer_raquette(mode):
+    """Mesure Raquette.afficher (mode: 'normale', 'elargie' ou 'animation' de la largeur)."""
+    def fabrique():
+        raquette = Raquette()
+        if mode == 'elargie':
+            raquette.elargir()
+        raquette.deplacer(XMAX / 2)
+        if mode != 'animation':
+            return None, raquette.afficher
+
+        def preparer():
+            # Élargissement puis rétrécissement (toutes les largeurs intermédiaires), en boucle
+            raquette.mise_a_jour()
+            if raquette.largeur_affichee == raquette.largeur_affichee_prec:
+                if raquette.elargie:
+                    raquette.temps_elargie = 1
+                else:
+                    raquette.elargir()
+
+        return preparer, lambda: raquette.afficher(0.5)
+
+    return mesurer(fabrique, 2000)
+
+def mesurer_bouton():
+    """Mesure Bouton.dessiner (fond, bordure et texte)."""
+    def fabrique():
+        polices, _ = charger_police()
+        bouton = Bouton(XMAX / 2, YMAX / 2 + 30, 105, 18, "Menu principal", polices['bouton'])
+        return None, bouton.dessiner
+
+    return mesurer(fabrique, 2000)
+
+def mesurer_ecran_pause():
+    """Mesure Jeu.afficher_ecran_pause (une image en pause)."""
+    def fabrique():
+        jeu = Jeu(verbeux=False, graine=0)
+        jeu.en_pause = True
+        return None, jeu.afficher_ecran_pause
+
+    return mesurer(fabrique, 500)
+
+def mesurer_image_pause(entree=False):
+    """
+    Mesure Jeu.affichage pendant la pause.
+
+    Args:
+        entree (bool): Si True, première image de la pause (jeu, overlay et titre dessinés puis
+                       gardés); sinon, image suivante (image figée, seul le bouton est redessiné)
+    """
+    def fabrique():
+        jeu = Jeu(verbeux=False, graine=0)
+        jeu.en_pause = True
+        jeu.affichage()
+        bouton = jeu.bouton_menu_principal
+
+        def preparer():
+            if entree:
+                jeu.image_pause = None
+            # Survol opposé à celui que donne la souris: le bouton est redessiné à chaque image
+            bouton.est_survole = not bouton.rect.collidepoint(pygame.mouse.get_pos())
+
+        return preparer, jeu.affichage
+
+    return mesurer(fabrique, 500)
+
+def mesurer_demarrage():
+    """Mesure l'import de src.jeu dans un nouvel interpréteur (sans fenêtre ni son)."""
+    code = ('import time; debut = time.perf_counter(); import src.jeu; '
+            'print((time.perf_counter() - debut) * 1000)')
+    temps = []
+    for _ in range(NB_REPETITIONS):
+        sortie = subprocess.run([sys.executable, '-c', code], cwd=RACINE,
+                                capture_output=True, text=True, check=True).stdout
+        temps.append(float(sortie.split()[-1]))
+    return {'median_ms': statistics.median(temps), 'min_ms': min(temps),
+            'iterations': 1, 'repetitions': NB_REPETITIONS}
+
+def lister_cas():
+    """
+    Liste les cas de la suite.
+
+    Returns:
+        list: Couples (nom du cas, fonction sans argument qui le mesure)
+    """
+    cas = []
+    for nb_balles in NOMBRES_BALLES:
+        for nb_briques in NOMBRES_BRIQUES:
+            cas.append((f'mise_a_jour/balles={nb_balles}/briques={nb_briques}',
+                        lambda b=nb_balles, n=nb_briques: mesurer_mise_a_jour(b, n)))
+    for rendu_partiel in (False, True):
+        for nb_balles in (1, 100, 1000):
+            mode = 'partiel' if rendu_partiel else 'complet'
+            cas.append((f'affichage/{mode}/balles={nb_balles}',
+                        lambda b=nb_balles, r=rendu_partiel: mesurer_affichage(b, r)))
+    for niveau in sorted(NIVEAUX):
+        cas.append((f'generer_briques/niveau={niveau}', lambda n=niveau: mesurer_generer_briques(n)))
+    for mode in ('normale', 'elargie', 'animation'):
+        cas.append((f'raquette_afficher/{mode}', lambda m=mode: mesurer_raquette(m)))
+    cas.append(('interface/bouton_dessiner', mesurer_bouton))
+    cas.append(('interface/ecran_pause', mesurer_ecran_pause))
+    cas.append(('interface/image_pause_figee', mesurer_image_pause))
+    cas.append(('interface/entree_pause', lambda: mesurer_image_pause(entree=True)))
+    cas.append(('demarrage/import_jeu', mesurer_demarrage))
+    return cas
+
+def executer_suite(filtre=None):
+    """
+    Exécute tous les cas de la suite (ou ceux dont le nom contient filtre).
+
+    Returns:
+        dict: Résultats et description de l'environnement
+    """
+    activer_sons(False)
+    resultats = {}
+    for nom, fonction_mesure in lister_cas():
+        if filtre and filtre not in nom:
+            continue
+        resultat = resultats[nom] = fonction_mesure()
+        print(f"{nom:<45}{resultat['median_ms']:10.4f} ms")
+    return {
+        'environnement': {
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'plateforme': platform.platform(),
+        },
+        'resultats': resultats,
+    }
+
+# --- Comparaison --------------------------------------------------------------------
+
+def comparer(ancien, nouveau, seuil=SEUIL_REGRESSION):
+    """
+    Compare deux exécutions de la suite.
+
+    Args:
+        ancien, nouveau (dict): Résultats chargés depuis les fichiers JSON
+        seuil (float): Ralentissement (en %) au-delà duquel un cas est une régression
+
+    Returns:
+        tuple: (lignes du tableau de comparaison, noms des cas en régression)
+    """
+    lignes = []
+    regressions = []
+    for nom, resultat in nouveau['resultats'].items():
+        if nom not in ancien['resultats']:
+            continue
+        avant = ancien['resultats'][nom]['median_ms']
+        apres = resultat['median_ms']
+        variation = (apres / avant - 1) * 100 if avant > 0 else 0.0
+        regression = variation > seuil
+        if regression:
+            regressions.append(nom)
+        lignes.append((nom, avant, apres, variation, 'RÉGRESSION' if regression else ''))
+    return lignes, regressions
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de Brick Breaker")
+    parser.add_argument('--sortie', metavar='FICHIER', help="fichier JSON où enregistrer les résultats")
+    parser.add_argument('--filtre', help="n'exécuter que les cas dont le nom contient ce texte")
+    parser.add_argument('--comparer', nargs=2, metavar=('ANCIEN', 'NOUVEAU'),
+                        help="comparer deux fichiers de résultats au lieu d'exécuter la suite")
+    parser.add_argument('--seuil', type=float, default=SEUIL_REGRESSION,
+                        help=f"ralentissement en %% signalé comme régression (défaut {SEUIL_REGRESSION:g})")
+    options = parser.parse_args()
+
+    if options.comparer:
+        with open(options.comparer[0], encoding='utf-8') as fichier:
+            ancien = json.load(fichier)
+        with open(options.comparer[1], encoding='utf-8') as fichier:
+            nouveau = json.load(fichier)
+        lignes, regressions = comparer(ancien, nouveau, options.seuil)
+        afficher_resultats(f'Comparaison (seuil de régression {options.seuil:g} %)', lignes,
+                           ['cas', 'avant (ms)', 'après (ms)', 'variation (%)', ''])
+        print(f"{len(regressions)} régression(s)")
+        sys.exit(1 if regressions else 0)
+
+    rapport = executer_suite(options.filtre)
+    if options.sortie:
+        with open(options.sortie, 'w', encoding='utf-8') as fichier:
+            json.dump(rapport, fichier, indent=2)
+        print(f"Résultats enregistrés dans {options.sortie}")
+
+if __name__ == '__main__':
+    main()
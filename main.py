@@ -1,27 +1,69 @@
 """
 Fichier principal du jeu Brick Breaker
 """
+import argparse
+import atexit
 import sys
 import pygame
 
-from src.constantes import screen
+from src.constantes import PAS_SIMULATION
+from src.moteur import initialiser
+from src.chronometrage import Chronometre
+from src.controleurs import ControleurAutomatique
+from src.surveillance import SurveillantImages, SEUIL_DEFAUT_MS
 from src.jeu import Jeu
 from src.ecran_demarrage import afficher_ecran_demarrage
 from src.ecran_fin_partie import afficher_ecran_game_over, afficher_ecran_victoire
+from src.ecrans import precharger_polices
 from src.sons import jouer_musique_jeu
-
-# Initialisation de Pygame
-pygame.init()
-# Initialisation du module audio
-pygame.mixer.init()
-pygame.display.set_caption("Brick Breaker")
+from src.rejeu import Enregistreur
 
 # Initialisation de l'horloge pour limiter les FPS
 clock = pygame.time.Clock()
-FPS = 60  # Images par seconde
+FPS = 60  # Images par seconde (par défaut)
+
+def lire_arguments():
+    """
+    Lit les options de la ligne de commande.
+    
+    Returns:
+        Namespace: Options du jeu
+    """
+    parser = argparse.ArgumentParser(description="Brick Breaker")
+    parser.add_argument('--rendu-partiel', action='store_true',
+                        help="ne présenter que les zones modifiées (pygame.display.update) au lieu de tout l'écran")
+    parser.add_argument('--fps', type=int, default=FPS,
+                        help="fréquence d'affichage maximale (30, 60, 144...), sans effet sur la vitesse du jeu")
+    parser.add_argument('--chronometrage', metavar='FICHIER',
+                        help="à la fermeture, écrire les percentiles des durées de chaque phase par niveau (.csv ou .json)")
+    parser.add_argument('--surveillance', type=float, nargs='?', const=SEUIL_DEFAUT_MS, metavar='SEUIL_MS',
+                        help="écrire un rapport (piles d'appels, nombre d'objets) pour chaque image plus longue "
+                             f"que SEUIL_MS (défaut {SEUIL_DEFAUT_MS:g} ms)")
+    parser.add_argument('--enregistrer', metavar='FICHIER',
+                        help="enregistrer les entrées de la partie pour la rejouer (python -m src.rejeu FICHIER)")
+    parser.add_argument('--graine', type=int,
+                        help="graine des parties: même disposition des niveaux, mêmes lancers et mêmes bonus")
+    parser.add_argument('--demo', action='store_true',
+                        help="mode démonstration: la raquette joue seule (prédiction des trajectoires)")
+    return parser.parse_args()
 
 def main():
     """Fonction principale du jeu"""
+    options = lire_arguments()
+    
+    # Initialisation de pygame et création de la fenêtre
+    initialiser()
+    
+    # Polices ouvertes une seule fois pour toutes les parties et tous les écrans
+    precharger_polices()
+    
+    # Mesure des durées de chaque phase des images (graphique avec F3)
+    chronometre = Chronometre()
+    if options.chronometrage:
+        atexit.register(chronometre.exporter, options.chronometrage)
+    
+    # Rapport automatique sur les images qui dépassent leur budget
+    surveillant = SurveillantImages(options.surveillance) if options.surveillance else None
     
     while True:
         # Afficher l'écran de démarrage
@@ -40,31 +82,68 @@ def main():
         jouer_musique_jeu()
         
         # Initialisation du jeu
-        jeu = Jeu()
+        jeu = Jeu(rendu_partiel=options.rendu_partiel, chronometre=chronometre, graine=options.graine,
+                  controleur=ControleurAutomatique() if options.demo else None)
+        
+        # Enregistrement des entrées de la partie (positions de la raquette, lancers, pauses)
+        enregistreur = None
+        if options.enregistrer:
+            enregistreur = Enregistreur(jeu.graine)
+            jeu.controleur = enregistreur.controleur(jeu.controleur)
         partie_en_cours = True
+        chronometre.demarrer()
         
-        # Boucle de jeu
+        # Boucle de jeu: simulation à pas fixe, affichage interpolé
+        duree_image = PAS_SIMULATION
         while partie_en_cours:
+            if surveillant is not None:
+                surveillant.debut_image()
+            
             # Gestion des événements
-            quitter = jeu.gestion_evenements()
+            evenements = pygame.event.get()
+            if options.demo and all(balle.sur_raquette for balle in jeu.balles):
+                # Démonstration: lancer comme avec la touche espace (l'enregistrement reste rejouable)
+                evenements.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+            if enregistreur is not None:
+                enregistreur.image(evenements)
+            quitter = jeu.gestion_evenements(evenements)
             if quitter:
+                if enregistreur is not None:
+                    enregistreur.sauvegarder(options.enregistrer, jeu)
                 pygame.quit()
                 sys.exit()
+            chronometre.marquer('evenements')
             
-            # Mise à jour de l'état du jeu (ne fait rien si en pause)
-            jeu.mise_a_jour()
+            # Mise à jour de l'état du jeu par pas fixes (ne fait rien si en pause)
+            alpha = jeu.avancer(duree_image)
+            chronometre.marquer('avancer')
             
             # Affichage (inclut maintenant l'écran de pause si nécessaire)
-            jeu.affichage()
+            zones_modifiees = jeu.affichage(alpha)
+            chronometre.marquer('affichage')
             
-            # Rafraîchissement de l'écran
-            pygame.display.flip()
+            # Rafraîchissement de l'écran (seulement les zones modifiées en rendu partiel)
+            if zones_modifiees is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(zones_modifiees)
+            chronometre.marquer('presentation')
+            if surveillant is not None:
+                surveillant.fin_travail()  # L'attente de clock.tick n'est pas surveillée
             
-            # Limitation de la fréquence d'images
-            clock.tick(FPS)
+            # Limitation de la fréquence d'images et mesure du temps réel écoulé
+            duree_image = clock.tick(options.fps) / 1000
+            chronometre.marquer('attente')
+            chronometre.fin_image(jeu.niveau)
+            if surveillant is not None:
+                surveillant.fin_image(jeu, chronometre)
             
             # Vérifier si la partie est terminée
             if jeu.partie_terminee:
+                if enregistreur is not None:
+                    enregistreur.sauvegarder(options.enregistrer, jeu)
+                    enregistreur = None
+                
                 # Libérer la souris et afficher le curseur avant les écrans de fin
                 pygame.mouse.set_visible(True)
                 pygame.event.set_grab(False)
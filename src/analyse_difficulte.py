@@ -0,0 +1,222 @@
+"""
+Module d'analyse de la difficulté des niveaux générés (Monte-Carlo): pour chaque niveau, des
+milliers de dispositions (une graine chacune) sont jouées sans fenêtre par la raquette scriptée,
+réparties sur plusieurs processus, et les statistiques sont réunies dans un rapport.
+
+Utilisation: python -m src.analyse_difficulte --parties 1000 [--processus 8] [--sortie rapport.csv]
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import time
+
+# Pas de fenêtre ni de carte son (doit être défini avant l'initialisation de pygame)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+from src.constantes import PAS_SIMULATION
+from src.controleurs import ControleurScripte
+from src.jeu import Jeu
+from src.niveaux import NIVEAUX
+from src.sons import activer_sons
+
+MAX_IMAGES_PAR_NIVEAU = 30000  # Un niveau non terminé après ce nombre de pas est abandonné
+NB_PARTIES_DEFAUT = 1000
+DECALAGE_MAX_DEFAUT = 12  # Imprécision de la raquette scriptée (pixels)
+
+# Mesures relevées pour chaque partie et moyennées dans le rapport
+MESURES = ('briques', 'images', 'coups_briques', 'rebonds_raquette', 'vies_perdues',
+           'bonus_apparus', 'bonus_ramasses')
+
+def jouer_niveau(tache):
+    """
+    Joue un niveau jusqu'à ce qu'il soit terminé, perdu ou abandonné.
+
+    Args:
+        tache (tuple): (niveau, graine, max_images, decalage_max) - decalage_max règle l'imprécision
+                       de la raquette scriptée (voir ControleurScripte)
+
+    Returns:
+        dict: Mesures de la partie (voir MESURES), niveau, graine et issue
+              ('termine', 'perdu' ou 'abandonne')
+    """
+    niveau, graine, max_images, decalage_max = tache
+    controleur = ControleurScripte(decalage_max, graine=graine)
+    jeu = Jeu(controleur=controleur, affichage_actif=False, verbeux=False, graine=graine)
+    if niveau != jeu.niveau:
+        jeu.niveau = niveau
+        jeu.charger_niveau(niveau)
+
+    briques = jeu.liste_briques
+    nb_briques = len(briques)
+    vies_initiales = int(briques.vies[:nb_briques].sum())
+    rebonds = 0
+
+    images = 0
+    while jeu.niveau == niveau and not jeu.partie_terminee and images < max_images:
+        if controleur.doit_lancer(jeu):
+            jeu.lancer_balles(30, 150)
+
+        # Vitesses verticales avant le pas, pour compter les rebonds
+        vitesses = {balle: balle.vy for balle in jeu.balles if not balle.sur_raquette}
+
+        jeu.mise_a_jour()
+        images += 1
+
+        # Rebond sur la raquette: une balle qui descendait remonte à hauteur de la raquette
+        haut_raquette = jeu.raquette.y - jeu.raquette.height / 2
+        for balle in jeu.balles:
+            if vitesses.get(balle, 0) > 0 and balle.vy < 0 and balle.y >= haut_raquette - balle.height:
+                rebonds += 1
+
+    if jeu.niveau != niveau:
+        issue = 'termine'
+    elif jeu.partie_terminee:
+        issue = 'perdu'
+    else:
+        issue = 'abandonne'
+
+    # Vies des briques retirées (la table du niveau est remplacée quand il est terminé)
+    vies_restantes = int(np.maximum(briques.vies[:nb_briques], 0).sum())
+    return {
+        'niveau': niveau,
+        'graine': graine,
+        'issue': issue,
+        'briques': nb_briques,
+        'images': images,
+        'coups_briques': vies_initiales - vies_restantes,
+        'rebonds_raquette': rebonds,
+        'vies_perdues': 3 - jeu.vies,
+        # Compteurs de la partie (qui ne joue que ce niveau): les bonus encore en chute
+        # à la fin du niveau ne sont pas comptés comme ramassés
+        'bonus_apparus': jeu.bonus_apparus,
+        'bonus_ramasses': jeu.bonus_ramasses,
+    }
+
+def _initialiser_processus():
+    """Initialise un processus de travail (sans son)."""
+    activer_sons(False)
+
+def analyser(nb_parties, niveaux=None, processus=None, max_images=MAX_IMAGES_PAR_NIVEAU,
+             decalage_max=DECALAGE_MAX_DEFAUT):
+    """
+    Joue nb_parties dispositions de chaque niveau, réparties sur un groupe de processus.
+
+    Args:
+        nb_parties (int): Nombre de dispositions (graines 0 à nb_parties - 1) par niveau
+        niveaux (list, optional): Niveaux analysés (tous par défaut)
+        processus (int, optional): Nombre de processus (par défaut, un par cœur). 0: sans processus.
+        max_images (int): Nombre maximal de pas par niveau
+        decalage_max (float): Imprécision de la raquette scriptée (plus grande: plus de vies perdues)
+
+    Returns:
+        list: Les résultats de chaque partie (voir jouer_niveau), triés par niveau et graine
+    """
+    niveaux = sorted(NIVEAUX) if niveaux is None else niveaux
+    taches = [(niveau, graine, max_images, decalage_max) for niveau in niveaux for graine in range(nb_parties)]
+    if processus == 0:
+        _initialiser_processus()
+        resultats = [jouer_niveau(tache) for tache in taches]
+    else:
+        with multiprocessing.Pool(processus, initializer=_initialiser_processus) as groupe:
+            # Des paquets de tâches limitent les échanges entre processus
+            taille_paquet = max(1, len(taches) // (4 * (processus or os.cpu_count() or 1)))
+            resultats = list(groupe.imap_unordered(jouer_niveau, taches, chunksize=taille_paquet))
+            # Arrêt normal des processus avant la sortie du bloc: SDL intercepte le SIGTERM
+            # envoyé par Pool.terminate et les processus ne s'arrêteraient jamais
+            groupe.close()
+            groupe.join()
+    resultats.sort(key=lambda resultat: (resultat['niveau'], resultat['graine']))
+    return resultats
+
+def synthese(resultats):
+    """
+    Réunit les résultats par niveau.
+
+    Args:
+        resultats (list): Résultats renvoyés par analyser
+
+    Returns:
+        dict: {niveau: statistiques} - nombre de parties, part des niveaux terminés, perdus et
+              abandonnés, durée médiane et p90 (en secondes de jeu) des niveaux terminés,
+              moyenne de chaque mesure
+    """
+    par_niveau = {}
+    for resultat in resultats:
+        par_niveau.setdefault(resultat['niveau'], []).append(resultat)
+
+    rapport = {}
+    for niveau, parties in sorted(par_niveau.items()):
+        termines = [partie['images'] * PAS_SIMULATION for partie in parties if partie['issue'] == 'termine']
+        statistiques = {
+            'parties': len(parties),
+            **{f'part_{issue}': sum(partie['issue'] == issue for partie in parties) / len(parties)
+               for issue in ('termine', 'perdu', 'abandonne')},
+            'duree_mediane_s': float(np.median(termines)) if termines else None,
+            'duree_p90_s': float(np.percentile(termines, 90)) if termines else None,
+        }
+        for mesure in MESURES:
+            statistiques[f'{mesure}_moyenne'] = float(np.mean([partie[mesure] for partie in parties]))
+        rapport[niveau] = statistiques
+    return rapport
+
+def exporter(rapport, chemin):
+    """
+    Écrit la synthèse dans un fichier CSV ou JSON (selon l'extension).
+
+    Args:
+        rapport (dict): Synthèse renvoyée par synthese
+        chemin (str): Fichier de destination (.csv ou .json)
+    """
+    with open(chemin, 'w', newline='', encoding='utf-8') as fichier:
+        if chemin.endswith('.json'):
+            json.dump(rapport, fichier, indent=2)
+        else:
+            colonnes = list(next(iter(rapport.values())))
+            ecrivain = csv.writer(fichier)
+            ecrivain.writerow(['niveau'] + colonnes)
+            for niveau, statistiques in rapport.items():
+                ecrivain.writerow([niveau] + [statistiques[colonne] for colonne in colonnes])
+
+def afficher(rapport):
+    """Affiche la synthèse sous forme de tableau."""
+    print(f"{'niveau':>6}{'terminés':>10}{'perdus':>8}{'durée méd.':>12}{'p90':>8}{'briques':>9}"
+          f"{'coups':>8}{'rebonds':>9}{'vies':>7}{'bonus':>7}{'ramassés':>10}")
+    for niveau, s in rapport.items():
+        duree = f"{s['duree_mediane_s']:.1f} s" if s['duree_mediane_s'] is not None else '-'
+        p90 = f"{s['duree_p90_s']:.1f} s" if s['duree_p90_s'] is not None else '-'
+        print(f"{niveau:>6}{s['part_termine']:>10.1%}{s['part_perdu']:>8.1%}{duree:>12}{p90:>8}"
+              f"{s['briques_moyenne']:>9.1f}{s['coups_briques_moyenne']:>8.1f}{s['rebonds_raquette_moyenne']:>9.1f}"
+              f"{s['vies_perdues_moyenne']:>7.2f}{s['bonus_apparus_moyenne']:>7.2f}{s['bonus_ramasses_moyenne']:>10.2f}")
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Analyse Monte-Carlo de la difficulté des niveaux")
+    parser.add_argument('--parties', type=int, default=NB_PARTIES_DEFAUT,
+                        help=f"dispositions jouées par niveau (défaut {NB_PARTIES_DEFAUT})")
+    parser.add_argument('--niveaux', type=int, nargs='+', help="niveaux analysés (tous par défaut)")
+    parser.add_argument('--processus', type=int, help="nombre de processus (défaut: un par cœur, 0: aucun)")
+    parser.add_argument('--max-images', type=int, default=MAX_IMAGES_PAR_NIVEAU,
+                        help="nombre maximal de pas avant d'abandonner un niveau")
+    parser.add_argument('--decalage-max', type=float, default=DECALAGE_MAX_DEFAUT,
+                        help=f"imprécision de la raquette scriptée en pixels (défaut {DECALAGE_MAX_DEFAUT})")
+    parser.add_argument('--sortie', metavar='FICHIER', help="écrire la synthèse par niveau (.csv ou .json)")
+    options = parser.parse_args()
+
+    debut = time.perf_counter()
+    resultats = analyser(options.parties, options.niveaux, options.processus, options.max_images,
+                          options.decalage_max)
+    duree = time.perf_counter() - debut
+    print(f"{len(resultats)} parties en {duree:.1f} s ({len(resultats) / duree:.1f} parties/s)")
+
+    rapport = synthese(resultats)
+    afficher(rapport)
+    if options.sortie:
+        exporter(rapport, options.sortie)
+        print(f"Synthèse enregistrée dans {options.sortie}")
+
+if __name__ == '__main__':
+    main()
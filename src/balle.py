@@ -2,13 +2,54 @@
 Module pour la classe Balle
 """
 import math
+import random
 import pygame
-from src.constantes import screen, XMAX, XMIN, YMAX, YMIN
-from src.sprites import sprite_images
+from src.constantes import XMAX, XMIN, YMAX, YMIN
+from src.moteur import ecran
+from src.sprites import sprite_images, taille_sprite
 from src.sons import jouer_son_rebond
+from src.collisions import temps_impact
+from src.gestion_affichage import position_interpolee, rectangle_objet
+from src.magasin_balles import MagasinBalles, X, Y, VX, VY, VITESSE, X_PREC, Y_PREC
+
+# Nombre maximal de contacts résolus pendant une image pour une balle
+MAX_CONTACTS_PAR_IMAGE = 4
+
+# Marqueur utilisé pour les contacts avec les bords de l'écran
+MUR = object()
+
+def _colonne(colonne):
+    """
+    Crée une propriété qui lit et écrit une colonne de la ligne de la balle dans son magasin.
+    
+    Args:
+        colonne (int): Indice de la colonne dans MagasinBalles.donnees
+    
+    Returns:
+        property: La propriété correspondante
+    """
+    def lire(self):
+        return float(self._magasin.donnees[self._indice, colonne])
+    
+    def ecrire(self, valeur):
+        self._magasin.donnees[self._indice, colonne] = valeur
+    
+    return property(lire, ecrire)
 
 class Balle:
-    """Classe représentant la balle du jeu."""
+    """
+    Classe représentant la balle du jeu.
+    
+    Les données de la balle (position, vitesse, état) sont rangées dans une ligne d'un
+    MagasinBalles: la balle n'en est qu'une vue. Une balle créée seule possède son propre
+    magasin d'une ligne, et rejoint celui de la partie quand elle est ajoutée à la liste des balles.
+    """
+    
+    x = _colonne(X)
+    y = _colonne(Y)
+    vx = _colonne(VX)
+    vy = _colonne(VY)
+    vitesse = _colonne(VITESSE)
     
     def __init__(self, x=None, y=None, vx=None, vy=None):
         """
@@ -20,24 +61,62 @@ class Balle:
             vx (float, optional): Vitesse x initiale. Si None, la balle est sur la raquette.
             vy (float, optional): Vitesse y initiale. Si None, la balle est sur la raquette.
         """
+        # Ligne de données dans un magasin propre à la balle
+        self._magasin = MagasinBalles(capacite=1)
+        self._indice = 0
+        self._magasin.vues.append(self)
+        
         self.x = x if x is not None else 400
         self.y = y if y is not None else 400
-        self.vx = vx
-        self.vy = vy
         self.vitesse = 3
         self.sur_raquette = vx is None or vy is None  # Si pas de vitesse spécifiée, la balle est sur la raquette
-        self.sprite = sprite_images['balle']
         
-        # Définir la taille exacte en fonction du sprite
-        self.width, self.height = self.sprite.get_size()
+        # Définir la taille exacte en fonction du sprite (sans le charger: voir la propriété sprite)
+        self.width, self.height = taille_sprite('balle')
         self.rayon = self.width / 2  # Pour les calculs de collision circulaire
         
         # Initialiser la vitesse avec un angle par défaut si la balle n'est pas sur la raquette
         if not self.sur_raquette:
+            self.vx = vx
+            self.vy = vy
             self.vitesse = math.sqrt(vx**2 + vy**2)  # Garder la même norme de vitesse
         else:
             self.vitesse_par_angle(60)
 
+    @property
+    def sprite(self):
+        """Surface: Image de la balle, chargée au premier affichage (pas de fenêtre sans affichage)."""
+        return sprite_images['balle']
+    
+    @property
+    def sur_raquette(self):
+        """bool: True si la balle est posée sur la raquette."""
+        return bool(self._magasin.sur_raquette[self._indice])
+    
+    @sur_raquette.setter
+    def sur_raquette(self, valeur):
+        self._magasin.sur_raquette[self._indice] = valeur
+    
+    @property
+    def x_prec(self):
+        """float: Abscisse au pas de simulation précédent, ou None si inconnue."""
+        valeur = self._magasin.donnees[self._indice, X_PREC]
+        return None if math.isnan(valeur) else float(valeur)
+    
+    @x_prec.setter
+    def x_prec(self, valeur):
+        self._magasin.donnees[self._indice, X_PREC] = math.nan if valeur is None else valeur
+    
+    @property
+    def y_prec(self):
+        """float: Ordonnée au pas de simulation précédent, ou None si inconnue."""
+        valeur = self._magasin.donnees[self._indice, Y_PREC]
+        return None if math.isnan(valeur) else float(valeur)
+    
+    @y_prec.setter
+    def y_prec(self, valeur):
+        self._magasin.donnees[self._indice, Y_PREC] = math.nan if valeur is None else valeur
+
     def vitesse_par_angle(self, angle):
         """
         Définit la vitesse de la balle en fonction d'un angle.
@@ -48,9 +127,19 @@ class Balle:
         self.vx = self.vitesse * math.cos(math.radians(angle))
         self.vy = -self.vitesse * math.sin(math.radians(angle))
 
-    def afficher(self):
-        """Affiche la balle à sa position actuelle."""
-        screen.blit(self.sprite, (self.x - self.width/2, self.y - self.height/2))
+    def afficher(self, alpha=1.0):
+        """
+        Affiche la balle à sa position interpolée.
+        
+        Args:
+            alpha (float): Fraction écoulée du pas de simulation en cours
+        
+        Returns:
+            Rect: Zone de l'écran occupée par la balle
+        """
+        x, y = position_interpolee(self, alpha)
+        ecran().blit(self.sprite, (x - self.width/2, y - self.height/2))
+        return rectangle_objet(self, x, y)
 
     def rebond_raquette(self, raquette):
         """
@@ -73,49 +162,136 @@ class Balle:
         # Jouer le son de rebond
         jouer_son_rebond()
 
-    def deplacer(self, raquette):
+    def poser_sur_raquette(self, raquette):
         """
-        Déplace la balle et gère les rebonds sur les murs et la raquette.
+        Place la balle au centre de la raquette, juste au-dessus.
         
         Args:
             raquette (Raquette): La raquette du joueur
+        """
+        self.y = raquette.y - self.height/2 - raquette.height/2
+        self.x = raquette.x
+
+    def deplacer(self, raquette, grille=None, impacts=None, rng=random):
+        """
+        Déplace la balle et gère les rebonds sur les murs, la raquette et les briques.
+        
+        Le déplacement de l'image est balayé en continu: on cherche le premier contact
+        le long du segment parcouru (murs, raquette, briques), on le résout, puis on
+        poursuit avec le reste du déplacement. La balle ne peut donc ni traverser une
+        brique à grande vitesse, ni rebondir deux fois sur la même image.
+        
+        Args:
+            raquette (Raquette): La raquette du joueur
+            grille (GrilleSpatiale, optional): Grille des briques à tester. Si None, les briques sont ignorées.
+            impacts (list, optional): Liste où ajouter (brique, bonus_genere, x, y) pour chaque brique touchée
+            rng (random.Random, optional): Générateur aléatoire des tirages de bonus
         Returns:
             bool: True si la balle est perdue, False sinon
         """
         perdue = False
         
         if self.sur_raquette:
-            # On met la balle sur la raquette
-            self.y = raquette.y - self.height/2 - raquette.height/2
-            self.x = raquette.x
-        else:
-            # Déplacement de la balle
-            self.x += self.vx
-            self.y += self.vy
+            self.poser_sur_raquette(raquette)
+            return perdue
+        
+        demi_largeur = self.width / 2
+        demi_hauteur = self.height / 2
+        restant = 1.0  # Fraction du déplacement de l'image qu'il reste à parcourir
+        
+        # Copie locale des données de la balle (lues et écrites une seule fois dans le magasin)
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        
+        for _ in range(MAX_CONTACTS_PAR_IMAGE):
+            dx = vx * restant
+            dy = vy * restant
+            
+            # Recherche du premier contact: (instant, normale x, normale y, objet touché)
+            premier = None
             
-            # Gestion des collisions
-            # Avec la raquette
-            if raquette.collision_balle(self) and self.vy > 0:  # Collision et balle descendante
-                self.rebond_raquette(raquette)
-                
             # Avec les bords de l'écran
-            if self.x + self.width/2 > XMAX:
-                self.vx = -self.vx
-                self.x = XMAX - self.width/2  # Éviter que la balle sorte de l'écran
-                jouer_son_rebond()  # Jouer le son de rebond
+            if dx > 0:
+                premier = _plus_tot(premier, (XMAX - demi_largeur - x) / dx, -1, 0, MUR)
+            elif dx < 0:
+                premier = _plus_tot(premier, (XMIN + demi_largeur - x) / dx, 1, 0, MUR)
+            if dy < 0:
+                premier = _plus_tot(premier, (YMIN + demi_hauteur - y) / dy, 0, 1, MUR)
+            
+            # Avec la raquette (seulement si la balle descend)
+            if dy > 0:
+                contact = temps_impact(x, y, dx, dy, demi_largeur, demi_hauteur,
+                                       raquette.x, raquette.y, raquette.width/2, raquette.height/2)
+                if contact:
+                    premier = _plus_tot(premier, *contact, raquette)
             
-            if self.x - self.width/2 < XMIN:
-                self.vx = -self.vx
-                self.x = XMIN + self.width/2  # Éviter que la balle sorte de l'écran
-                jouer_son_rebond()  # Jouer le son de rebond
+            # Avec les briques proches du segment parcouru
+            if grille is not None:
+                candidates = grille.briques_proches(
+                    min(x, x + dx) - demi_largeur, min(y, y + dy) - demi_hauteur,
+                    max(x, x + dx) + demi_largeur, max(y, y + dy) + demi_hauteur)
+                for brique in candidates:
+                    if brique.en_vie():
+                        contact = temps_impact(x, y, dx, dy, demi_largeur, demi_hauteur,
+                                               brique.x, brique.y, brique.width/2, brique.height/2)
+                        if contact:
+                            premier = _plus_tot(premier, *contact, brique)
             
-            if self.y + self.height/2 > YMAX:
-                self.sur_raquette = True
-                perdue = True  # Indique que la balle est perdue
+            if premier is None:
+                # Aucun contact: on parcourt tout le reste du déplacement
+                x += dx
+                y += dy
+                break
+            
+            # Avancer jusqu'au point de contact
+            t, nx, ny, cible = premier
+            x += dx * t
+            y += dy * t
+            restant *= 1 - t
+            
+            # Résoudre le contact
+            if cible is raquette:
+                self.x, self.y = x, y
+                self.rebond_raquette(raquette)
+                vx, vy = self.vx, self.vy
+            else:
+                if nx:
+                    vx = -vx
+                if ny:
+                    vy = -vy
+                if cible is MUR:
+                    jouer_son_rebond()  # Jouer le son de rebond
+                else:
+                    bonus_genere = cible.encaisser_coup(rng)
+                    if impacts is not None:
+                        impacts.append((cible, bonus_genere, cible.x, cible.y))
             
-            if self.y - self.height/2 < YMIN:
-                self.vy = -self.vy
-                self.y = YMIN + self.height/2  # Éviter que la balle sorte de l'écran
-                jouer_son_rebond()  # Jouer le son de rebond
+            if restant <= 0:
+                break
+        
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+        
+        # Sortie par le bas de l'écran
+        if y + demi_hauteur > YMAX:
+            self.sur_raquette = True
+            perdue = True  # Indique que la balle est perdue
                 
-        return perdue 
\ No newline at end of file
+        return perdue
+
+def _plus_tot(premier, t, nx, ny, cible):
+    """
+    Renvoie le contact le plus précoce entre le contact courant et un nouveau contact.
+    
+    Args:
+        premier (tuple): Contact courant (t, nx, ny, cible) ou None
+        t (float): Instant du nouveau contact
+        nx, ny (int): Normale de la face touchée
+        cible: Objet touché
+    
+    Returns:
+        tuple: Le contact retenu, ou None
+    """
+    # Un contact légèrement négatif correspond à une balle déjà contre le mur
+    t = max(t, 0.0)
+    if t > 1 or (premier is not None and premier[0] <= t):
+        return premier
+    return t, nx, ny, cible
@@ -3,30 +3,38 @@ Module pour la gestion des bonus du jeu
 """
 import random
 import pygame
-from src.constantes import screen, YMAX
-from src.sprites import TYPES_BONUS, sprite_images
+from src.constantes import YMAX
+from src.moteur import ecran
+from src.sprites import TYPES_BONUS, sprite_images, taille_sprite
 from src.balle import Balle
+from src.gestion_affichage import position_interpolee, rectangle_objet
 
 class Bonus:
     """Classe représentant un bonus qui tombe d'une brique détruite."""
     
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=random):
         """
         Initialise un nouveau bonus à la position spécifiée.
         
         Args:
             x (int): Position x initiale
             y (int): Position y initiale
+            rng (random.Random, optional): Générateur aléatoire du type et des effets du bonus
         """
         # Choisir un type de bonus au hasard
-        self.type = random.choice(list(TYPES_BONUS.keys()))
-        self.sprite = sprite_images[self.type]
-        self.width, self.height = self.sprite.get_size()
+        self.rng = rng
+        self.type = rng.choice(list(TYPES_BONUS.keys()))
+        self.width, self.height = taille_sprite(self.type)
         self.x = x
         self.y = y
-        self.vitesse = 1  # Vitesse de chute
+        self.vitesse = 1  # Vitesse de chute (pixels par pas de simulation)
         self.actif = True  # Le bonus est actif tant qu'il n'est pas ramassé ou perdu
         
+    @property
+    def sprite(self):
+        """Surface: Image du bonus, chargée au premier affichage (pas de fenêtre sans affichage)."""
+        return sprite_images[self.type]
+    
     def deplacer(self):
         """Fait tomber le bonus vers le bas de l'écran."""
         self.y += self.vitesse
@@ -48,10 +56,20 @@ class Bonus:
         vertical = abs(self.y - raquette.y) < (self.height/2 + raquette.height/2)
         return horizontal and vertical
             
-    def afficher(self):
-        """Affiche le bonus à sa position actuelle."""
+    def afficher(self, alpha=1.0):
+        """
+        Affiche le bonus à sa position interpolée.
+        
+        Args:
+            alpha (float): Fraction écoulée du pas de simulation en cours
+        
+        Returns:
+            Rect: Zone de l'écran occupée par le bonus
+        """
+        x, y = position_interpolee(self, alpha)
         if self.actif:
-            screen.blit(self.sprite, (self.x - self.width/2, self.y - self.height/2))
+            ecran().blit(self.sprite, (x - self.width/2, y - self.height/2))
+        return rectangle_objet(self, x, y)
 
     def appliquer(self, vies, balles, raquette):
         """
@@ -73,7 +91,7 @@ class Bonus:
             else:
                 # Sinon, ajouter une nouvelle balle déjà en mouvement
                 nouvelle_balle = Balle(raquette.x, raquette.y - raquette.height, 
-                                    random.uniform(-1, 1) * 2, -2)
+                                    self.rng.uniform(-1, 1) * 2, -2)
                 nouvelle_balle.sur_raquette = False
             balles.append(nouvelle_balle)
             
@@ -83,8 +101,8 @@ class Bonus:
             for balle in balles:
                 if not balle.sur_raquette:
                     # Créer une balle similaire mais avec un angle légèrement différent
-                    vx = balle.vx * 0.9 + random.uniform(-0.5, 0.5)
-                    vy = balle.vy * 0.9 + random.uniform(-0.5, 0.5)
+                    vx = balle.vx * 0.9 + self.rng.uniform(-0.5, 0.5)
+                    vy = balle.vy * 0.9 + self.rng.uniform(-0.5, 0.5)
                     nouvelle_balle = Balle(balle.x, balle.y, vx, vy)
                     nouvelle_balle.sur_raquette = False
                     nouvelles_balles.append(nouvelle_balle)
@@ -2,7 +2,8 @@
 Module pour gérer les boutons d'interface utilisateur
 """
 import pygame
-from src.constantes import screen, BOUTON_PIXEL_PERFECT
+from src.constantes import BOUTON_PIXEL_PERFECT
+from src.moteur import ecran
 from src.ecrans import render_pixel_text
 
 class Bouton:
@@ -30,16 +31,26 @@ class Bouton:
         self.texte = texte
         self.police = police
         self.est_survole = False
+        self.surfaces = None  # Bouton pré-rendu à l'état normal et survolé (au premier affichage)
     
-    def dessiner(self):
-        """Dessine le bouton sur l'écran"""
-        couleur = self.couleur_survol if self.est_survole else self.couleur
+    def composer(self, couleur):
+        """
+        Rend le bouton complet (fond, bordure et texte) dans une surface transparente.
+        
+        Args:
+            couleur (tuple): Couleur RGB du fond du bouton
+        
+        Returns:
+            Surface: Le bouton, de la taille de self.rect
+        """
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        rect = surface.get_rect()
         
         # Dessiner le fond du bouton
-        pygame.draw.rect(screen, couleur, self.rect, border_radius=8)
+        pygame.draw.rect(surface, couleur, rect, border_radius=8)
         
         # Dessiner la bordure
-        pygame.draw.rect(screen, self.couleur_bordure, self.rect, width=2, border_radius=8)
+        pygame.draw.rect(surface, self.couleur_bordure, rect, width=2, border_radius=8)
         
         # Dessiner le texte avec le mode pixel perfect si activé
         if BOUTON_PIXEL_PERFECT:
@@ -47,8 +58,16 @@ class Bouton:
         else:
             texte_surface = self.police.render(self.texte, True, (255, 255, 255))
             
-        texte_rect = texte_surface.get_rect(center=self.rect.center)
-        screen.blit(texte_surface, texte_rect)
+        # Le texte est centré comme il le serait sur l'écran (centre de self.rect)
+        texte_rect = texte_surface.get_rect(center=self.rect.center).move(-self.rect.x, -self.rect.y)
+        surface.blit(texte_surface, texte_rect)
+        return surface
+    
+    def dessiner(self):
+        """Dessine le bouton sur l'écran (un seul blit de la surface pré-rendue)"""
+        if self.surfaces is None:
+            self.surfaces = {False: self.composer(self.couleur), True: self.composer(self.couleur_survol)}
+        ecran().blit(self.surfaces[self.est_survole], self.rect)
     
     def verifier_survol(self, pos_souris):
         """Vérifie si la souris survole le bouton
@@ -3,12 +3,40 @@ Module pour la classe Brique
 """
 import random
 import pygame
-from src.constantes import screen
-from src.sprites import TYPES_BRIQUES, sprite_images
+from src.moteur import ecran
+from src.sprites import TYPES_BRIQUES, SPRITES_BRIQUES
 from src.sons import jouer_son_explosion, jouer_son_rebond
+from src.table_briques import TableBriques, X, Y
+
+def _colonne(colonne):
+    """
+    Crée une propriété qui lit et écrit une colonne de la ligne de la brique dans sa table.
+    
+    Args:
+        colonne (int): Indice de la colonne dans TableBriques.donnees
+    
+    Returns:
+        property: La propriété correspondante
+    """
+    def lire(self):
+        return float(self._table.donnees[self._indice, colonne])
+    
+    def ecrire(self, valeur):
+        self._table.donnees[self._indice, colonne] = valeur
+    
+    return property(lire, ecrire)
 
 class Brique:
-    """Classe représentant une brique destructible."""
+    """
+    Classe représentant une brique destructible.
+    
+    La position et la vie sont stockées dans une TableBriques: la brique n'est qu'une vue
+    sur une ligne de la table (sa propre table d'une ligne tant qu'elle n'est pas rangée
+    dans celle du niveau).
+    """
+    
+    x = _colonne(X)  # abscisse du centre de la brique
+    y = _colonne(Y)  # ordonnée du centre de la brique
     
     def __init__(self, x, y, type_brique='standard', couleur=None):
         """
@@ -20,16 +48,17 @@ class Brique:
             type_brique (str): Type de brique ('standard', 'moyenne', 'petite')
             couleur (str, optional): Couleur de la brique. Si None, une couleur aléatoire est choisie.
         """
-        self.x = x  # abscisse du centre de la brique
-        self.y = y  # ordonnée du centre de la brique
         self.type_brique = type_brique
         
         # Récupérer les propriétés du type de brique
         self.largeur, self.hauteur, self.vie_max, _ = TYPES_BRIQUES[type_brique]
-        self.vie = self.vie_max  # Chaque brique commence avec son nombre maximal de vies
         
         # Si aucune couleur n'est spécifiée, en choisir une aléatoirement
         self.couleur = couleur #si couleur else random.choice(COULEURS_DISPONIBLES)
+
+        
+        # Chaque brique commence avec son nombre maximal de vies
+        TableBriques(capacite=1).ajouter_ligne(self, x, y, self.largeur, self.hauteur, self.vie_max)
         
         # Dimensions de la brique
         self.width = self.largeur
@@ -38,6 +67,29 @@ class Brique:
         # Probabilité de générer un bonus quand la brique est détruite (en pourcentage)
         self.chance_bonus = 20  # 20% de chance
 
+    @property
+    def vie(self):
+        """Nombre de vies restantes de la brique."""
+        return int(self._table.vies[self._indice])
+    
+    @vie.setter
+    def vie(self, valeur):
+        self._table.modifier_vie(self._indice, valeur)
+
+    @property
+    def sprites_vie(self):
+        """tuple: Sprite de chaque niveau de vie (l'indice 0 vaut None), chargés au premier affichage."""
+        return SPRITES_BRIQUES[(self.type_brique, self.couleur)]
+
+    @property
+    def sprite(self):
+        """Surface: Sprite de la vie actuelle (le plus solide au-delà de vie_max), ou None si détruite."""
+        vie = self.vie
+        if vie <= 0:
+            return None
+        sprites_vie = self.sprites_vie
+        return sprites_vie[min(vie, len(sprites_vie) - 1)]
+
     def en_vie(self):
         """
         Vérifie si la brique est encore en vie.
@@ -45,24 +97,49 @@ class Brique:
         Returns:
             bool: True si la brique a encore de la vie, False sinon
         """
-        return self.vie > 0
+        return self._table.vies[self._indice] > 0
+
+    def afficher(self, surface=None):
+        """
+        Affiche la brique avec le sprite correspondant au niveau de vie actuel.
+        
+        Args:
+            surface (Surface, optional): Surface de destination. Si None, l'écran.
+        """
+        if surface is None:
+            surface = ecran()
+        # Aucun sprite si la brique est détruite
+        if self.sprite is not None:
+            surface.blit(self.sprite, (self.x - self.width/2, self.y - self.height/2))
 
-    def afficher(self):
-        """Affiche la brique avec le sprite correspondant au niveau de vie actuel."""
-        if self.en_vie():
-            # Sélectionne le sprite selon le type, le niveau de vie et la couleur
-            sprite_name = f'brique{self.type_brique}_{self.vie}_{self.couleur}'
-            if sprite_name in sprite_images:
-                sprite = sprite_images[sprite_name]
-                screen.blit(sprite, (self.x - self.width/2, self.y - self.height/2))
+    def encaisser_coup(self, rng=random):
+        """
+        Réduit la vie de la brique après un impact de balle.
+        
+        Args:
+            rng (random.Random, optional): Générateur aléatoire du tirage du bonus
+        
+        Returns:
+            bool: True si la brique est détruite et génère un bonus, False sinon
+        """
+        vie_avant = self.vie
+        self.vie -= 1
+        
+        # Vérifier si la brique est détruite et jouer le son d'explosion
+        if vie_avant > 0 and self.vie <= 0:
+            jouer_son_explosion()
+        
+        # Vérifier si la brique est détruite et déterminer si un bonus est généré
+        return not self.en_vie() and rng.randint(1, 100) <= self.chance_bonus
 
-    def collision_balle(self, balle):
+    def collision_balle(self, balle, rng=random):
         """
         Vérifie et gère la collision avec une balle.
         Si collision, fait rebondir la balle et réduit la vie de la brique.
         
         Args:
             balle (Balle): La balle à tester
+            rng (random.Random, optional): Générateur aléatoire du tirage du bonus
             
         Returns:
             tuple: (bool, bool, int, int) - collision, bonus généré, position x du bonus, position y du bonus
@@ -92,18 +169,8 @@ class Brique:
                 # Rebond vertical
                 balle.vy = -balle.vy
             
-            # Réduire la vie de la brique
-            vie_avant = self.vie
-            self.vie -= 1
-            
-            # Vérifier si la brique est détruite et jouer le son d'explosion
-            if vie_avant > 0 and self.vie <= 0:
-                jouer_son_explosion()
-            
-            # Vérifier si la brique est détruite et déterminer si un bonus est généré
-            bonus_genere = False
-            if not self.en_vie() and random.randint(1, 100) <= self.chance_bonus:
-                bonus_genere = True
+            # Réduire la vie de la brique et tirer un éventuel bonus
+            bonus_genere = self.encaisser_coup(rng)
             
             return True, bonus_genere, self.x, self.y
         
@@ -0,0 +1,257 @@
+"""
+Module de mesure du temps passé dans chaque phase d'une image (boucle principale et mise à jour du jeu)
+"""
+import csv
+import json
+import time
+
+import numpy as np
+import pygame
+
+# Phases mesurées, dans l'ordre où elles se succèdent pendant une image
+PHASES = (
+    'evenements',    # Jeu.gestion_evenements
+    'deplacement',   # Raquette, balles et collisions (Jeu.mise_a_jour)
+    'briques',       # Briques touchées et balles perdues (Jeu.mise_a_jour)
+    'bonus',         # Déplacement et ramassage des bonus (Jeu.mise_a_jour)
+    'victoire',      # Fin de niveau et chargement du suivant (Jeu.mise_a_jour)
+    'avancer',       # Reste de Jeu.avancer (accumulateur, pause)
+    'affichage',     # Jeu.affichage
+    'presentation',  # pygame.display.flip ou update
+    'attente',       # clock.tick
+)
+INDICES_PHASES = {phase: i for i, phase in enumerate(PHASES)}
+
+# Regroupement des phases pour le graphique: (phases, couleur)
+GROUPES_GRAPHIQUE = (
+    (('evenements', 'deplacement', 'briques', 'bonus', 'victoire', 'avancer'), (80, 200, 120)),
+    (('affichage', 'presentation'), (90, 150, 240)),
+    (('attente',), (70, 70, 70)),
+)
+
+CAPACITE_DEFAUT = 4096  # Nombre d'images gardées dans le tampon circulaire
+LARGEUR_GRAPHIQUE = 120  # Une colonne par image
+HAUTEUR_GRAPHIQUE = 32
+ECHELLE_GRAPHIQUE_NS = 33_333_333  # Durée représentée par toute la hauteur du graphique (2 images à 60 FPS)
+BUDGET_IMAGE_NS = 16_666_667  # Durée d'une image à 60 FPS (ligne repère)
+
+# Histogrammes des images sorties du tampon: classes logarithmiques de DUREE_MIN_NS à 100 s,
+# CLASSES_PAR_DECADE par puissance de 10 (percentiles exacts à environ 1 % près)
+DUREE_MIN_NS = 100
+CLASSES_PAR_DECADE = 200
+NB_CLASSES = 9 * CLASSES_PAR_DECADE + 1  # La classe 0 regroupe les durées inférieures à DUREE_MIN_NS
+
+class Chronometre:
+    """
+    Enregistre la durée de chaque phase de chaque image dans un tampon circulaire.
+
+    Chaque appel à marquer(phase) attribue à la phase le temps écoulé depuis la marque
+    précédente: les phases se suivent sans chevauchement et leur somme est la durée de l'image.
+    Une phase peut être marquée plusieurs fois dans une image (plusieurs pas de simulation),
+    ses durées s'additionnent. Quand le tampon est plein, ses images sont versées dans un
+    histogramme par niveau avant d'être écrasées: la mémoire ne dépend pas de la durée de la session.
+    """
+
+    def __init__(self, capacite=CAPACITE_DEFAUT):
+        """
+        Initialise un chronomètre vide.
+
+        Args:
+            capacite (int): Nombre d'images gardées dans le tampon circulaire
+        """
+        self.capacite = capacite
+        self.durees = np.zeros((capacite, len(PHASES)), dtype=np.int64)
+        self.niveaux = np.zeros(capacite, dtype=np.int32)
+        self.image = 0  # Nombre d'images terminées
+        self.image_courante = [0] * len(PHASES)  # Durées (ns) de l'image en cours
+        self.derniere_marque = time.perf_counter_ns()
+
+        # Images sorties du tampon circulaire, gardées pour les statistiques par niveau:
+        # {niveau: tableau (phases + image complète, classes) du nombre d'images par classe}
+        self.histogrammes = {}
+        self.images_archivees = 0
+
+        self.graphique_visible = False
+
+    def demarrer(self):
+        """Repart d'une image vide (après un temps qui ne doit pas être mesuré, comme un écran de menu)."""
+        self.image_courante = [0] * len(PHASES)
+        self.derniere_marque = time.perf_counter_ns()
+
+    def marquer(self, phase):
+        """
+        Attribue à une phase le temps écoulé depuis la marque précédente.
+
+        Args:
+            phase (str): Nom de la phase (voir PHASES)
+        """
+        maintenant = time.perf_counter_ns()
+        self.image_courante[INDICES_PHASES[phase]] += maintenant - self.derniere_marque
+        self.derniere_marque = maintenant
+
+    def fin_image(self, niveau):
+        """
+        Range les durées de l'image en cours dans le tampon circulaire.
+
+        Args:
+            niveau (int): Niveau joué pendant l'image
+        """
+        ligne = self.image % self.capacite
+        if ligne == 0 and self.image > 0:
+            # Le tampon est plein: verser ses images dans les histogrammes avant de l'écraser
+            ajouter_histogrammes(self.histogrammes, self.niveaux, self.durees)
+            self.images_archivees += self.capacite
+        self.durees[ligne] = self.image_courante
+        self.niveaux[ligne] = niveau
+        self.image_courante = [0] * len(PHASES)
+        self.image += 1
+
+    def dernieres_images(self, nombre):
+        """
+        Renvoie les durées des dernières images, de la plus ancienne à la plus récente.
+
+        Args:
+            nombre (int): Nombre maximal d'images
+
+        Returns:
+            ndarray: Tableau (images, phases) des durées en nanosecondes
+        """
+        nombre = min(nombre, self.image, self.capacite)
+        indices = np.arange(self.image - nombre, self.image) % self.capacite
+        return self.durees[indices]
+
+    # --- Statistiques ------------------------------------------------------------
+
+    def statistiques(self):
+        """
+        Calcule les percentiles des durées de chaque phase, niveau par niveau.
+
+        Les images encore dans le tampon sont ajoutées aux histogrammes des images archivées
+        (sans les modifier); les percentiles sont lus dans les histogrammes.
+
+        Returns:
+            dict: {niveau: {phase: {'images', 'p50', 'p95', 'p99'}}} en millisecondes,
+                  avec une phase supplémentaire 'image' pour la durée totale
+        """
+        histogrammes = {niveau: compte.copy() for niveau, compte in self.histogrammes.items()}
+        reste = self.image - self.images_archivees
+        ajouter_histogrammes(histogrammes, self.niveaux[:reste], self.durees[:reste])
+
+        statistiques = {}
+        for niveau in sorted(histogrammes):
+            statistiques[int(niveau)] = {
+                phase: {
+                    'images': int(compte.sum()),
+                    **{f'p{p}': percentile_histogramme(compte, p) / 1e6 for p in (50, 95, 99)},
+                }
+                for phase, compte in zip(PHASES + ('image',), histogrammes[niveau])
+            }
+        return statistiques
+
+    def exporter(self, chemin):
+        """
+        Écrit les percentiles par niveau dans un fichier CSV ou JSON (selon l'extension).
+
+        Args:
+            chemin (str): Fichier de destination (.csv ou .json)
+        """
+        statistiques = self.statistiques()
+        with open(chemin, 'w', newline='', encoding='utf-8') as fichier:
+            if chemin.endswith('.json'):
+                json.dump(statistiques, fichier, indent=2)
+            else:
+                ecrivain = csv.writer(fichier)
+                ecrivain.writerow(['niveau', 'phase', 'images', 'p50_ms', 'p95_ms', 'p99_ms'])
+                for niveau, phases in statistiques.items():
+                    for phase, valeurs in phases.items():
+                        ecrivain.writerow([niveau, phase, valeurs['images'],
+                                           f"{valeurs['p50']:.4f}", f"{valeurs['p95']:.4f}", f"{valeurs['p99']:.4f}"])
+
+    # --- Graphique à l'écran -------------------------------------------------------
+
+    def basculer_graphique(self):
+        """Affiche ou cache le graphique des durées d'image."""
+        self.graphique_visible = not self.graphique_visible
+
+    def afficher_graphique(self, surface, x=2, y=2):
+        """
+        Dessine les durées des dernières images: une colonne par image, empilant simulation,
+        rendu et attente, avec une ligne repère au budget d'une image à 60 FPS.
+
+        Args:
+            surface (Surface): Surface de destination
+            x, y (int): Coin supérieur gauche du graphique
+
+        Returns:
+            Rect: Zone occupée par le graphique
+        """
+        durees = self.dernieres_images(LARGEUR_GRAPHIQUE)
+        pixels = np.zeros((LARGEUR_GRAPHIQUE, HAUTEUR_GRAPHIQUE, 3), dtype=np.uint8)
+
+        # Hauteur cumulée (en pixels, depuis le bas) de chaque groupe de phases, pour chaque colonne
+        hauteurs = np.zeros(LARGEUR_GRAPHIQUE)
+        decalage = LARGEUR_GRAPHIQUE - len(durees)
+        lignes = np.arange(HAUTEUR_GRAPHIQUE)[::-1]  # Hauteur de chaque ligne de pixels depuis le bas
+        for phases, couleur in GROUPES_GRAPHIQUE:
+            colonnes = [INDICES_PHASES[phase] for phase in phases]
+            bas = hauteurs.copy()
+            hauteurs[decalage:] += durees[:, colonnes].sum(axis=1) * HAUTEUR_GRAPHIQUE / ECHELLE_GRAPHIQUE_NS
+            remplis = (lignes[None, :] >= bas[:, None]) & (lignes[None, :] < hauteurs[:, None])
+            pixels[remplis] = couleur
+
+        # Ligne repère du budget d'une image
+        ligne_budget = HAUTEUR_GRAPHIQUE - 1 - int(BUDGET_IMAGE_NS * HAUTEUR_GRAPHIQUE / ECHELLE_GRAPHIQUE_NS)
+        pixels[:, ligne_budget] = (230, 60, 60)
+
+        image = pygame.surfarray.make_surface(pixels)
+        return surface.blit(image, (x, y))
+
+def classes_durees(durees):
+    """
+    Renvoie la classe d'histogramme de chaque durée.
+
+    Args:
+        durees (ndarray): Durées en nanosecondes
+
+    Returns:
+        ndarray: Classes (entiers de 0 à NB_CLASSES - 1), de la forme de durees
+    """
+    with np.errstate(divide='ignore'):
+        classes = np.floor(np.log10(durees / DUREE_MIN_NS) * CLASSES_PAR_DECADE) + 1
+    return np.clip(classes, 0, NB_CLASSES - 1).astype(np.intp)
+
+def ajouter_histogrammes(histogrammes, niveaux, durees):
+    """
+    Ajoute des images aux histogrammes par niveau.
+
+    Args:
+        histogrammes (dict): {niveau: tableau (phases + image complète, NB_CLASSES)}, complété sur place
+        niveaux (ndarray): Niveau de chaque image
+        durees (ndarray): Tableau (images, phases) des durées en nanosecondes
+    """
+    colonnes = len(PHASES) + 1
+    decalages = np.arange(colonnes) * NB_CLASSES
+    for niveau in np.unique(niveaux):
+        durees_niveau = durees[niveaux == niveau]
+        valeurs = np.column_stack((durees_niveau, durees_niveau.sum(axis=1)))
+        compte = np.bincount((classes_durees(valeurs) + decalages).ravel(), minlength=colonnes * NB_CLASSES)
+        if niveau not in histogrammes:
+            histogrammes[niveau] = np.zeros((colonnes, NB_CLASSES), dtype=np.int64)
+        histogrammes[niveau] += compte.reshape(colonnes, NB_CLASSES)
+
+def percentile_histogramme(compte, p):
+    """
+    Lit un percentile dans un histogramme (centre géométrique de la classe qui le contient).
+
+    Args:
+        compte (ndarray): Nombre d'images par classe
+        p (float): Percentile (0 à 100)
+
+    Returns:
+        float: Durée en nanosecondes (0 pour la classe des durées inférieures à DUREE_MIN_NS)
+    """
+    cumul = np.cumsum(compte)
+    classe = int(np.searchsorted(cumul, p / 100 * cumul[-1]))
+    if classe == 0:
+        return 0.0
+    return DUREE_MIN_NS * 10 ** ((classe - 0.5) / CLASSES_PAR_DECADE)
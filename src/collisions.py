@@ -0,0 +1,77 @@
+"""
+Module contenant les calculs de collision continue (balayage) entre rectangles
+"""
+
+def temps_impact(x, y, dx, dy, demi_largeur, demi_hauteur,
+                 cible_x, cible_y, cible_demi_largeur, cible_demi_hauteur):
+    """
+    Calcule l'instant du premier contact entre un rectangle mobile et un rectangle fixe.
+
+    Le rectangle mobile (centre x, y) se déplace de (dx, dy) pendant l'intervalle [0, 1].
+    On teste le segment parcouru par son centre contre le rectangle fixe agrandi
+    des demi-dimensions du rectangle mobile (somme de Minkowski).
+
+    Args:
+        x, y (float): Centre du rectangle mobile au début du déplacement
+        dx, dy (float): Déplacement total sur l'intervalle
+        demi_largeur, demi_hauteur (float): Demi-dimensions du rectangle mobile
+        cible_x, cible_y (float): Centre du rectangle fixe
+        cible_demi_largeur, cible_demi_hauteur (float): Demi-dimensions du rectangle fixe
+
+    Returns:
+        tuple: (t, nx, ny) - instant du contact dans [0, 1] et normale de la face touchée,
+               ou None s'il n'y a pas de contact pendant le déplacement
+    """
+    ex = demi_largeur + cible_demi_largeur
+    ey = demi_hauteur + cible_demi_hauteur
+    rel_x = x - cible_x
+    rel_y = y - cible_y
+
+    # Les rectangles se chevauchent déjà: on sépare selon l'axe de moindre pénétration
+    if abs(rel_x) < ex and abs(rel_y) < ey:
+        penetration_x = ex - abs(rel_x)
+        penetration_y = ey - abs(rel_y)
+        if penetration_x < penetration_y:
+            nx, ny = (1 if rel_x >= 0 else -1), 0
+        else:
+            nx, ny = 0, (1 if rel_y >= 0 else -1)
+        # Pas de contact si le rectangle mobile s'éloigne déjà de la face
+        if dx * nx + dy * ny >= 0:
+            return None
+        return 0.0, nx, ny
+
+    # Intervalle d'entrée/sortie sur l'axe horizontal
+    if dx > 0:
+        entree_x = (-ex - rel_x) / dx
+        sortie_x = (ex - rel_x) / dx
+    elif dx < 0:
+        entree_x = (ex - rel_x) / dx
+        sortie_x = (-ex - rel_x) / dx
+    elif abs(rel_x) < ex:
+        entree_x, sortie_x = float('-inf'), float('inf')
+    else:
+        return None
+
+    # Intervalle d'entrée/sortie sur l'axe vertical
+    if dy > 0:
+        entree_y = (-ey - rel_y) / dy
+        sortie_y = (ey - rel_y) / dy
+    elif dy < 0:
+        entree_y = (ey - rel_y) / dy
+        sortie_y = (-ey - rel_y) / dy
+    elif abs(rel_y) < ey:
+        entree_y, sortie_y = float('-inf'), float('inf')
+    else:
+        return None
+
+    entree = max(entree_x, entree_y)
+    sortie = min(sortie_x, sortie_y)
+
+    # Pas de contact si les intervalles ne se recouvrent pas ou si le contact est hors du déplacement
+    if entree >= sortie or entree < 0 or entree > 1:
+        return None
+
+    # La face touchée est celle de l'axe qui entre en dernier
+    if entree_x > entree_y:
+        return entree, (-1 if dx > 0 else 1), 0
+    return entree, 0, (-1 if dy > 0 else 1)
@@ -1,17 +1,20 @@
 """
 Constantes pour le jeu Brick Breaker
 """
-import pygame
-
 # Dimensions de l'écran
 XMIN = 0
 YMIN = 0
 XMAX = 240
 YMAX = 160
 
-# Initialisation de l'écran
-pygame.init()
-screen = pygame.display.set_mode((XMAX, YMAX), pygame.SCALED)
+# Simulation à pas fixe, indépendante de la fréquence d'affichage
+FREQUENCE_SIMULATION = 60  # Pas de simulation par seconde
+PAS_SIMULATION = 1 / FREQUENCE_SIMULATION  # Durée d'un pas en secondes
+MAX_PAS_PAR_IMAGE = 5  # Rattrapage maximal par image affichée (évite la spirale de retard)
+
+# Rendu partiel: au-delà de cette part de l'écran à effacer, l'image est recomposée et présentée
+# en entier (une copie et un flip coûtent alors moins que de nombreuses petites zones)
+PART_MAX_RENDU_PARTIEL = 0.5
 
 # Configuration des polices pour les boutons
 BOUTON_POLICE_NOM = 'assets/font/font.ttf'
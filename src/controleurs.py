@@ -0,0 +1,380 @@
+"""
+Module contenant les contrôleurs de la raquette (souris, scripté ou automatique)
+"""
+import random
+import numpy as np
+import pygame
+from src.constantes import XMAX, XMIN, YMIN
+from src.magasin_balles import X as X_BALLE, Y as Y_BALLE, VX as VX_BALLE, VY as VY_BALLE
+
+MAX_SEGMENTS_PREDICTION = 12  # Rebonds suivis par le contrôleur automatique avant d'abandonner une trajectoire
+DECALAGE_RELATIF_MAX = 0.6     # Écart maximal balle / centre de la raquette (fraction de la zone de contact)
+
+def replier(x, gauche, droite):
+    """
+    Replie une abscisse dépliée (trajectoire qui traverse les murs) entre deux murs.
+
+    Args:
+        x (float): Abscisse atteinte sans tenir compte des murs
+        gauche (float): Mur de gauche
+        droite (float): Mur de droite
+
+    Returns:
+        tuple: (abscisse repliée, True si la balle repart dans l'autre sens)
+    """
+    largeur = droite - gauche
+    reste = (x - gauche) % (2 * largeur)
+    if reste > largeur:
+        return gauche + 2 * largeur - reste, True
+    return gauche + reste, False
+
+class ControleurSouris:
+    """Contrôleur qui place la raquette sous le curseur de la souris."""
+
+    def position_x(self, jeu):
+        """
+        Renvoie la position horizontale visée par le joueur.
+
+        Args:
+            jeu (Jeu): La partie en cours
+
+        Returns:
+            float: Abscisse visée par la raquette
+        """
+        return pygame.mouse.get_pos()[0]
+
+class ControleurScripte:
+    """Contrôleur automatique qui suit la balle la plus menaçante (pour les simulations sans fenêtre)."""
+
+    def __init__(self, decalage_max=12, graine=None):
+        """
+        Initialise le contrôleur.
+
+        Args:
+            decalage_max (float): Décalage horizontal maximal entre la balle et le centre de la raquette.
+                                  Un décalage est tiré tant qu'aucune balle ne descend, puis figé
+                                  pendant la descente, pour varier les angles de rebond.
+            graine (int, optional): Graine du tirage des décalages
+        """
+        self.decalage_max = decalage_max
+        self.rng = random.Random(graine)
+        self.decalage = 0
+
+    def position_x(self, jeu):
+        """
+        Renvoie l'abscisse de la balle en mouvement la plus basse, en priorité celles qui descendent.
+
+        Args:
+            jeu (Jeu): La partie en cours
+
+        Returns:
+            float: Abscisse visée par la raquette
+        """
+        cible = None
+        for balle in jeu.balles:
+            if balle.sur_raquette:
+                continue
+            # Clé de priorité: d'abord les balles qui descendent, puis les plus basses
+            priorite = (balle.vy > 0, balle.y)
+            if cible is None or priorite > cible[0]:
+                cible = (priorite, balle.x)
+
+        if cible is None:
+            return jeu.raquette.x
+
+        # Nouveau décalage tant que la balle visée remonte
+        if not cible[0][0]:
+            self.decalage = self.rng.uniform(-self.decalage_max, self.decalage_max)
+        return cible[1] + self.decalage
+
+    def doit_lancer(self, jeu):
+        """
+        Indique si les balles posées sur la raquette doivent être lancées.
+
+        Args:
+            jeu (Jeu): La partie en cours
+
+        Returns:
+            bool: True si toutes les balles sont sur la raquette
+        """
+        return all(balle.sur_raquette for balle in jeu.balles)
+
+class ControleurAutomatique:
+    """
+    Contrôleur qui prédit le point d'arrivée des balles sur la raquette et va l'intercepter.
+
+    La trajectoire d'une balle est suivie segment par segment: rebonds sur les murs (XMIN, XMAX,
+    YMIN) et sur les briques en vie, jusqu'à la hauteur de la raquette. Sous les briques, les
+    rebonds sur les murs sont dépliés (un seul segment jusqu'à la raquette ou aux briques); dans
+    leur zone, le rayon est testé contre toutes les briques à la fois (tableaux NumPy). Le coût
+    reste faible même avec beaucoup de balles:
+    - une balle à prédire ne reçoit d'abord qu'un minorant de son instant d'arrivée (distance
+      verticale à parcourir / |vy|, que les rebonds ne font qu'allonger); les balles sont
+      complétées une par une, du plus petit minorant au plus grand, tant qu'il précède la
+      meilleure arrivée connue;
+    - la prédiction d'une balle est gardée (instant d'arrivée en pas absolus) tant que sa vitesse
+      ne change pas: seules les balles qui viennent de rebondir sont recalculées;
+    - une trajectoire n'est suivie que tant qu'elle peut encore arriver la première; au-delà,
+      seul un minorant de son instant d'arrivée est gardé (complété si elle devient la plus urgente).
+    Tout est recalculé quand une brique est détruite ou qu'une balle est perdue ou lancée.
+
+    La raquette intercepte la balle qui arrivera la première, décalée pour la renvoyer vers la
+    brique en vie la plus proche que l'angle de rebond permet d'atteindre (directement ou par
+    un rebond sur un mur ou le plafond).
+    """
+
+    def __init__(self, max_segments=MAX_SEGMENTS_PREDICTION, decalage_relatif=DECALAGE_RELATIF_MAX):
+        """
+        Initialise le contrôleur.
+
+        Args:
+            max_segments (int): Nombre maximal de rebonds suivis par trajectoire
+            decalage_relatif (float): Écart maximal entre la balle et le centre de la raquette,
+                                      en fraction de la zone de contact (la balle doit rester sur la raquette)
+        """
+        self.max_segments = max_segments
+        self.decalage_relatif = decalage_relatif
+        self._pas = 0              # Nombre d'appels (un par pas de simulation)
+        self._cle = None           # Balles en jeu et briques en vie de la dernière prédiction complète
+        self._vitesses = None      # Vitesses des balles lors de leur dernière prédiction
+        self._briques = None       # Rectangles des briques en vie, agrandis de la demi-taille de la balle
+        self._bas_briques = None   # Bas du plus bas de ces rectangles
+        self._x_arrivee = None     # Abscisse d'arrivée de chaque balle (nan: inconnue)
+        self._arrivee = None       # Pas d'arrivée de chaque balle (inf: jamais ou inconnu)
+        self._incomplet = None     # Arrivée seulement minorée (trajectoire abandonnée en route)
+        self._cle_visee = None
+        self._x_visee = None
+
+    def position_x(self, jeu):
+        """
+        Renvoie l'abscisse qui intercepte la balle la plus urgente.
+
+        Args:
+            jeu (Jeu): La partie en cours
+
+        Returns:
+            float: Abscisse visée par la raquette
+        """
+        self._pas += 1
+        balles = jeu.balles
+        n = len(balles)
+        if n == 0:
+            return jeu.raquette.x
+
+        briques = jeu.liste_briques
+        vitesses = balles.donnees[:n, VX_BALLE:VY_BALLE + 1]
+        cle = (n, briques, briques.nb_en_vie, balles.sur_raquette[:n].tobytes())
+        if cle != self._cle:
+            self._cle = cle
+            self._preparer_briques(jeu)
+            self._x_arrivee = np.full(n, np.nan)
+            self._arrivee = np.full(n, np.inf)
+            self._incomplet = np.zeros(n, dtype=bool)
+            # Toujours de la forme des balles en jeu, même sans balle à prédire
+            self._vitesses = vitesses.copy()
+            a_predire = np.flatnonzero(~balles.sur_raquette[:n])
+        else:
+            a_predire = np.flatnonzero((vitesses != self._vitesses).any(axis=1))
+            if len(a_predire):
+                self._vitesses = vitesses.copy()
+        if len(a_predire):
+            self._minorer(jeu, a_predire)
+
+        # Balle la plus urgente (une arrivée seulement minorée est d'abord complétée)
+        arrivee = self._arrivee
+        while True:
+            arrivee[arrivee < self._pas] = np.inf  # Balles passées sous la raquette
+            indice = int(arrivee.argmin())
+            if arrivee[indice] == np.inf:
+                return jeu.raquette.x
+            if not self._incomplet[indice]:
+                break
+            self._predire(jeu, indice)
+
+        cle_visee = (indice, self._x_arrivee[indice], jeu.raquette.width, cle)
+        if cle_visee != self._cle_visee:
+            self._cle_visee = cle_visee
+            self._x_visee = self._viser(jeu, self._x_arrivee[indice])
+        return self._x_visee
+
+    def _preparer_briques(self, jeu):
+        """Range les rectangles des briques en vie, agrandis de la demi-taille de la balle (la balle devient un point)."""
+        briques = jeu.liste_briques
+        demi_largeur = jeu.balles[0].width / 2
+        demi_hauteur = jeu.balles[0].height / 2
+        m = len(briques)
+        rectangles = briques.donnees[:m][briques.vies[:m] > 0]
+        bx, by = rectangles[:, 0], rectangles[:, 1]
+        self._briques = (bx - rectangles[:, 2] - demi_largeur, bx + rectangles[:, 2] + demi_largeur,
+                         by - rectangles[:, 3] - demi_hauteur, by + rectangles[:, 3] + demi_hauteur, bx, by)
+        # Bas de la brique la plus basse: une trajectoire qui reste dessous n'en touche aucune
+        self._bas_briques = self._briques[3].max() if len(rectangles) else -np.inf
+
+    def _minorer(self, jeu, indices):
+        """
+        Remplace l'arrivée des balles données par un minorant (prédiction complétée à la demande).
+
+        Les rebonds sur les murs et les briques gardent |vy| et ne peuvent que retarder
+        l'arrivée: la distance verticale à parcourir divisée par |vy| la minore. Une balle qui
+        monte sous les briques doit encore atteindre la plus basse d'entre elles (ou le plafond)
+        avant de redescendre.
+
+        Args:
+            jeu (Jeu): La partie en cours
+            indices (ndarray): Indices des balles à prédire (en mouvement)
+        """
+        balles = jeu.balles
+        raquette = jeu.raquette
+        y_contact = raquette.y - raquette.height / 2 - balles[0].height / 2
+        plafond = max(self._bas_briques, YMIN + balles[0].height / 2)
+        d = balles.donnees[indices]
+        y, vy = d[:, Y_BALLE], d[:, VY_BALLE]
+        distance = np.abs(y_contact - y)
+        montantes = (vy < 0) & (y > plafond)
+        distance[montantes] += 2 * (y[montantes] - plafond)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            minorant = np.where(vy != 0, distance / np.abs(vy), np.inf)
+        self._x_arrivee[indices] = np.nan
+        self._arrivee[indices] = self._pas + minorant
+        self._incomplet[indices] = True
+
+    def _predire(self, jeu, indice):
+        """
+        Prédit l'abscisse et le pas d'arrivée à hauteur de la raquette d'une balle, ou un minorant
+        de son arrivée si elle ne peut plus arriver avant les autres.
+
+        Args:
+            jeu (Jeu): La partie en cours
+            indice (int): Indice de la balle (en mouvement)
+        """
+        balles = jeu.balles
+        demi_largeur = balles[0].width / 2
+        demi_hauteur = balles[0].height / 2
+        raquette = jeu.raquette
+        y_contact = raquette.y - raquette.height / 2 - demi_hauteur
+        mur_gauche, mur_droit, plafond = XMIN + demi_largeur, XMAX - demi_largeur, YMIN + demi_hauteur
+        gauche, droite, haut, bas = self._briques[:4]
+        bas_briques = self._bas_briques
+
+        # Arrivée connue la plus proche parmi les autres balles: au-delà, inutile de suivre la trajectoire
+        autres = np.where(self._incomplet, np.inf, self._arrivee)
+        autres[indice] = np.inf
+        borne = autres.min()
+
+        d = balles.donnees[indice]
+        x, y, vx, vy = float(d[X_BALLE]), float(d[Y_BALLE]), float(d[VX_BALLE]), float(d[VY_BALLE])
+        vx = vx or 1e-12  # Évite les divisions par zéro (trajectoire verticale)
+        instant = float(self._pas)
+        self._x_arrivee[indice] = np.nan
+        self._arrivee[indice] = np.inf
+        self._incomplet[indice] = False
+        if vy == 0:
+            return
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for _ in range(self.max_segments):
+                if y > bas_briques:
+                    # Sous les briques: murs dépliés jusqu'à la raquette (balles descendantes, les
+                    # balles déjà plus bas sont perdues) ou jusqu'au bas des briques ou au plafond
+                    if vy > 0:
+                        t = (y_contact - y) / vy
+                        if t >= 0:
+                            self._x_arrivee[indice] = replier(x + vx * t, mur_gauche, mur_droit)[0]
+                            self._arrivee[indice] = instant + t
+                        return
+                    cible = max(bas_briques, plafond)
+                    t = (cible - y) / vy
+                    x, retournee = replier(x + vx * t, mur_gauche, mur_droit)
+                    y = cible
+                    if retournee:
+                        vx = -vx
+                    if cible == plafond:
+                        vy = -vy
+                else:
+                    # Zone des briques: murs, plafond, raquette et intersection du rayon avec chaque
+                    # brique (méthode des intervalles)
+                    t_mur = ((mur_droit if vx > 0 else mur_gauche) - x) / vx
+                    t_plafond = (plafond - y) / vy if vy < 0 else np.inf
+                    t_raquette = (y_contact - y) / vy if vy > 0 else np.inf
+                    t = min(t_mur, t_plafond, t_raquette)
+                    rebond_brique = sur_x = False
+                    if len(gauche):
+                        t1, t2 = (gauche - x) / vx, (droite - x) / vx
+                        t3, t4 = (haut - y) / vy, (bas - y) / vy
+                        entree_x, entree_y = np.minimum(t1, t2), np.minimum(t3, t4)
+                        entree = np.maximum(entree_x, entree_y)
+                        sortie = np.minimum(np.maximum(t1, t2), np.maximum(t3, t4))
+                        # Une balle qui vient de rebondir est contre la brique: sortie nulle, ignorée
+                        entree[(entree >= sortie) | (sortie <= 1e-9) | (entree < -1e-9)] = np.inf
+                        premiere = int(entree.argmin())
+                        if entree[premiere] < t:
+                            t = float(entree[premiere])
+                            rebond_brique = True
+                            sur_x = entree_x[premiere] > entree_y[premiere]
+                    t = max(t, 0.0)
+                    if not rebond_brique and t_raquette <= t:
+                        self._x_arrivee[indice] = x + vx * t_raquette
+                        self._arrivee[indice] = instant + t_raquette
+                        return
+
+                    # Avancer jusqu'au contact et réfléchir la vitesse
+                    x, y = x + vx * t, y + vy * t
+                    if t_mur <= t or (rebond_brique and sur_x):
+                        vx = -vx
+                    if t_plafond <= t or (rebond_brique and not sur_x):
+                        vy = -vy
+
+                # Trajectoire qui ne peut plus arriver la première: minorant de l'arrivée
+                instant += t
+                if instant > borne:
+                    self._arrivee[indice] = instant
+                    self._incomplet[indice] = True
+                    return
+
+    def _viser(self, jeu, x_balle):
+        """
+        Choisit l'abscisse de la raquette qui reçoit la balle et la renvoie vers une brique.
+
+        Args:
+            jeu (Jeu): La partie en cours
+            x_balle (float): Abscisse d'arrivée de la balle
+
+        Returns:
+            float: Abscisse visée par la raquette
+        """
+        bx, by = self._briques[4:]
+        if len(bx) == 0:
+            return x_balle
+        raquette = jeu.raquette
+        demi_largeur = jeu.balles[0].width / 2
+        demi_hauteur = jeu.balles[0].height / 2
+        y_contact = raquette.y - raquette.height / 2 - demi_hauteur
+
+        # Briques visées directement ou par un rebond sur un mur ou le plafond (images des briques
+        # par symétrie), en inversant Balle.rebond_raquette: angle = 90 + 80 * (raquette.x - balle.x) / longueur
+        cibles_x = np.concatenate((bx, 2 * (XMIN + demi_largeur) - bx, 2 * (XMAX - demi_largeur) - bx))
+        cibles_x = np.concatenate((cibles_x, cibles_x))
+        cibles_y = np.concatenate((np.tile(by, 3), np.tile(2 * (YMIN + demi_hauteur) - by, 3)))
+        dx, dy = cibles_x - x_balle, y_contact - cibles_y
+        longueur = raquette.width / 2 + demi_largeur
+        decalages = (np.degrees(np.arctan2(dy, dx)) - 90) / 80 * longueur
+        limite = self.decalage_relatif * longueur
+        atteignables = np.flatnonzero(np.abs(decalages) <= limite)
+        if len(atteignables):
+            # Le plus court chemin: en général une brique basse que rien ne cache
+            decalage = decalages[atteignables[np.hypot(dx, dy)[atteignables].argmin()]]
+        else:
+            decalage = np.clip(decalages[np.abs(decalages).argmin()], -limite, limite)
+        return x_balle + float(decalage)
+
+    def doit_lancer(self, jeu):
+        """
+        Indique si les balles posées sur la raquette doivent être lancées.
+
+        Args:
+            jeu (Jeu): La partie en cours
+
+        Returns:
+            bool: True si toutes les balles sont sur la raquette
+        """
+        return all(balle.sur_raquette for balle in jeu.balles)
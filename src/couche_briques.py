@@ -0,0 +1,70 @@
+"""
+Module contenant la couche statique pré-composée (fond + briques) du jeu
+"""
+import pygame
+from src.constantes import XMAX, YMAX
+from src.moteur import ecran
+from src.gestion_affichage import rectangle_objet
+
+class CoucheBriques:
+    """Surface pré-composée contenant l'arrière-plan et les briques d'un niveau."""
+
+    def __init__(self, background_image, bg_x, bg_y, liste_briques):
+        """
+        Compose la couche statique au chargement du niveau.
+
+        Args:
+            background_image (Surface): Image de fond du niveau
+            bg_x (int): Position x de l'image de fond
+            bg_y (int): Position y de l'image de fond
+            liste_briques (TableBriques): Briques du niveau
+        """
+        self.background_image = background_image
+        self.bg_x = bg_x
+        self.bg_y = bg_y
+        self.surface = pygame.Surface((XMAX, YMAX)).convert()
+
+        # Fond noir pour les bords potentiels, puis image de fond et briques en vie
+        self.surface.fill((0, 0, 0))
+        self.surface.blit(self.background_image, (self.bg_x, self.bg_y))
+        for brique in liste_briques.en_vie():
+            brique.afficher(self.surface)
+
+    def redessiner_brique(self, brique, grille):
+        """
+        Redessine uniquement la zone d'une brique dont la vie a changé.
+
+        Args:
+            brique (Brique): La brique touchée (en vie ou détruite)
+            grille (GrilleSpatiale): Grille des briques en vie, pour redessiner les voisines qui chevauchent la zone
+
+        Returns:
+            Rect: La zone redessinée
+        """
+        zone = rectangle_objet(brique)
+        self.surface.set_clip(zone)
+
+        # Restaurer le fond sous la brique
+        self.surface.fill((0, 0, 0))
+        self.surface.blit(self.background_image, (self.bg_x, self.bg_y))
+
+        # Redessiner les briques encore en vie qui recouvrent la zone (dont la brique elle-même)
+        for voisine in grille.briques_proches(zone.left, zone.top, zone.right, zone.bottom):
+            if voisine.en_vie():
+                voisine.afficher(self.surface)
+
+        self.surface.set_clip(None)
+        return zone
+
+    def afficher(self):
+        """Affiche la couche statique sur tout l'écran."""
+        ecran().blit(self.surface, (0, 0))
+
+    def effacer(self, zone):
+        """
+        Restaure une zone de l'écran à partir de la couche statique.
+
+        Args:
+            zone (Rect): Zone de l'écran à restaurer
+        """
+        ecran().blit(self.surface, zone, zone)
@@ -3,7 +3,8 @@ Module pour gérer l'écran de démarrage du jeu
 """
 import pygame
 import sys
-from src.constantes import screen, XMAX, YMAX
+from src.constantes import XMAX, YMAX
+from src.moteur import ecran
 from src.boutons import Bouton
 from src.sons import jouer_musique_demarrage
 from src.ecrans import charger_police, charger_fond, render_pixel_text
@@ -69,15 +70,15 @@ def afficher_ecran_demarrage():
         bouton_quitter.verifier_survol(pos_souris)
         
         # Effacer l'écran
-        screen.fill((0, 0, 0))
+        ecran().fill((0, 0, 0))
         
         # Dessiner l'arrière-plan s'il est disponible
         if background_image:
-            screen.blit(background_image, (bg_x, bg_y))
+            ecran().blit(background_image, (bg_x, bg_y))
         
         # Dessiner le titre
-        screen.blit(titre_surface_1, titre_rect_1)
-        screen.blit(titre_surface_2, titre_rect_2)
+        ecran().blit(titre_surface_1, titre_rect_1)
+        ecran().blit(titre_surface_2, titre_rect_2)
         
         # Dessiner les boutons
         bouton_jouer.dessiner()
@@ -2,7 +2,8 @@
 Module pour gérer les écrans de fin de partie (game over et victoire)
 """
 import pygame
-from src.constantes import screen, XMAX, YMAX
+from src.constantes import XMAX, YMAX
+from src.moteur import ecran
 from src.boutons import Bouton
 from src.sons import jouer_musique_game_over, jouer_musique_victoire
 from src.ecrans import charger_police, charger_fond, creer_overlay, render_pixel_text
@@ -91,17 +92,17 @@ def afficher_ecran_fin_partie(type_ecran="game_over", background_image=None):
         bouton.verifier_survol(pygame.mouse.get_pos())
         
         # Effacer l'écran
-        screen.fill((0, 0, 0))
+        ecran().fill((0, 0, 0))
         
         # Dessiner l'arrière-plan s'il est disponible
         if background_image:
-            screen.blit(background_image, (bg_x, bg_y))
+            ecran().blit(background_image, (bg_x, bg_y))
         
         # Appliquer l'overlay
-        screen.blit(overlay, (0, 0))
+        ecran().blit(overlay, (0, 0))
         
         # Dessiner le titre
-        screen.blit(titre_surface, titre_rect)
+        ecran().blit(titre_surface, titre_rect)
         
         # Dessiner le bouton
         bouton.dessiner()
@@ -3,11 +3,34 @@ Module contenant des fonctions communes pour les différents écrans du jeu
 """
 import pygame
 from src.constantes import XMAX, YMAX, BOUTON_POLICE_NOM, BOUTON_POLICE_TAILLE, BOUTON_PIXEL_PERFECT
+from src.sprites import CacheBorne, ChargementParesseux
+from src.fonds import fonds
+
+TAILLE_CACHE_TEXTES = 128  # Textes rendus gardés (titres, boutons, futur affichage du score...)
+
+def ouvrir_police(cle):
+    """
+    Ouvre un fichier de police (appelé seulement quand la police n'est pas dans polices_ouvertes).
+    
+    Args:
+        cle (tuple): (chemin du fichier de police, taille)
+    
+    Returns:
+        Font: La police ouverte
+    """
+    chemin, taille = cle
+    return pygame.font.Font(chemin, taille)
+
+# Polices ouvertes, par fichier et taille, partagées par le jeu et tous les écrans
+polices_ouvertes = ChargementParesseux(ouvrir_police)
 
 def charger_police(noms_polices=None, tailles=None, pixel_perfect=True):
     """
     Charge les polices de caractères pour un écran.
     
+    Chaque fichier n'est lu qu'une fois par taille (polices_ouvertes): les objets Font renvoyés
+    sont partagés et les textes déjà rendus avec eux restent en cache (textes_rendus).
+    
     Args:
         noms_polices (dict): Dictionnaire des noms de polices pour chaque usage
         tailles (dict): Dictionnaire des tailles de police pour chaque usage
@@ -16,6 +39,10 @@ def charger_police(noms_polices=None, tailles=None, pixel_perfect=True):
     Returns:
         dict: Dictionnaire contenant les polices chargées et un dictionnaire d'options de rendu
     """
+    # Le module police n'est pas initialisé à l'import (voir src.moteur)
+    if not pygame.font.get_init():
+        pygame.font.init()
+    
     # Valeurs par défaut
     tailles_defaut = {'titre': 24, 'bouton': BOUTON_POLICE_TAILLE}
     if tailles is None:
@@ -47,7 +74,7 @@ def charger_police(noms_polices=None, tailles=None, pixel_perfect=True):
                 if pixel_perfect and tailles[usage] % 2 != 0:
                     tailles[usage] = int(tailles[usage] / 2) * 2  # Arrondir à un multiple de 2
                 
-                polices[usage] = pygame.font.Font(nom, tailles[usage])
+                polices[usage] = polices_ouvertes[(nom, tailles[usage])]
                 
                 # Configurer les options de rendu pour chaque police
                 if usage == 'bouton':
@@ -74,10 +101,17 @@ def charger_police(noms_polices=None, tailles=None, pixel_perfect=True):
     # Retourner à la fois les polices et les options de rendu
     return polices, render_options
 
+def precharger_polices():
+    """Ouvre au démarrage les polices du jeu et des écrans (titre et boutons)."""
+    charger_police()
+
 def charger_fond(image_path='assets/background/1.png'):
     """
     Charge une image de fond et calcule sa position pour être centrée.
     
+    L'image vient du cache des fonds convertis (src.fonds): elle est partagée et ne doit pas
+    être modifiée.
+    
     Args:
         image_path (str): Chemin vers l'image de fond à charger
     
@@ -85,7 +119,7 @@ def charger_fond(image_path='assets/background/1.png'):
         tuple: (image, bg_x, bg_y) - Image chargée et coordonnées
     """
     try:
-        background_image = pygame.image.load(image_path)
+        background_image = fonds[image_path]
         bg_x = (XMAX - background_image.get_width()) // 2
         bg_y = (YMAX - background_image.get_height()) // 2
     except FileNotFoundError:
@@ -94,26 +128,65 @@ def charger_fond(image_path='assets/background/1.png'):
     
     return background_image, bg_x, bg_y
 
-def creer_overlay(couleur_base, alpha=40):
+def composer_overlay(cle):
     """
-    Crée un overlay semi-transparent pour mettre en valeur l'écran.
+    Remplit une surface plein écran de la couleur semi-transparente demandée
+    (appelé seulement quand l'overlay n'est pas dans overlays).
     
     Args:
-        couleur_base (tuple): Couleur RGB de base
-        alpha (int): Valeur de transparence (0-255)
+        cle (tuple): (couleur RGB de base, alpha)
     
     Returns:
         Surface: Surface pygame avec transparence
     """
+    couleur_base, alpha = cle
     overlay = pygame.Surface((XMAX, YMAX), pygame.SRCALPHA)
     couleur_rgba = (*couleur_base, alpha)  # Ajouter canal alpha
     overlay.fill(couleur_rgba)
     return overlay
 
+# Overlays déjà créés, par couleur et transparence (peu de combinaisons: toutes sont gardées)
+overlays = ChargementParesseux(composer_overlay)
+
+def creer_overlay(couleur_base, alpha=40):
+    """
+    Crée un overlay semi-transparent pour mettre en valeur l'écran.
+    
+    L'overlay est créé une seule fois par couleur et transparence (overlays).
+    La surface renvoyée est partagée et ne doit pas être modifiée.
+    
+    Args:
+        couleur_base (tuple): Couleur RGB de base
+        alpha (int): Valeur de transparence (0-255)
+    
+    Returns:
+        Surface: Surface pygame avec transparence
+    """
+    return overlays[(tuple(couleur_base), alpha)]
+
+def rendre_texte(cle):
+    """
+    Rend un texte avec FreeType (appelé seulement quand le texte n'est pas dans textes_rendus).
+    
+    Args:
+        cle (tuple): (police, texte, couleur, antialias, couleur de fond ou None)
+    
+    Returns:
+        Surface: Surface pygame contenant le texte rendu
+    """
+    police, texte, couleur, antialias, fond = cle
+    return police.render(texte, antialias, couleur, fond)
+
+# Textes déjà rendus, par police, texte, couleur, anti-aliasing et fond
+textes_rendus = CacheBorne(rendre_texte, TAILLE_CACHE_TEXTES)
+
 def render_pixel_text(police, texte, couleur, render_options=None):
     """
     Rendu d'un texte en mode pixel perfect.
     
+    Le rendu est mis en cache (textes_rendus): un texte déjà affiché n'est pas rendu à nouveau.
+    La surface renvoyée est partagée et ne doit pas être modifiée.
+    
     Args:
         police (Font): Police à utiliser pour le rendu
         texte (str): Texte à rendre
@@ -125,6 +198,6 @@ def render_pixel_text(police, texte, couleur, render_options=None):
     """
     if render_options is None:
         render_options = {'antialias': False, 'background': None}
-    
-    # Rendu du texte
-    return police.render(texte, render_options['antialias'], couleur, render_options['background']) 
\ No newline at end of file
+    fond = render_options['background']
+    return textes_rendus[(police, texte, tuple(couleur), bool(render_options['antialias']),
+                          None if fond is None else tuple(fond))] 
\ No newline at end of file
@@ -0,0 +1,363 @@
+"""
+Module d'environnement d'apprentissage (interface de type Gym) autour de Jeu: reset(graine) et
+step(action) sur des parties sans fenêtre, sans son et sans limite de fréquence, une à une
+ou par lots (EnvironnementsVectorises), éventuellement répartis sur plusieurs processus.
+
+L'action est l'abscisse visée par la raquette; les balles posées sur la raquette sont lancées
+automatiquement. L'observation est un vecteur float32 de taille TAILLE_OBSERVATION ou, avec
+l'option pixels, l'image du jeu dessinée hors écran (voir RenduHorsEcran).
+"""
+import multiprocessing
+import os
+
+# Pas de fenêtre ni de carte son (doit être défini avant l'initialisation de pygame)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+from src.constantes import XMAX, YMAX
+from src.jeu import Jeu
+from src.magasin_balles import Y, VY
+from src.niveaux import NOMBRE_MAX_NIVEAUX
+from src.rendu_hors_ecran import RenduHorsEcran
+from src.sons import activer_sons
+
+NB_BALLES_OBSERVEES = 4  # Balles décrites dans l'observation (les plus menaçantes)
+TAILLE_OBSERVATION = 5 + 5 * NB_BALLES_OBSERVEES
+VITESSE_REFERENCE = 4.0  # Normalisation des vitesses dans l'observation
+
+RECOMPENSE_BRIQUE = 1.0  # Par brique détruite
+RECOMPENSE_VIE_PERDUE = -5.0
+MAX_PAS_PAR_EPISODE = 100000  # Épisode interrompu au-delà (parties sans fin)
+
+class ControleurAction:
+    """Contrôleur qui renvoie l'action de l'agent (abscisse visée)."""
+
+    def __init__(self):
+        """Initialise le contrôleur (l'action est fixée avant chaque pas par EnvironnementJeu.step)."""
+        self.x = XMAX / 2
+
+    def position_x(self, jeu):
+        """Renvoie l'abscisse choisie par l'agent."""
+        return self.x
+
+class EnvironnementJeu:
+    """
+    Une partie pilotée pas à pas par un agent.
+
+    Chaque appel à step joue un pas de simulation (Jeu.mise_a_jour) et renvoie
+    (observation, récompense, terminé, infos). La récompense vaut RECOMPENSE_BRIQUE par brique
+    détruite et RECOMPENSE_VIE_PERDUE par vie perdue.
+    """
+
+    def __init__(self, max_pas=MAX_PAS_PAR_EPISODE, pixels=None):
+        """
+        Initialise l'environnement (la partie est créée par reset).
+
+        Args:
+            max_pas (int): Nombre de pas au-delà duquel un épisode est interrompu
+            pixels (dict, optional): Si défini, l'observation est l'image du jeu; le dictionnaire
+                                     contient les options de RenduHorsEcran ({} pour l'image RVB
+                                     complète, {'niveaux_de_gris': True, 'reduction': 2}...)
+        """
+        activer_sons(False)
+        self.max_pas = max_pas
+        self.rendu = RenduHorsEcran(**pixels) if pixels is not None else None
+        self.controleur = ControleurAction()
+        self.jeu = None
+        self.pas = 0
+        self.termine = False
+        self.interrompu = False
+        self.observation = np.zeros(TAILLE_OBSERVATION, dtype=np.float32)
+
+    def reset(self, graine=None):
+        """
+        Commence une nouvelle partie.
+
+        Args:
+            graine (int, optional): Graine de la partie (même graine et mêmes actions: même épisode)
+
+        Returns:
+            ndarray: Première observation
+        """
+        self.jeu = Jeu(controleur=self.controleur, affichage_actif=self.rendu is not None, verbeux=False,
+                       graine=graine)
+        self.pas = 0
+        self.termine = False
+        self.interrompu = False
+        self.briques_en_vie = self.jeu.liste_briques.nb_en_vie
+        self.niveau = self.jeu.niveau
+        return self.observer()
+
+    def step(self, action):
+        """
+        Joue un pas de simulation avec la raquette visant l'abscisse action.
+
+        Args:
+            action (float): Abscisse visée par la raquette (entre 0 et XMAX)
+
+        Returns:
+            tuple: (observation, récompense, terminé, infos) - infos contient le niveau, les vies,
+                   la graine et 'interrompu' (épisode arrêté par max_pas)
+        """
+        recompense = self.jouer(action)
+        jeu = self.jeu
+        infos = {'niveau': jeu.niveau, 'vies': jeu.vies, 'graine': jeu.graine, 'interrompu': self.interrompu}
+        return self.observer(), recompense, self.termine, infos
+
+    def jouer(self, action):
+        """
+        Joue un pas de simulation sans construire l'observation ni les infos (voir step).
+
+        Met à jour termine et interrompu.
+
+        Args:
+            action (float): Abscisse visée par la raquette (entre 0 et XMAX)
+
+        Returns:
+            float: Récompense du pas
+        """
+        jeu = self.jeu
+        self.controleur.x = float(action)
+        if all(balle.sur_raquette for balle in jeu.balles):
+            jeu.lancer_balles(30, 150)
+        vies = jeu.vies
+        jeu.mise_a_jour()
+        self.pas += 1
+
+        # Briques détruites (au changement de niveau: toutes celles qui restaient)
+        if jeu.niveau != self.niveau:
+            detruites = self.briques_en_vie
+            self.niveau = jeu.niveau
+        else:
+            detruites = self.briques_en_vie - jeu.liste_briques.nb_en_vie
+        self.briques_en_vie = jeu.liste_briques.nb_en_vie
+
+        self.interrompu = not jeu.partie_terminee and self.pas >= self.max_pas
+        self.termine = jeu.partie_terminee or self.interrompu
+        return RECOMPENSE_BRIQUE * detruites + RECOMPENSE_VIE_PERDUE * (vies - jeu.vies)
+
+    def observer(self):
+        """
+        Construit l'observation. Avec l'option pixels, c'est l'image du jeu. Sinon: la raquette, les
+        vies, le niveau et la part des briques restantes, puis la position et la vitesse des
+        NB_BALLES_OBSERVEES balles les plus menaçantes (descendantes d'abord, puis les plus basses),
+        complétées par des zéros.
+
+        Returns:
+            ndarray: Vecteur float32 de taille TAILLE_OBSERVATION ou image (réutilisés d'un appel à l'autre)
+        """
+        if self.rendu is not None:
+            return self.rendu.capturer(self.jeu)
+
+        jeu = self.jeu
+        briques = jeu.liste_briques
+        valeurs = [jeu.raquette.x / XMAX, jeu.raquette.width / XMAX, jeu.vies / 3, jeu.niveau / NOMBRE_MAX_NIVEAUX,
+                   briques.nb_en_vie / len(briques) if len(briques) else 0.0]
+
+        # Peu de balles en général: un tri en Python coûte moins cher que les appels NumPy
+        balles = jeu.balles
+        n = len(balles)
+        lignes = balles.donnees[:n, :VY + 1].tolist()
+        if n > 1:
+            lignes.sort(key=lambda ligne: (ligne[VY] > 0, ligne[Y]), reverse=True)
+        for x, y, vx, vy in lignes[:NB_BALLES_OBSERVEES]:
+            valeurs += (x / XMAX, y / YMAX, vx / VITESSE_REFERENCE, vy / VITESSE_REFERENCE, 1.0)
+        valeurs += [0.0] * (TAILLE_OBSERVATION - len(valeurs))
+
+        self.observation[:] = valeurs
+        return self.observation
+
+# --- Environnements vectorisés ------------------------------------------------------
+
+class _LotEnvironnements:
+    """
+    Plusieurs environnements joués dans le même processus (réinitialisés automatiquement).
+
+    Les résultats sont écrits dans des tableaux alloués une fois pour toutes: sans pixels,
+    l'observation de chaque environnement est une ligne du tableau des observations, remplie
+    sur place par EnvironnementJeu.observer.
+    """
+
+    def __init__(self, nombre, increment_graine, options):
+        """
+        Crée nombre environnements (options: arguments d'EnvironnementJeu); increment_graine est
+        le nombre total d'environnements (tous lots).
+        """
+        self.environnements = [EnvironnementJeu(**options) for _ in range(nombre)]
+        self.graines = [None] * nombre
+        self.increment_graine = increment_graine
+        self.pixels = options.get('pixels') is not None
+        self.observations = np.zeros((nombre, TAILLE_OBSERVATION), dtype=np.float32)
+        if not self.pixels:
+            for env, ligne in zip(self.environnements, self.observations):
+                env.observation = ligne
+        self.recompenses = np.zeros(nombre)
+        self.termines = np.zeros(nombre, dtype=bool)
+        self.infos = {cle: np.zeros(nombre, dtype=type_valeur)
+                      for cle, type_valeur in (('niveau', np.int64), ('vies', np.int64),
+                                               ('graine', np.int64), ('interrompu', bool))}
+
+    def _ranger(self, i, observation):
+        """Range l'observation d'un environnement (les images sont copiées depuis le rendu hors écran)."""
+        if self.pixels:
+            if self.observations.shape[1:] != observation.shape:
+                self.observations = np.zeros((len(self.environnements),) + observation.shape, dtype=observation.dtype)
+            self.observations[i] = observation
+
+    def reset(self, graines):
+        """Réinitialise tous les environnements et renvoie leurs observations (tableau nombre x taille)."""
+        self.graines = list(graines)
+        for i, (env, graine) in enumerate(zip(self.environnements, self.graines)):
+            self._ranger(i, env.reset(graine))
+        return self.observations
+
+    def step(self, actions):
+        """
+        Joue un pas dans chaque environnement; un épisode terminé repart avec la graine suivante.
+
+        Returns:
+            tuple: (observations, récompenses, terminés, infos) - tableaux réutilisés d'un pas à l'autre
+                   (voir EnvironnementsVectorises.step)
+        """
+        recompenses, termines = self.recompenses, self.termines
+        niveaux, vies, graines, interrompus = (self.infos[cle] for cle in ('niveau', 'vies', 'graine', 'interrompu'))
+        finales = {}
+        for i, (env, action) in enumerate(zip(self.environnements, np.asarray(actions, dtype=float).tolist())):
+            recompenses[i] = env.jouer(action)
+            jeu = env.jeu
+            niveaux[i], vies[i], graines[i] = jeu.niveau, jeu.vies, jeu.graine
+            interrompus[i] = env.interrompu
+            termines[i] = env.termine
+            if env.termine:
+                finales[i] = env.observer().copy()
+                if self.graines[i] is not None:
+                    self.graines[i] += self.increment_graine
+                self._ranger(i, env.reset(self.graines[i]))
+            else:
+                self._ranger(i, env.observer())
+        return self.observations, recompenses, termines, {**self.infos, 'observations_finales': finales}
+
+def _processus_lot(connexion, nombre, increment_graine, options):
+    """Boucle d'un processus de travail: exécute les commandes reçues sur son lot d'environnements."""
+    lot = _LotEnvironnements(nombre, increment_graine, options)
+    while True:
+        commande, argument = connexion.recv()
+        if commande == 'reset':
+            connexion.send(lot.reset(argument))
+        elif commande == 'step':
+            connexion.send(lot.step(argument))
+        else:
+            connexion.close()
+            return
+
+class EnvironnementsVectorises:
+    """
+    Plusieurs parties jouées ensemble: step reçoit une action par partie et renvoie des tableaux.
+
+    Un épisode terminé est aussitôt remplacé par un nouvel épisode (graine précédente + nombre
+    d'environnements); l'observation renvoyée est alors celle du nouvel épisode et l'observation
+    finale de l'épisode terminé est dans infos['observations_finales'][i].
+
+    Les tableaux renvoyés par reset et step sont réutilisés d'un pas à l'autre (pas d'allocation
+    par pas): les copier pour les garder.
+
+    Avec processus > 0, les parties sont réparties en lots joués par autant de processus;
+    chaque pas ne coûte alors qu'un échange de messages par processus. Avec un seul processus
+    de travail, ou au moins autant que de cœurs (le processus principal en occupe un), ces
+    échanges coûtent plus qu'ils ne rapportent: les parties sont alors jouées dans le processus
+    courant.
+    """
+
+    def __init__(self, nombre, processus=0, max_pas=MAX_PAS_PAR_EPISODE, pixels=None):
+        """
+        Crée les environnements.
+
+        Args:
+            nombre (int): Nombre de parties jouées ensemble
+            processus (int): Nombre de processus de travail (0: tout dans le processus courant,
+                             de même pour 1 ou pour au moins autant que de cœurs)
+            max_pas (int): Nombre de pas au-delà duquel un épisode est interrompu
+            pixels (dict, optional): Observations en images (voir EnvironnementJeu)
+        """
+        self.nombre = nombre
+        options = {'max_pas': max_pas, 'pixels': pixels}
+        self.processus = min(processus, nombre)
+        if self.processus == 1 or self.processus >= (os.cpu_count() or 1):
+            self.processus = 0
+        if self.processus == 0:
+            self.lot = _LotEnvironnements(nombre, nombre, options)
+            return
+
+        # Parties réparties aussi également que possible entre les processus
+        self.tailles = [len(lot) for lot in np.array_split(np.arange(nombre), self.processus)]
+        self.connexions = []
+        self.travailleurs = []
+        for taille in self.tailles:
+            connexion, connexion_travailleur = multiprocessing.Pipe()
+            travailleur = multiprocessing.Process(target=_processus_lot, daemon=True,
+                                                  args=(connexion_travailleur, taille, nombre, options))
+            travailleur.start()
+            self.connexions.append(connexion)
+            self.travailleurs.append(travailleur)
+
+    def reset(self, graine=None):
+        """
+        Commence une nouvelle partie dans chaque environnement.
+
+        Args:
+            graine (int, optional): Graine de la première partie (les suivantes: graine + 1, + 2...)
+
+        Returns:
+            ndarray: Observations (une ligne par partie)
+        """
+        graines = [None if graine is None else graine + i for i in range(self.nombre)]
+        if self.processus == 0:
+            return self.lot.reset(graines)
+        debut = 0
+        for connexion, taille in zip(self.connexions, self.tailles):
+            connexion.send(('reset', graines[debut:debut + taille]))
+            debut += taille
+        return np.concatenate([connexion.recv() for connexion in self.connexions])
+
+    def step(self, actions):
+        """
+        Joue un pas dans chaque environnement.
+
+        Args:
+            actions (array): Abscisse visée par la raquette de chaque partie
+
+        Returns:
+            tuple: (observations, récompenses, terminés, infos) - tableaux de nombre lignes; infos
+                   contient un tableau par information de step ('niveau', 'vies', 'graine',
+                   'interrompu') et 'observations_finales' ({indice: observation finale} des
+                   épisodes terminés à ce pas)
+        """
+        if self.processus == 0:
+            return self.lot.step(actions)
+        debut = 0
+        for connexion, taille in zip(self.connexions, self.tailles):
+            connexion.send(('step', actions[debut:debut + taille]))
+            debut += taille
+        resultats = [connexion.recv() for connexion in self.connexions]
+        infos = {cle: np.concatenate([resultat[3][cle] for resultat in resultats])
+                 for cle in ('niveau', 'vies', 'graine', 'interrompu')}
+        infos['observations_finales'] = {}
+        for debut, resultat in zip(np.cumsum([0] + self.tailles[:-1]).tolist(), resultats):
+            for i, observation in resultat[3]['observations_finales'].items():
+                infos['observations_finales'][debut + i] = observation
+        return (np.concatenate([resultat[0] for resultat in resultats]),
+                np.concatenate([resultat[1] for resultat in resultats]),
+                np.concatenate([resultat[2] for resultat in resultats]),
+                infos)
+
+    def close(self):
+        """Arrête les processus de travail."""
+        if self.processus == 0:
+            return
+        for connexion in self.connexions:
+            connexion.send(('fermer', None))
+        for travailleur in self.travailleurs:
+            travailleur.join()
+        self.connexions = []
+        self.travailleurs = []
@@ -0,0 +1,73 @@
+"""
+Module de chargement des images de fond (niveaux et écrans)
+
+Les fonds sont convertis au format de la fenêtre et gardés dans un cache borné (fonds):
+un niveau ou un écran déjà affiché ne décode pas son image une seconde fois. Le fond du
+niveau suivant peut être décodé à l'avance par un thread (precharger_fond) pendant que
+le niveau en cours est joué; seule la conversion, rapide, reste faite par le thread principal.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from src.moteur import fenetre
+from src.sprites import CacheBorne
+
+TAILLE_CACHE_FONDS = 4  # Fond du niveau en cours, du niveau suivant et des écrans
+
+# Thread de décodage des fonds à l'avance (créé au premier préchargement)
+_decodeur = None
+
+# Décodages en cours ou terminés pas encore utilisés, par chemin d'image
+_decodages = {}
+
+def decoder_fond(chemin):
+    """
+    Décode une image de fond et l'aplatit sur du noir, comme elle est toujours affichée: chaque
+    blit du fond est ensuite une simple copie, sans mélange alpha. N'utilise pas la fenêtre
+    (peut tourner dans le thread de décodage).
+
+    Args:
+        chemin (str): Chemin de l'image de fond
+
+    Returns:
+        Surface: L'image opaque, de la taille de l'image d'origine
+    """
+    image = pygame.image.load(chemin)
+    fond = pygame.Surface(image.get_size())
+    fond.fill((0, 0, 0))
+    fond.blit(image, (0, 0))
+    return fond
+
+def preparer_fond(chemin):
+    """
+    Décode une image de fond (ou récupère son décodage anticipé) et la convertit au format de
+    la fenêtre, créée si nécessaire (appelé seulement quand le fond n'est pas dans fonds).
+
+    Args:
+        chemin (str): Chemin de l'image de fond
+
+    Returns:
+        Surface: Le fond converti
+    """
+    decodage = _decodages.pop(chemin, None)
+    fond = decodage.result() if decodage is not None else decoder_fond(chemin)
+    fenetre()
+    return fond.convert()
+
+# Fonds convertis, par chemin d'image (les moins récemment affichés sont oubliés)
+fonds = CacheBorne(preparer_fond, TAILLE_CACHE_FONDS)
+
+def precharger_fond(chemin):
+    """
+    Lance le décodage d'une image de fond dans un thread, si elle n'est ni en cache ni en cours
+    de décodage. Le prochain accès à fonds[chemin] n'aura plus qu'à la convertir.
+
+    Args:
+        chemin (str): Chemin de l'image de fond
+    """
+    global _decodeur
+    if chemin in fonds or chemin in _decodages:
+        return
+    if _decodeur is None:
+        _decodeur = ThreadPoolExecutor(max_workers=1, thread_name_prefix='decodage-fonds')
+    _decodages[chemin] = _decodeur.submit(decoder_fond, chemin)
@@ -1,10 +1,63 @@
 """
 Module contenant les fonctions d'affichage du jeu
 """
+import math
 import pygame
-from src.constantes import screen, XMAX, YMAX
+from src.constantes import XMAX, YMAX
+from src.moteur import ecran
 from src.sprites import sprite_images
 
+def position_interpolee(objet, alpha=1.0):
+    """
+    Calcule la position d'affichage d'un objet entre les deux derniers pas de simulation.
+    
+    Args:
+        objet: Objet possédant les attributs x et y, et éventuellement x_prec et y_prec
+               (position au pas de simulation précédent)
+        alpha (float): Fraction écoulée du pas de simulation en cours (0 = pas précédent, 1 = pas actuel)
+    
+    Returns:
+        tuple: (x, y) - Position interpolée
+    """
+    x_prec = getattr(objet, 'x_prec', None)
+    if x_prec is None or alpha >= 1.0:
+        return objet.x, objet.y
+    return (x_prec + (objet.x - x_prec) * alpha,
+            objet.y_prec + (objet.y - objet.y_prec) * alpha)
+
+def memoriser_position(objet):
+    """
+    Mémorise la position actuelle d'un objet avant un pas de simulation (pour l'interpolation).
+    
+    Args:
+        objet: Objet possédant les attributs x et y
+    """
+    objet.x_prec = objet.x
+    objet.y_prec = objet.y
+
+def rectangle_objet(objet, x=None, y=None, largeur=None):
+    """
+    Renvoie le rectangle entier (en pixels) recouvert par un objet centré sur (x, y).
+    
+    Le rectangle est élargi d'un pixel pour couvrir les positions non entières.
+    
+    Args:
+        objet: Objet possédant les attributs x, y, width et height (balle, brique, bonus, raquette)
+        x (float, optional): Abscisse du centre à utiliser à la place de objet.x
+        y (float, optional): Ordonnée du centre à utiliser à la place de objet.y
+        largeur (int, optional): Largeur affichée à utiliser à la place de objet.width
+    
+    Returns:
+        Rect: Rectangle couvrant l'objet
+    """
+    if x is None:
+        x, y = objet.x, objet.y
+    if largeur is None:
+        largeur = objet.width
+    gauche = math.floor(x - largeur / 2)
+    haut = math.floor(y - objet.height / 2)
+    return pygame.Rect(gauche, haut, largeur + 1, objet.height + 1)
+
 def afficher_vies(vies, XMAX):
     """
     Affiche les icônes de vie en haut à droite de l'écran.
@@ -12,9 +65,12 @@ def afficher_vies(vies, XMAX):
     Args:
         vies (int): Nombre de vies actuelles du joueur
         XMAX (int): Largeur maximale de l'écran
+    
+    Returns:
+        Rect: Zone occupée par les icônes affichées (vide si aucune vie)
     """
     if vies <= 0:
-        return  # Pas de vies à afficher
+        return pygame.Rect(0, 0, 0, 0)  # Pas de vies à afficher
         
     # Déterminer le sprite principal selon le nombre de vies (1, 2 ou 3+)
     if vies >= 3:
@@ -39,7 +95,8 @@ def afficher_vies(vies, XMAX):
     y = 10
     
     # Afficher le sprite principal
-    screen.blit(sprite_principal, (x, y))
+    ecran().blit(sprite_principal, (x, y))
+    zone = pygame.Rect(x, y, largeur_vie, hauteur_vie)
     
     # Afficher les vies supplémentaires de façon optimisée
     while vies_restantes > 0:
@@ -47,13 +104,16 @@ def afficher_vies(vies, XMAX):
         
         if vies_restantes >= 3:
             # Utiliser un coeur de 3 vies
-            screen.blit(sprite_images['vie3'], (x, y))
+            ecran().blit(sprite_images['vie3'], (x, y))
             vies_restantes -= 3
         elif vies_restantes == 2:
             # Utiliser un coeur de 2 vies
-            screen.blit(sprite_images['vie2'], (x, y))
+            ecran().blit(sprite_images['vie2'], (x, y))
             vies_restantes -= 2
         else:  # vies_restantes == 1
             # Utiliser un coeur de 1 vie
-            screen.blit(sprite_images['vie1'], (x, y))
-            vies_restantes -= 1 
\ No newline at end of file
+            ecran().blit(sprite_images['vie1'], (x, y))
+            vies_restantes -= 1
+    
+    # Étendre la zone jusqu'à la dernière icône affichée
+    return zone.union(pygame.Rect(x, y, largeur_vie, hauteur_vie))
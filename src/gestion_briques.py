@@ -4,7 +4,7 @@ Module contenant les fonctions de génération des briques pour le jeu
 import random
 from src.brique import Brique
 
-def creer_brique(x, y, type_brique, couleurs_niveau, couleur=None):
+def creer_brique(x, y, type_brique, couleurs_niveau, couleur=None, rng=random):
     """
     Crée une brique avec une couleur spécifique ou aléatoire parmi celles du niveau.
     
@@ -14,15 +14,16 @@ def creer_brique(x, y, type_brique, couleurs_niveau, couleur=None):
         type_brique (str): Type de brique
         couleurs_niveau (list): Liste des couleurs disponibles pour ce niveau
         couleur (str, optional): Couleur spécifique ou None pour aléatoire
+        rng (random.Random, optional): Générateur aléatoire (module random par défaut)
     
     Returns:
         Brique: La brique créée
     """
     # Si aucune couleur n'est spécifiée, en choisir une aléatoirement parmi celles du niveau
-    couleur_finale = couleur if couleur else random.choice(couleurs_niveau)
+    couleur_finale = couleur if couleur else rng.choice(couleurs_niveau)
     return Brique(x, y, type_brique, couleur_finale)
 
-def creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES):
+def creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=random):
     """
     Crée une ligne de briques du même type.
     
@@ -34,6 +35,7 @@ def creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, lis
         couleurs_niveau (list): Liste des couleurs disponibles pour ce niveau
         liste_briques (list): Liste où ajouter les briques créées
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
+        rng (random.Random, optional): Générateur aléatoire (module random par défaut)
     """
     # Récupérer les dimensions du type de brique
     largeur = TYPES_BRIQUES[type_brique][0]
@@ -62,10 +64,10 @@ def creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, lis
         x = marge_gauche + colonne * (largeur + espacement_h) + largeur/2
         
         # Créer et ajouter la brique
-        brique = creer_brique(x, y + hauteur/2, type_brique, couleurs_niveau)
+        brique = creer_brique(x, y + hauteur/2, type_brique, couleurs_niveau, rng=rng)
         liste_briques.append(brique)
 
-def creer_ligne_mixte(y, types_briques, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES):
+def creer_ligne_mixte(y, types_briques, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=random):
     """
     Crée une ligne avec alternance de types de briques.
     
@@ -77,6 +79,7 @@ def creer_ligne_mixte(y, types_briques, espacement_h, XMAX, couleurs_niveau, lis
         couleurs_niveau (list): Liste des couleurs disponibles pour ce niveau
         liste_briques (list): Liste où ajouter les briques créées
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
+        rng (random.Random, optional): Générateur aléatoire (module random par défaut)
     """
     # Calculer la largeur moyenne des briques pour estimer le nombre par ligne
     largeur_moyenne = sum(TYPES_BRIQUES[t][0] for t in types_briques) / len(types_briques)
@@ -106,13 +109,13 @@ def creer_ligne_mixte(y, types_briques, espacement_h, XMAX, couleurs_niveau, lis
         x = x_courant + largeur / 2
         
         # Créer et ajouter la brique
-        brique = creer_brique(x, y + hauteur/2, type_brique, couleurs_niveau)
+        brique = creer_brique(x, y + hauteur/2, type_brique, couleurs_niveau, rng=rng)
         liste_briques.append(brique)
         
         # Mettre à jour la position horizontale pour la prochaine brique
         x_courant += largeur + espacement_h
 
-def creer_ligne_triangle(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES):
+def creer_ligne_triangle(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=random):
     """
     Crée une ligne de briques en forme de triangle (plus dense au centre).
     
@@ -124,6 +127,7 @@ def creer_ligne_triangle(y, type_brique, espacement_h, XMAX, couleurs_niveau, li
         couleurs_niveau (list): Liste des couleurs disponibles pour ce niveau
         liste_briques (list): Liste où ajouter les briques créées
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
+        rng (random.Random, optional): Générateur aléatoire (module random par défaut)
     """
     # Récupérer les dimensions du type de brique
     largeur = TYPES_BRIQUES[type_brique][0]
@@ -152,15 +156,15 @@ def creer_ligne_triangle(y, type_brique, espacement_h, XMAX, couleurs_niveau, li
         distance_centre = abs(colonne - centre)
         probabilite = 1.0 - (distance_centre / (briques_utilisees / 2)) * 0.7
         
-        if random.random() < probabilite:
+        if rng.random() < probabilite:
             # Calculer la position du centre de la brique
             x = marge_gauche + colonne * (largeur + espacement_h) + largeur/2
             
             # Créer et ajouter la brique
-            brique = creer_brique(x, y + hauteur/2, type_brique, couleurs_niveau)
+            brique = creer_brique(x, y + hauteur/2, type_brique, couleurs_niveau, rng=rng)
             liste_briques.append(brique)
 
-def creer_ligne_zigzag(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES):
+def creer_ligne_zigzag(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=random):
     """
     Crée une ligne de briques en zigzag.
     
@@ -172,6 +176,7 @@ def creer_ligne_zigzag(y, type_brique, espacement_h, XMAX, couleurs_niveau, list
         couleurs_niveau (list): Liste des couleurs disponibles pour ce niveau
         liste_briques (list): Liste où ajouter les briques créées
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
+        rng (random.Random, optional): Générateur aléatoire (module random par défaut)
     """
     # Récupérer les dimensions du type de brique
     largeur = TYPES_BRIQUES[type_brique][0]
@@ -198,10 +203,10 @@ def creer_ligne_zigzag(y, type_brique, espacement_h, XMAX, couleurs_niveau, list
         y_decale = y + (decalage_zigzag if colonne % 2 == 0 else -decalage_zigzag)
         
         # Créer et ajouter la brique
-        brique = creer_brique(x, y_decale + hauteur/2, type_brique, couleurs_niveau)
+        brique = creer_brique(x, y_decale + hauteur/2, type_brique, couleurs_niveau, rng=rng)
         liste_briques.append(brique)
 
-def creer_ligne_aleatoire(y, types_briques, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES):
+def creer_ligne_aleatoire(y, types_briques, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=random):
     """
     Crée une ligne de briques avec des types aléatoires.
     
@@ -213,6 +218,7 @@ def creer_ligne_aleatoire(y, types_briques, espacement_h, XMAX, couleurs_niveau,
         couleurs_niveau (list): Liste des couleurs disponibles pour ce niveau
         liste_briques (list): Liste où ajouter les briques créées
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
+        rng (random.Random, optional): Générateur aléatoire (module random par défaut)
     """
     # Calculer la largeur moyenne des briques pour estimer le nombre par ligne
     largeur_moyenne = sum(TYPES_BRIQUES[t][0] for t in types_briques) / len(types_briques)
@@ -222,7 +228,7 @@ def creer_ligne_aleatoire(y, types_briques, espacement_h, XMAX, couleurs_niveau,
     briques_approx = int((XMAX - 2 * espacement_h) / (largeur_moyenne + espacement_h))
     
     # Générer une séquence aléatoire de types de briques
-    sequence_briques = [random.choice(types_briques) for _ in range(briques_approx)]
+    sequence_briques = [rng.choice(types_briques) for _ in range(briques_approx)]
     
     # Calculer la largeur totale réelle
     largeur_totale = sum(TYPES_BRIQUES[t][0] for t in sequence_briques) + (len(sequence_briques) - 1) * espacement_h
@@ -240,14 +246,14 @@ def creer_ligne_aleatoire(y, types_briques, espacement_h, XMAX, couleurs_niveau,
         x = x_courant + largeur / 2
         
         # Créer et ajouter la brique avec une probabilité aléatoire
-        if random.random() < 0.8:  # 80% de chance d'avoir une brique
-            brique = creer_brique(x, y + hauteur/2, type_brique, couleurs_niveau)
+        if rng.random() < 0.8:  # 80% de chance d'avoir une brique
+            brique = creer_brique(x, y + hauteur/2, type_brique, couleurs_niveau, rng=rng)
             liste_briques.append(brique)
         
         # Mettre à jour la position horizontale pour la prochaine brique
         x_courant += largeur + espacement_h
 
-def creer_formation_arcade(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES):
+def creer_formation_arcade(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=random):
     """
     Crée une formation ressemblant aux ennemis des jeux d'arcade rétro.
     
@@ -259,6 +265,7 @@ def creer_formation_arcade(y, type_brique, espacement_h, XMAX, couleurs_niveau,
         couleurs_niveau (list): Liste des couleurs disponibles pour ce niveau
         liste_briques (list): Liste où ajouter les briques créées
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
+        rng (random.Random, optional): Générateur aléatoire (module random par défaut)
     """
     # Récupérer les dimensions du type de brique
     largeur = TYPES_BRIQUES[type_brique][0]
@@ -299,10 +306,10 @@ def creer_formation_arcade(y, type_brique, espacement_h, XMAX, couleurs_niveau,
                 # Choisir une couleur selon la ligne pour un effet visuel
                 couleur = couleurs_niveau[ligne % len(couleurs_niveau)]
                 
-                brique = creer_brique(x, y_pos, type_brique, couleurs_niveau, couleur)
+                brique = creer_brique(x, y_pos, type_brique, couleurs_niveau, couleur, rng=rng)
                 liste_briques.append(brique)
 
-def creer_formation_coeur(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES):
+def creer_formation_coeur(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=random):
     """
     Crée une formation en forme de cœur.
     
@@ -314,6 +321,7 @@ def creer_formation_coeur(y, type_brique, espacement_h, XMAX, couleurs_niveau, l
         couleurs_niveau (list): Liste des couleurs disponibles pour ce niveau
         liste_briques (list): Liste où ajouter les briques créées
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
+        rng (random.Random, optional): Générateur aléatoire (module random par défaut)
     """
     # Récupérer les dimensions du type de brique
     largeur = TYPES_BRIQUES[type_brique][0]
@@ -355,14 +363,14 @@ def creer_formation_coeur(y, type_brique, espacement_h, XMAX, couleurs_niveau, l
                 # Utiliser une couleur rouge ou rose pour le cœur si disponible
                 coeurs_couleurs = [c for c in couleurs_niveau if "rouge" in c or "rose" in c]
                 if coeurs_couleurs:
-                    couleur = random.choice(coeurs_couleurs)
+                    couleur = rng.choice(coeurs_couleurs)
                 else:
-                    couleur = random.choice(couleurs_niveau)
+                    couleur = rng.choice(couleurs_niveau)
                 
-                brique = creer_brique(x, y_pos, type_brique, couleurs_niveau, couleur)
+                brique = creer_brique(x, y_pos, type_brique, couleurs_niveau, couleur, rng=rng)
                 liste_briques.append(brique)
 
-def creer_labyrinthe(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES):
+def creer_labyrinthe(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=random):
     """
     Crée une formation en forme de labyrinthe simple avec des chemins pour la balle.
     
@@ -374,6 +382,7 @@ def creer_labyrinthe(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_
         couleurs_niveau (list): Liste des couleurs disponibles pour ce niveau
         liste_briques (list): Liste où ajouter les briques créées
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
+        rng (random.Random, optional): Générateur aléatoire (module random par défaut)
     """
     # Récupérer les dimensions du type de brique
     largeur = TYPES_BRIQUES[type_brique][0]
@@ -426,7 +435,7 @@ def creer_labyrinthe(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_
         ]
     
     # Choisir un labyrinthe aléatoirement
-    formation = random.choice(formations)
+    formation = rng.choice(formations)
     
     # Calculer la largeur totale du labyrinthe
     cols = len(formation[0])
@@ -446,19 +455,19 @@ def creer_labyrinthe(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_
                 # Pour les petits écrans, réduire la probabilité de briques résistantes
                 chances_resistantes = 0.15 if XMAX <= 240 else 0.2
                 
-                if random.random() < chances_resistantes:
+                if rng.random() < chances_resistantes:
                     types_resistants = [t for t in TYPES_BRIQUES.keys() if "double" in t or "metal" in t]
                     if types_resistants:
-                        type_special = random.choice(types_resistants)
-                        brique = creer_brique(x, y_pos, type_special, couleurs_niveau)
+                        type_special = rng.choice(types_resistants)
+                        brique = creer_brique(x, y_pos, type_special, couleurs_niveau, rng=rng)
                     else:
-                        brique = creer_brique(x, y_pos, type_brique, couleurs_niveau)
+                        brique = creer_brique(x, y_pos, type_brique, couleurs_niveau, rng=rng)
                 else:
-                    brique = creer_brique(x, y_pos, type_brique, couleurs_niveau)
+                    brique = creer_brique(x, y_pos, type_brique, couleurs_niveau, rng=rng)
                 
                 liste_briques.append(brique)
 
-def creer_formation_boss(y, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES):
+def creer_formation_boss(y, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=random):
     """
     Crée une formation spéciale 'boss' avec des briques très résistantes.
     À utiliser pour les derniers niveaux.
@@ -470,13 +479,14 @@ def creer_formation_boss(y, espacement_h, XMAX, couleurs_niveau, liste_briques,
         couleurs_niveau (list): Liste des couleurs disponibles pour ce niveau
         liste_briques (list): Liste où ajouter les briques créées
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
+        rng (random.Random, optional): Générateur aléatoire (module random par défaut)
     """
     # Récupérer le type de brique le plus résistant
     types_resistants = [t for t in TYPES_BRIQUES.keys() if "metal" in t or "double" in t]
     if not types_resistants:
         types_resistants = list(TYPES_BRIQUES.keys())
     
-    type_brique = random.choice(types_resistants)
+    type_brique = rng.choice(types_resistants)
     largeur = TYPES_BRIQUES[type_brique][0]
     hauteur = TYPES_BRIQUES[type_brique][1]
     
@@ -514,10 +524,10 @@ def creer_formation_boss(y, espacement_h, XMAX, couleurs_niveau, liste_briques,
                 y_pos = y + ligne * (hauteur + espacement_h) + hauteur/2
                 
                 # Utiliser le type de brique résistant pour toutes les briques
-                brique = creer_brique(x, y_pos, type_brique, couleurs_niveau)
+                brique = creer_brique(x, y_pos, type_brique, couleurs_niveau, rng=rng)
                 liste_briques.append(brique)
 
-def generer_briques(couleurs_niveau, liste_briques, XMAX, TYPES_BRIQUES, niveau=1):
+def generer_briques(couleurs_niveau, liste_briques, XMAX, TYPES_BRIQUES, niveau=1, rng=random):
     """
     Génère les briques en les disposant selon différents patterns.
     Utilise uniquement les couleurs définies pour le niveau actuel.
@@ -529,6 +539,7 @@ def generer_briques(couleurs_niveau, liste_briques, XMAX, TYPES_BRIQUES, niveau=
         XMAX (int): Largeur maximale de l'écran
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
         niveau (int, optional): Numéro du niveau actuel pour ajuster la difficulté
+        rng (random.Random, optional): Générateur aléatoire (module random par défaut)
     """
     # Paramètres de disposition adaptés pour un écran 240x160
     espacement_h = 5  # espacement horizontal réduit
@@ -575,7 +586,7 @@ def generer_briques(couleurs_niveau, liste_briques, XMAX, TYPES_BRIQUES, niveau=
     # Niveau spécial "boss" (dernier niveau)
     if niveau >= 10:  # Si c'est le dernier niveau
         # Créer une formation de boss spéciale, mais adaptée à la taille de l'écran
-        creer_formation_boss(30, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+        creer_formation_boss(30, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
         return
     
     # Traiter chaque ligne/formation avec un pattern choisi
@@ -587,10 +598,10 @@ def generer_briques(couleurs_niveau, liste_briques, XMAX, TYPES_BRIQUES, niveau=
             break
             
         # Choisir un pattern en favorisant les patterns avancés aux niveaux supérieurs
-        if patterns_avances and random.random() < 0.3 + (niveau * 0.05):
-            pattern = random.choice(patterns_avances)
+        if patterns_avances and rng.random() < 0.3 + (niveau * 0.05):
+            pattern = rng.choice(patterns_avances)
         else:
-            pattern = random.choice(patterns_base)  # Utiliser patterns_base pour plus de contrôle
+            pattern = rng.choice(patterns_base)  # Utiliser patterns_base pour plus de contrôle
         
         # Vérifier si le pattern avancé ne dépasserait pas l'écran
         hauteur_estimee = 0
@@ -605,69 +616,69 @@ def generer_briques(couleurs_niveau, liste_briques, XMAX, TYPES_BRIQUES, niveau=
             
         # Si le pattern avancé dépasserait la limite, choisir un pattern de base
         if hauteur_estimee > 0 and y + hauteur_estimee > hauteur_limite:
-            pattern = random.choice(['normale', 'triangle', 'zigzag'])  # Patterns moins hauts
+            pattern = rng.choice(['normale', 'triangle', 'zigzag'])  # Patterns moins hauts
         
         # Choisir un type de brique, avec une chance d'être résistante
-        if types_resistants and random.random() < chance_resistante:
-            type_brique = random.choice(types_resistants)
+        if types_resistants and rng.random() < chance_resistante:
+            type_brique = rng.choice(types_resistants)
         else:
-            type_brique = random.choice(types_disponibles)
+            type_brique = rng.choice(types_disponibles)
         
         if pattern == 'normale':
             # Une ligne de briques d'un type donné
-            creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+            creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
             y += TYPES_BRIQUES[type_brique][1] + espacement_v
             
         elif pattern == 'double':
             # Vérifier si deux lignes tiendraient dans l'espace restant
             hauteur_double = 2 * TYPES_BRIQUES[type_brique][1] + espacement_v/2
             if y + hauteur_double <= hauteur_limite:
-                creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+                creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
                 y += TYPES_BRIQUES[type_brique][1] + espacement_v/2
-                creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+                creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
                 y += TYPES_BRIQUES[type_brique][1] + espacement_v
             else:
                 # Si pas assez d'espace, créer une seule ligne
-                creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+                creer_ligne_briques(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
                 y += TYPES_BRIQUES[type_brique][1] + espacement_v
             
         elif pattern == 'alternance':
             # Alternance de deux types de briques
-            types = random.sample(types_disponibles, min(2, len(types_disponibles)))
-            creer_ligne_mixte(y, types, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+            types = rng.sample(types_disponibles, min(2, len(types_disponibles)))
+            creer_ligne_mixte(y, types, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
             y += max(TYPES_BRIQUES[types[0]][1], TYPES_BRIQUES[types[1] if len(types) > 1 else types[0]][1]) + espacement_v
             
         elif pattern == 'triangle':
             # Disposition en triangle (plus de briques au centre)
-            creer_ligne_triangle(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+            creer_ligne_triangle(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
             y += TYPES_BRIQUES[type_brique][1] + espacement_v
             
         elif pattern == 'zigzag':
             # Disposition en zigzag
-            creer_ligne_zigzag(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+            creer_ligne_zigzag(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
             y += TYPES_BRIQUES[type_brique][1] + espacement_v
             
         elif pattern == 'aléatoire':
             # Chaque brique est d'un type aléatoire
-            creer_ligne_aleatoire(y, types_disponibles, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+            creer_ligne_aleatoire(y, types_disponibles, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
             y += max(TYPES_BRIQUES[t][1] for t in types_disponibles) + espacement_v
             
         elif pattern == 'arcade' and y + hauteur_estimee <= hauteur_limite:
             # Formation style arcade (version réduite)
-            creer_formation_arcade(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+            creer_formation_arcade(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
             y += hauteur_estimee + espacement_v
             
         elif pattern == 'coeur' and y + hauteur_estimee <= hauteur_limite:
             # Formation en cœur (version réduite)
-            creer_formation_coeur(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+            creer_formation_coeur(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
             y += hauteur_estimee + espacement_v
             
         elif pattern == 'labyrinthe' and y + hauteur_estimee <= hauteur_limite:
             # Formation en labyrinthe (version réduite)
-            creer_labyrinthe(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+            creer_labyrinthe(y, type_brique, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
             y += hauteur_estimee + espacement_v
             
         elif pattern == 'boss' and y + hauteur_estimee <= hauteur_limite:
             # Formation de boss intermédiaire
-            creer_formation_boss(y, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES)
+            creer_formation_boss(y, espacement_h, XMAX, couleurs_niveau, liste_briques, TYPES_BRIQUES, rng=rng)
             y += hauteur_estimee + espacement_v 
\ No newline at end of file
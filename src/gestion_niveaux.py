@@ -1,20 +1,28 @@
 """
 Module contenant les fonctions liées à la gestion des niveaux du jeu
 """
-import pygame
+import random
 from src.constantes import XMAX, YMAX
 from src.balle import Balle
+from src.magasin_balles import MagasinBalles
 from src.raquette import Raquette
 from src.niveaux import NIVEAUX, NOMBRE_MAX_NIVEAUX
 from src.gestion_briques import generer_briques
+from src.table_briques import TableBriques
+from src.grille_spatiale import GrilleSpatiale
+from src.fonds import fonds, precharger_fond
 
-def charger_niveau(niveau, TYPES_BRIQUES):
+def charger_niveau(niveau, TYPES_BRIQUES, avec_fond=True):
     """
     Charge les paramètres spécifiques du niveau.
     
+    Le fond vient du cache des fonds convertis (src.fonds) et le décodage du fond du niveau
+    suivant est lancé en arrière-plan.
+    
     Args:
         niveau (int): Le numéro du niveau à charger
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
+        avec_fond (bool): Si False (partie sans affichage), le fond n'est pas chargé (None)
     
     Returns:
         tuple: (victoire_totale, partie_terminee, background_image, bg_x, bg_y, couleurs_niveau)
@@ -27,8 +35,14 @@ def charger_niveau(niveau, TYPES_BRIQUES):
     # Récupérer les paramètres du niveau
     params_niveau = NIVEAUX[niveau]
     
-    # Charger l'arrière-plan
-    background_image = pygame.image.load(params_niveau['arriere_plan'])
+    # Sauvegarder les couleurs disponibles pour ce niveau
+    couleurs_niveau = params_niveau['couleurs_briques']
+    
+    if not avec_fond:
+        return False, False, None, 0, 0, couleurs_niveau
+    
+    # Charger l'arrière-plan (déjà converti s'il a été affiché récemment)
+    background_image = fonds[params_niveau['arriere_plan']]
     bg_width = background_image.get_width()
     bg_height = background_image.get_height()
     
@@ -36,40 +50,46 @@ def charger_niveau(niveau, TYPES_BRIQUES):
     bg_x = (XMAX - bg_width) // 2
     bg_y = (YMAX - bg_height) // 2
     
-    # Sauvegarder les couleurs disponibles pour ce niveau
-    couleurs_niveau = params_niveau['couleurs_briques']
+    # Décoder le fond du niveau suivant pendant que celui-ci est joué
+    if niveau + 1 in NIVEAUX:
+        precharger_fond(NIVEAUX[niveau + 1]['arriere_plan'])
     
     return False, False, background_image, bg_x, bg_y, couleurs_niveau
 
-def initialiser_niveau(niveau, TYPES_BRIQUES):
+def initialiser_niveau(niveau, TYPES_BRIQUES, rng=random, avec_fond=True):
     """
     Initialise un nouveau niveau en créant les briques et en réinitialisant les éléments du jeu.
     
     Args:
         niveau (int): Le numéro du niveau à initialiser
         TYPES_BRIQUES (dict): Dictionnaire contenant les informations sur les types de briques
+        rng (random.Random, optional): Générateur aléatoire de la disposition des briques
+        avec_fond (bool): Si False (partie sans affichage), le fond n'est pas chargé
     
     Returns:
         tuple: (victoire_totale, partie_terminee, background_image, bg_x, bg_y, 
-                couleurs_niveau, liste_briques, liste_bonus, balles, raquette)
+                couleurs_niveau, liste_briques, liste_bonus, balles, raquette, grille)
     """
     # Charger les paramètres du niveau
-    victoire_totale, partie_terminee, background_image, bg_x, bg_y, couleurs_niveau = charger_niveau(niveau, TYPES_BRIQUES)
+    victoire_totale, partie_terminee, background_image, bg_x, bg_y, couleurs_niveau = charger_niveau(niveau, TYPES_BRIQUES, avec_fond)
     
     # Si victoire totale, retourner les valeurs correspondantes
     if victoire_totale:
-        return victoire_totale, partie_terminee, background_image, bg_x, bg_y, couleurs_niveau, [], [], [], None
+        return victoire_totale, partie_terminee, background_image, bg_x, bg_y, couleurs_niveau, TableBriques(), [], [], None, None
     
     # Nettoyer les listes et générer les nouvelles briques
-    liste_briques = []
+    liste_briques = TableBriques()
     liste_bonus = []
     
     # Générer les briques pour ce niveau en passant le niveau actuel
     # pour ajuster la difficulté en fonction du niveau
-    generer_briques(couleurs_niveau, liste_briques, XMAX, TYPES_BRIQUES, niveau)
+    generer_briques(couleurs_niveau, liste_briques, XMAX, TYPES_BRIQUES, niveau, rng)
+    
+    # Ranger les briques dans la grille spatiale (construite une seule fois par niveau)
+    grille = GrilleSpatiale(liste_briques)
     
     # Réinitialiser la balle sur la raquette
-    balles = [Balle()]
+    balles = MagasinBalles([Balle()])
     raquette = Raquette()
     
-    return victoire_totale, partie_terminee, background_image, bg_x, bg_y, couleurs_niveau, liste_briques, liste_bonus, balles, raquette 
\ No newline at end of file
+    return victoire_totale, partie_terminee, background_image, bg_x, bg_y, couleurs_niveau, liste_briques, liste_bonus, balles, raquette, grille 
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+Module contenant la grille spatiale utilisée pour accélérer les collisions balle/briques
+"""
+import numpy as np
+from src.constantes import XMAX, XMIN, YMAX, YMIN
+
+# Taille d'une cellule de la grille (adaptée aux briques de 32x16 et 16x16)
+TAILLE_CELLULE_X = 32
+TAILLE_CELLULE_Y = 16
+
+class GrilleSpatiale:
+    """Grille uniforme qui range les briques par cellule pour limiter les tests de collision."""
+
+    def __init__(self, liste_briques=None, taille_x=TAILLE_CELLULE_X, taille_y=TAILLE_CELLULE_Y):
+        """
+        Initialise la grille et y range les briques fournies.
+
+        Args:
+            liste_briques (list, optional): Briques à ranger dans la grille
+            taille_x (int): Largeur d'une cellule en pixels
+            taille_y (int): Hauteur d'une cellule en pixels
+        """
+        self.taille_x = taille_x
+        self.taille_y = taille_y
+        self.nb_colonnes = (XMAX - XMIN) // taille_x + 1
+        self.nb_lignes = (YMAX - YMIN) // taille_y + 1
+
+        # Chaque cellule contient la liste des briques qui la recouvrent
+        self.cellules = [[] for _ in range(self.nb_colonnes * self.nb_lignes)]
+        
+        # Cellules non vides, tenues à jour à chaque ajout et retrait (lues par MagasinBalles)
+        self.occupees = np.zeros((self.nb_lignes, self.nb_colonnes), dtype=bool)
+
+        # Ordre d'insertion de chaque brique (pour tester les briques dans l'ordre de la liste)
+        self.ordre = {}
+
+        for brique in liste_briques or []:
+            self.ajouter(brique)
+
+    def _plage(self, xmin, ymin, xmax, ymax):
+        """
+        Calcule les indices des cellules recouvertes par un rectangle.
+
+        Returns:
+            tuple: (colonne_min, ligne_min, colonne_max, ligne_max) limités à la grille
+        """
+        col_min = max(0, int((xmin - XMIN) // self.taille_x))
+        lig_min = max(0, int((ymin - YMIN) // self.taille_y))
+        col_max = min(self.nb_colonnes - 1, int((xmax - XMIN) // self.taille_x))
+        lig_max = min(self.nb_lignes - 1, int((ymax - YMIN) // self.taille_y))
+        return col_min, lig_min, col_max, lig_max
+
+    def _indices_rectangle(self, xmin, ymin, xmax, ymax):
+        """Renvoie les indices (ligne * nb_colonnes + colonne) des cellules recouvertes par un rectangle."""
+        col_min, lig_min, col_max, lig_max = self._plage(xmin, ymin, xmax, ymax)
+        for ligne in range(lig_min, lig_max + 1):
+            debut = ligne * self.nb_colonnes
+            for colonne in range(col_min, col_max + 1):
+                yield debut + colonne
+
+    def _rectangle_brique(self, brique):
+        """Renvoie le rectangle (xmin, ymin, xmax, ymax) occupé par une brique."""
+        return (brique.x - brique.width / 2, brique.y - brique.height / 2,
+                brique.x + brique.width / 2, brique.y + brique.height / 2)
+
+    def ajouter(self, brique):
+        """
+        Range une brique dans toutes les cellules qu'elle recouvre.
+
+        Args:
+            brique (Brique): La brique à ajouter
+        """
+        if brique in self.ordre:
+            return
+        self.ordre[brique] = len(self.ordre)
+        occupees = self.occupees.reshape(-1)
+        for indice in self._indices_rectangle(*self._rectangle_brique(brique)):
+            self.cellules[indice].append(brique)
+            occupees[indice] = True
+
+    def retirer(self, brique):
+        """
+        Retire une brique de la grille (typiquement quand sa vie tombe à 0).
+
+        Args:
+            brique (Brique): La brique à retirer
+        """
+        if self.ordre.pop(brique, None) is None:
+            return
+        occupees = self.occupees.reshape(-1)
+        for indice in self._indices_rectangle(*self._rectangle_brique(brique)):
+            cellule = self.cellules[indice]
+            if brique in cellule:
+                cellule.remove(brique)
+                occupees[indice] = bool(cellule)
+
+    def briques_proches(self, xmin, ymin, xmax, ymax):
+        """
+        Renvoie les briques dont les cellules recouvrent le rectangle donné.
+
+        Les briques sont renvoyées dans leur ordre d'insertion, comme dans liste_briques.
+
+        Args:
+            xmin, ymin, xmax, ymax (float): Rectangle englobant à tester
+
+        Returns:
+            tuple: Briques candidates à la collision
+        """
+        col_min, lig_min, col_max, lig_max = self._plage(xmin, ymin, xmax, ymax)
+
+        # Cas le plus courant: le rectangle tient dans une seule cellule
+        if col_min == col_max and lig_min == lig_max:
+            return tuple(self.cellules[lig_min * self.nb_colonnes + col_min])
+
+        # Ne garder que les cellules non vides
+        non_vides = []
+        for ligne in range(lig_min, lig_max + 1):
+            debut = ligne * self.nb_colonnes
+            for colonne in range(col_min, col_max + 1):
+                cellule = self.cellules[debut + colonne]
+                if cellule:
+                    non_vides.append(cellule)
+
+        if not non_vides:
+            return ()
+        if len(non_vides) == 1:
+            return tuple(non_vides[0])
+
+        # Plusieurs cellules: éliminer les doublons en conservant l'ordre de liste_briques
+        candidates = set()
+        for cellule in non_vides:
+            candidates.update(cellule)
+        return sorted(candidates, key=self.ordre.__getitem__)
+
+    def briques_proches_balle(self, balle):
+        """
+        Renvoie les briques proches du rectangle englobant d'une balle.
+
+        Args:
+            balle (Balle): La balle à tester
+
+        Returns:
+            tuple: Briques candidates à la collision
+        """
+        demi_largeur = balle.width / 2
+        demi_hauteur = balle.height / 2
+        return self.briques_proches(balle.x - demi_largeur, balle.y - demi_hauteur,
+                                    balle.x + demi_largeur, balle.y + demi_hauteur)
+
+    def occupation(self):
+        """
+        Renvoie le tableau des cellules qui contiennent au moins une brique.
+
+        Le tableau est tenu à jour par ajouter et retirer (aucun calcul ici): il est partagé
+        et ne doit pas être modifié.
+
+        Returns:
+            ndarray: Tableau booléen de forme (nb_lignes, nb_colonnes)
+        """
+        return self.occupees
+
+    def __len__(self):
+        """Nombre de briques actuellement rangées dans la grille."""
+        return len(self.ordre)
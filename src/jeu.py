@@ -3,8 +3,10 @@ Module principal contenant la classe Jeu qui gère le déroulement du jeu
 """
 import random
 import pygame
-from src.constantes import screen, XMAX, YMAX
+from src.constantes import XMAX, YMAX, PAS_SIMULATION, MAX_PAS_PAR_IMAGE, PART_MAX_RENDU_PARTIEL
+from src.moteur import ecran
 from src.balle import Balle
+from src.magasin_balles import MagasinBalles
 from src.raquette import Raquette
 from src.brique import Brique
 from src.bonus import Bonus
@@ -15,29 +17,74 @@ from src.sons import jouer_son_bonus, jouer_son_rebond, jouer_son_explosion, jou
 # Importation des modules créés pour la refactorisation
 from src.gestion_briques import generer_briques, creer_brique
 from src.gestion_niveaux import charger_niveau, initialiser_niveau
-from src.gestion_affichage import afficher_vies
+from src.gestion_affichage import afficher_vies, memoriser_position
+from src.couche_briques import CoucheBriques
+from src.table_briques import TableBriques
 from src.ecrans import charger_police, creer_overlay, render_pixel_text
 from src.boutons import Bouton
+from src.controleurs import ControleurSouris
 
 class Jeu:
     """Classe principale qui gère le déroulement du jeu."""
     
-    def __init__(self):
-        """Initialise une nouvelle partie."""
-        self.balles = [Balle()]  # Liste de balles (on commence avec une seule)
+    def __init__(self, rendu_partiel=False, controleur=None, affichage_actif=True, verbeux=True, chronometre=None,
+                 graine=None):
+        """
+        Initialise une nouvelle partie.
+        
+        Args:
+            rendu_partiel (bool): Si True, affichage() renvoie la liste des zones modifiées
+                                  pour une présentation avec pygame.display.update(zones)
+            controleur (optional): Objet qui fournit la position de la raquette (position_x(jeu)).
+                                   Si None, la raquette suit la souris.
+            affichage_actif (bool): Si False, aucune surface n'est composée (simulation sans rendu)
+            verbeux (bool): Si True, affiche les messages de progression dans la console
+            chronometre (Chronometre, optional): Mesure la durée des phases de chaque image
+            graine (int, optional): Graine de la partie: une même graine donne les mêmes niveaux
+                                    et, avec les mêmes actions du joueur, la même partie.
+                                    Si None, une graine est tirée au hasard (voir self.graine).
+        """
+        self.controleur = controleur if controleur is not None else ControleurSouris()
+        self.affichage_actif = affichage_actif
+        self.verbeux = verbeux
+        self.chronometre = chronometre
+        
+        # Générateur aléatoire de la partie (lancers, bonus); chaque niveau a le sien (generateur_niveau)
+        self.graine = graine if graine is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.graine)
+        if verbeux:
+            print(f"Graine de la partie: {self.graine}")
+        self.couche_briques = None
+        self.balles = MagasinBalles([Balle()])  # Liste de balles (on commence avec une seule)
         self.raquette = Raquette()
-        self.liste_briques = []
+        self.liste_briques = TableBriques()  # Table des briques du niveau (vues sur des tableaux NumPy)
+        self.grille = None  # Grille spatiale des briques en vie (construite au chargement du niveau)
         self.liste_bonus = []  # Liste des bonus actifs
+        self.bonus_apparus = 0  # Bonus apparus depuis le début de la partie (statistiques)
+        self.bonus_ramasses = 0  # Bonus ramassés par la raquette depuis le début de la partie
         self.vies = 3  # Nombre de vies initial
         self.partie_terminee = False  # État de la partie
         self.niveau = 1  # Niveau de départ
         self.victoire_totale = False  # Indique si tous les niveaux sont terminés
         self.en_pause = False  # État de pause du jeu
+        self.image_pause = None  # Dernière image du jeu avec l'écran de pause (figée pendant la pause)
         self.retour_menu = False  # Indique si le joueur veut retourner au menu principal
         
+        # Rendu partiel: zones dessinées à l'image précédente et zones de briques modifiées
+        self.rendu_partiel = rendu_partiel
+        self.zones_precedentes = []
+        self.zones_briques = []
+        self.redessin_complet = True
+        
+        # Temps réel écoulé pas encore simulé (boucle à pas fixe)
+        self.accumulateur = 0.0
+        
         # Charger les polices personnalisées avec les options de rendu pixel perfect
         self.polices, self.render_options = charger_police()
         
+        # Bouton "Menu principal" de l'écran de pause
+        self.bouton_menu_principal = Bouton(XMAX/2, YMAX/2 + 30, 105, 18, "Menu principal", self.polices['bouton'])
+        
         # Chargement des paramètres du niveau actuel
         self.charger_niveau(self.niveau)
 
@@ -49,7 +96,8 @@ class Jeu:
             niveau (int): Le numéro du niveau à charger
         """
         # Utiliser la fonction de gestion_niveaux
-        victoire_totale, partie_terminee, background_image, bg_x, bg_y, couleurs_niveau, liste_briques, liste_bonus, balles, raquette = initialiser_niveau(niveau, TYPES_BRIQUES)
+        victoire_totale, partie_terminee, background_image, bg_x, bg_y, couleurs_niveau, liste_briques, liste_bonus, balles, raquette, grille = initialiser_niveau(
+            niveau, TYPES_BRIQUES, self.generateur_niveau(niveau), avec_fond=self.affichage_actif)
         
         # Mettre à jour les attributs de l'objet
         self.victoire_totale = victoire_totale
@@ -67,117 +115,202 @@ class Jeu:
         
         # Nettoyer les briques précédentes et générer les nouvelles
         self.liste_briques = liste_briques
+        self.grille = grille
         self.liste_bonus = liste_bonus
         
+        # Pré-composer le fond et les briques (redessinés seulement quand une brique est touchée)
+        if self.affichage_actif:
+            self.couche_briques = CoucheBriques(background_image, bg_x, bg_y, liste_briques)
+        self.redessin_complet = True
+        
         # Réinitialiser la balle sur la raquette et la raquette
         if raquette:
             self.balles = balles
             self.raquette = raquette
         
         # Afficher les informations du niveau (pour le débogage)
-        description = NIVEAUX[niveau].get('description', f'Niveau {niveau}')
-        print(f"Niveau {niveau} chargé: {description}")
+        if self.verbeux:
+            description = NIVEAUX[niveau].get('description', f'Niveau {niveau}')
+            print(f"Niveau {niveau} chargé: {description}")
 
-    def gestion_evenements(self):
-        """Gère les événements utilisateur comme les clics et la fermeture du jeu."""
-        for event in pygame.event.get():
+    def generateur_niveau(self, niveau):
+        """
+        Crée le générateur aléatoire de la disposition d'un niveau.
+        
+        Il ne dépend que de la graine de la partie et du numéro du niveau: la disposition
+        d'un niveau ne change pas selon la façon dont les niveaux précédents ont été joués.
+        
+        Args:
+            niveau (int): Le numéro du niveau
+        
+        Returns:
+            random.Random: Le générateur du niveau
+        """
+        return random.Random(f'{self.graine}/{niveau}')
+
+    def gestion_evenements(self, evenements=None):
+        """
+        Gère les événements utilisateur comme les clics et la fermeture du jeu.
+        
+        Args:
+            evenements (list, optional): Événements à traiter. Si None, ceux de la file de pygame
+                                         (une liste permet de rejouer des événements enregistrés).
+        
+        Returns:
+            bool: True s'il faut quitter le jeu
+        """
+        if evenements is None:
+            evenements = pygame.event.get()
+        for event in evenements:
             if event.type == pygame.QUIT:
                 # Libérer la souris avant de quitter
-                pygame.mouse.set_visible(True)
-                pygame.event.set_grab(False)
+                if self.affichage_actif:
+                    pygame.mouse.set_visible(True)
+                    pygame.event.set_grab(False)
                 return True  # Signale qu'il faut quitter le jeu
                 
             elif event.type == pygame.KEYDOWN:
                 # Touche pour mettre en pause (P ou Échap)
                 if event.key == pygame.K_p or event.key == pygame.K_ESCAPE:
                     self.en_pause = not self.en_pause
-                    # Afficher/cacher le curseur selon l'état de pause
-                    pygame.mouse.set_visible(self.en_pause)
-                    pygame.event.set_grab(not self.en_pause)
+                    # Afficher/cacher le curseur selon l'état de pause (sauf partie sans fenêtre)
+                    if self.affichage_actif:
+                        pygame.mouse.set_visible(self.en_pause)
+                        pygame.event.set_grab(not self.en_pause)
+                
+                # Touche F3 pour afficher/cacher le graphique des durées d'image
+                elif event.key == pygame.K_F3 and self.chronometre is not None:
+                    self.chronometre.basculer_graphique()
+                    self.image_pause = None  # L'image figée de la pause doit montrer ou cacher le graphique
                 
                 # Touche espace pour lancer les balles sur la raquette (si pas en pause)
                 elif event.key == pygame.K_SPACE and not self.en_pause:
-                    if not self.partie_terminee and all(balle.sur_raquette for balle in self.balles):
-                        # Lancer les balles qui sont sur la raquette
-                        for balle in self.balles:
-                            if balle.sur_raquette:
-                                balle.sur_raquette = False
-                                balle.vitesse_par_angle(random.randint(30, 120))
+                    self.lancer_balles(30, 120)
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Clic gauche
                     if self.en_pause:
                         # Vérifier si le bouton "Menu principal" est cliqué en pause
-                        pos = pygame.mouse.get_pos()
-                        if hasattr(self, 'bouton_menu_principal') and self.bouton_menu_principal.est_clique(pos):
+                        if self.bouton_menu_principal.est_clique(event.pos):
                             self.retour_menu = True
                             self.partie_terminee = True
                             self.en_pause = False
-                    elif all(balle.sur_raquette for balle in self.balles) and not self.partie_terminee:
-                        # Lancer toutes les balles qui sont sur la raquette
-                        for balle in self.balles:
-                            if balle.sur_raquette:
-                                balle.sur_raquette = False
-                                balle.vitesse_par_angle(random.randint(88, 92))
+                    else:
+                        self.lancer_balles(88, 92)
         
         return False  # Ne pas quitter le jeu
 
+    def lancer_balles(self, angle_min, angle_max):
+        """
+        Lance les balles posées sur la raquette, si toutes les balles y sont.
+        
+        Args:
+            angle_min (int): Angle de lancement minimal en degrés
+            angle_max (int): Angle de lancement maximal en degrés
+        
+        Returns:
+            bool: True si des balles ont été lancées, False sinon
+        """
+        if self.partie_terminee or not all(balle.sur_raquette for balle in self.balles):
+            return False
+        
+        # Lancer toutes les balles qui sont sur la raquette
+        for balle in self.balles:
+            if balle.sur_raquette:
+                # La balle part de la raquette même si elle vient d'être perdue à cette image
+                balle.poser_sur_raquette(self.raquette)
+                balle.sur_raquette = False
+                balle.vitesse_par_angle(self.rng.randint(angle_min, angle_max))
+        return True
+
+    def avancer(self, duree):
+        """
+        Fait avancer la simulation d'une durée réelle par pas fixes de PAS_SIMULATION.
+        
+        Plusieurs pas peuvent être joués pour rattraper un retard d'affichage
+        (au plus MAX_PAS_PAR_IMAGE), le reste est conservé pour l'image suivante.
+        
+        Args:
+            duree (float): Temps réel écoulé depuis l'image précédente, en secondes
+        
+        Returns:
+            float: Fraction du pas en cours déjà écoulée, à utiliser pour interpoler l'affichage
+        """
+        self.accumulateur += min(duree, PAS_SIMULATION * MAX_PAS_PAR_IMAGE)
+        
+        while self.accumulateur >= PAS_SIMULATION:
+            self.mise_a_jour()
+            self.accumulateur -= PAS_SIMULATION
+            
+            # Inutile de simuler davantage une partie terminée
+            if self.partie_terminee:
+                self.accumulateur = 0.0
+                break
+        
+        return self.accumulateur / PAS_SIMULATION
+
     def mise_a_jour(self):
-        """Met à jour l'état du jeu: position des objets, collisions, etc."""
+        """Met à jour l'état du jeu d'un pas de simulation: position des objets, collisions, etc."""
         # Si la partie est terminée ou en pause, ne rien mettre à jour
         if self.partie_terminee or self.en_pause:
             return
             
-        # Récupérer la position horizontale de la souris
-        x_souris = pygame.mouse.get_pos()[0]
+        # Mémoriser les positions avant le pas (interpolation de l'affichage)
+        memoriser_position(self.raquette)
+        self.balles.memoriser_positions()
+        for bonus in self.liste_bonus:
+            memoriser_position(bonus)
+            
+        # Récupérer la position horizontale visée (souris ou contrôleur scripté)
+        x_cible = self.controleur.position_x(self)
         
         # Déplacer la raquette
-        self.raquette.deplacer(x_souris)
+        self.raquette.deplacer(x_cible)
         
         # Mettre à jour l'état de la raquette (bonus temporaires)
         self.raquette.mise_a_jour()
         
-        # Balles à enlever (perdues ou sur la raquette après une perte)
-        balles_a_supprimer = []
+        # Déplacer toutes les balles: les collisions (murs, raquette, briques) sont résolues pendant le déplacement
+        impacts = []
+        balles_perdues = self.balles.deplacer(self.raquette, self.grille, impacts, self.rng)
+        chronometre = self.chronometre
+        if chronometre is not None:
+            chronometre.marquer('deplacement')
         
-        # Déplacer les balles et vérifier les collisions
-        for i, balle in enumerate(self.balles):
-            perdue = balle.deplacer(self.raquette)
-            
-            # Si la balle est perdue et ce n'est pas la dernière, on la supprime
-            if perdue:
-                if len(self.balles) > 1:
-                    balles_a_supprimer.append(i)
+        if balles_perdues:
+            if len(balles_perdues) < len(self.balles):
+                # Il reste des balles en jeu: on supprime simplement les balles perdues
+                self.balles.retirer_indices(balles_perdues)
+            else:
+                # C'était la (ou les) dernière(s) balle(s): on en garde une sur la raquette et on perd une vie
+                self.balles.retirer_indices(balles_perdues[:-1])
+                self.vies -= 1
+                if self.vies <= 0:
+                    self.partie_terminee = True
                 else:
-                    # C'est la dernière balle, on perd une vie
-                    self.vies -= 1
-                    if self.vies <= 0:
-                        self.partie_terminee = True
-                    else:
-                        # Jouer le son de perte de vie
-                        jouer_son_lose()
+                    # Jouer le son de perte de vie
+                    jouer_son_lose()
+        
+        # Traiter les briques touchées pendant le déplacement
+        for brique, bonus_genere, bonus_x, bonus_y in impacts:
+            # Jouer le son de rebond
+            jouer_son_rebond()
+            
+            # Si la brique est détruite, jouer le son d'explosion et la retirer de la grille
+            if not brique.en_vie():
+                jouer_son_explosion()
+                self.grille.retirer(brique)
             
-            # Vérifier les collisions avec les briques
-            for brique in self.liste_briques:
-                if brique.en_vie():
-                    collision, bonus_genere, bonus_x, bonus_y = brique.collision_balle(balle)
-                    
-                    # Si collision, jouer le son de rebond
-                    if collision:
-                        jouer_son_rebond()
-                        
-                        # Si la brique est détruite, jouer le son d'explosion
-                        if not brique.en_vie():
-                            jouer_son_explosion()
-                    
-                    # Si un bonus est généré, l'ajouter à la liste des bonus actifs
-                    if bonus_genere:
-                        self.liste_bonus.append(Bonus(bonus_x, bonus_y))
-        
-        # Supprimer les balles perdues (en partant de la fin pour ne pas perturber les indices)
-        for i in sorted(balles_a_supprimer, reverse=True):
-            if i < len(self.balles):
-                self.balles.pop(i)
+            # Mettre à jour la zone de la brique dans la couche statique
+            if self.couche_briques is not None:
+                self.zones_briques.append(self.couche_briques.redessiner_brique(brique, self.grille))
+            
+            # Si un bonus est généré, l'ajouter à la liste des bonus actifs
+            if bonus_genere:
+                self.liste_bonus.append(Bonus(bonus_x, bonus_y, self.rng))
+                self.bonus_apparus += 1
+        if chronometre is not None:
+            chronometre.marquer('briques')
         
         # Déplacer et mettre à jour les bonus
         bonus_a_supprimer = []
@@ -191,6 +324,7 @@ class Jeu:
                 
                 # Appliquer le bonus directement avec sa méthode
                 self.vies, self.balles = bonus.appliquer(self.vies, self.balles, self.raquette)
+                self.bonus_ramasses += 1
                 bonus_a_supprimer.append(i)
                 
             # Supprimer les bonus inactifs
@@ -201,10 +335,11 @@ class Jeu:
         for i in sorted(bonus_a_supprimer, reverse=True):
             if i < len(self.liste_bonus):
                 self.liste_bonus.pop(i)
+        if chronometre is not None:
+            chronometre.marquer('bonus')
         
-        # Vérifier si toutes les briques sont détruites (victoire de niveau)
-        briques_restantes = sum(1 for brique in self.liste_briques if brique.en_vie())
-        if briques_restantes == 0:
+        # Vérifier si toutes les briques sont détruites (victoire de niveau, compteur tenu par la table)
+        if self.liste_briques.niveau_termine():
             # Jouer le son de victoire du niveau
             jouer_son_win()
             
@@ -215,48 +350,99 @@ class Jeu:
                 # Victoire totale si tous les niveaux sont complétés
                 self.partie_terminee = True
                 self.victoire_totale = True
-                print("Félicitations ! Vous avez terminé tous les niveaux !")
+                if self.verbeux:
+                    print("Félicitations ! Vous avez terminé tous les niveaux !")
             else:
                 # Charger le niveau suivant
-                print(f"Niveau {self.niveau-1} terminé ! Passage au niveau {self.niveau}")
+                if self.verbeux:
+                    print(f"Niveau {self.niveau-1} terminé ! Passage au niveau {self.niveau}")
                 self.charger_niveau(self.niveau)
+        if chronometre is not None:
+            chronometre.marquer('victoire')
     
-    def affichage(self):
-        """Affiche tous les éléments du jeu à l'écran."""
-        # Fond noir pour les bords potentiels
-        screen.fill((0, 0, 0))
+    def affichage(self, alpha=1.0):
+        """
+        Affiche tous les éléments du jeu à l'écran.
+        
+        Args:
+            alpha (float): Fraction écoulée du pas de simulation en cours, pour interpoler
+                           la position des objets mobiles entre les deux derniers pas
+        
+        Returns:
+            list: En rendu partiel, la liste des zones de l'écran modifiées depuis l'image
+                  précédente (anciennes et nouvelles positions des objets mobiles, briques
+                  touchées). None sinon, ou quand les zones à effacer dépassent
+                  PART_MAX_RENDU_PARTIEL de l'écran: tout l'écran doit être présenté.
+                  Pendant la pause, l'image est figée et la liste des zones est toujours renvoyée:
+                  seul le bouton "Menu principal", quand son survol change, ou rien.
+        """
+        if self.en_pause:
+            if self.image_pause is not None:
+                return self.actualiser_bouton_pause()
+        else:
+            self.image_pause = None
+        
+        zones_briques = self.zones_briques
+        self.zones_briques = []
+        
+        # Zones à effacer trop étendues (beaucoup d'objets mobiles): image complète
+        zones_a_effacer = self.zones_precedentes + zones_briques
+        image_complete = (not self.rendu_partiel or
+                          sum(zone.w * zone.h for zone in zones_a_effacer) > PART_MAX_RENDU_PARTIEL * XMAX * YMAX)
         
-        # Affichage de l'image de fond centrée
-        screen.blit(self.background_image, (self.bg_x, self.bg_y))
+        if image_complete or self.redessin_complet or self.en_pause:
+            # Affichage de la couche statique (fond + briques encore en vie)
+            self.couche_briques.afficher()
+            zones_modifiees = [ecran().get_rect()]
+        else:
+            # Effacer les objets mobiles de l'image précédente et les briques modifiées
+            zones_modifiees = zones_a_effacer
+            for zone in zones_modifiees:
+                self.couche_briques.effacer(zone)
+        
+        # En pause, les objets sont figés à leur position actuelle
+        if self.en_pause:
+            alpha = 1.0
         
-        # Affichage des briques encore en vie
-        for brique in self.liste_briques:
-            if brique.en_vie():
-                brique.afficher()
+        zones_objets = []
         
         # Affichage des bonus actifs
         for bonus in self.liste_bonus:
-            bonus.afficher()
+            zones_objets.append(bonus.afficher(alpha))
         
         # Affichage de la raquette
-        self.raquette.afficher()
+        zones_objets.append(self.raquette.afficher(alpha))
         
-        # Affichage des balles
-        for balle in self.balles:
-            balle.afficher()
+        # Affichage des balles (toutes en un seul appel)
+        zones_objets.extend(self.balles.afficher(alpha))
                 
         # Affichage des vies (utiliser la fonction du module gestion_affichage)
-        afficher_vies(self.vies, XMAX)
+        zones_objets.append(afficher_vies(self.vies, XMAX))
+        
+        # Graphique des durées d'image (touche F3)
+        if self.chronometre is not None and self.chronometre.graphique_visible:
+            zones_objets.append(self.chronometre.afficher_graphique(ecran()))
         
         # Afficher l'écran de pause si le jeu est en pause
         if self.en_pause:
             self.afficher_ecran_pause()
+        
+        # Après la pause, tout l'écran doit être restauré à l'image suivante
+        self.redessin_complet = self.en_pause
+        self.zones_precedentes = zones_objets
+        
+        if image_complete:
+            return None
+        return zones_modifiees + zones_objets
     
     def afficher_ecran_pause(self):
-        """Affiche l'écran de pause avec les options"""
+        """
+        Affiche l'écran de pause avec les options, par-dessus l'image du jeu, et garde l'image
+        obtenue (sans le bouton) dans image_pause pour les images suivantes de la pause.
+        """
         # Créer un overlay semi-transparent
         overlay = creer_overlay((0, 0, 0), 150)
-        screen.blit(overlay, (0, 0))
+        ecran().blit(overlay, (0, 0))
         
         # Afficher le titre "PAUSE" en utilisant render_pixel_text pour un rendu pixel perfect
         titre_texte = render_pixel_text(
@@ -266,13 +452,29 @@ class Jeu:
             self.render_options['titre']
         )
         titre_rect = titre_texte.get_rect(center=(XMAX // 2, YMAX // 2 - 50))
-        screen.blit(titre_texte, titre_rect)
-        
-        # Créer le bouton "Menu principal"
-        self.bouton_menu_principal = Bouton(XMAX/2, YMAX/2 + 30, 105, 18, "Menu principal", self.polices['bouton'])
+        ecran().blit(titre_texte, titre_rect)
+        self.image_pause = ecran().copy()
         
         # Mettre à jour l'état du bouton
         self.bouton_menu_principal.verifier_survol(pygame.mouse.get_pos())
         
         # Dessiner le bouton
-        self.bouton_menu_principal.dessiner()
\ No newline at end of file
+        self.bouton_menu_principal.dessiner()
+    
+    def actualiser_bouton_pause(self):
+        """
+        Redessine le bouton "Menu principal" de l'écran de pause si son survol a changé
+        (le reste de l'image est figé pendant la pause).
+        
+        Returns:
+            list: La zone du bouton s'il a été redessiné, sinon une liste vide
+        """
+        bouton = self.bouton_menu_principal
+        survole = bouton.est_survole
+        if bouton.verifier_survol(pygame.mouse.get_pos()) == survole:
+            return []
+        
+        # Restaurer le fond du bouton (coins arrondis transparents) avant de le redessiner
+        ecran().blit(self.image_pause, bouton.rect, bouton.rect)
+        bouton.dessiner()
+        return [bouton.rect.copy()]
\ No newline at end of file
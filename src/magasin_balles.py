@@ -0,0 +1,320 @@
+"""
+Module contenant le stockage contigu (tableaux NumPy) des balles du jeu
+"""
+import random
+import numpy as np
+from src.constantes import XMAX, XMIN, YMAX, YMIN
+from src.moteur import ecran
+from src.sons import jouer_son_rebond
+
+# Colonnes du tableau des données de balles
+X, Y, VX, VY, VITESSE, X_PREC, Y_PREC = range(7)
+NB_COLONNES = 7
+
+# En dessous de ce nombre de balles, le coût fixe des opérations NumPy dépasse le gain:
+# chaque balle est alors déplacée individuellement
+SEUIL_VECTORISATION = 32
+
+class MagasinBalles:
+    """
+    Stocke les positions, vitesses et états de toutes les balles dans des tableaux contigus.
+
+    Le magasin se comporte comme une liste de Balle: chaque Balle n'est qu'une vue
+    sur une ligne des tableaux. Les déplacements, rebonds sur les murs et les pertes
+    sont calculés pour toutes les balles à la fois; seules les balles proches des briques
+    ou de la raquette passent par la résolution continue de Balle.deplacer (même
+    physique, balayée, qu'en dessous de SEUIL_VECTORISATION).
+    """
+
+    def __init__(self, balles=None, capacite=8):
+        """
+        Initialise un magasin, éventuellement avec des balles existantes.
+
+        Args:
+            balles (list, optional): Balles à ranger dans le magasin
+            capacite (int): Nombre de lignes allouées au départ
+        """
+        self.donnees = np.zeros((max(capacite, 1), NB_COLONNES))
+        self.donnees[:, X_PREC:Y_PREC + 1] = np.nan  # Pas de position précédente connue
+        self.sur_raquette = np.zeros(max(capacite, 1), dtype=bool)
+        self.vues = []  # Balle associée à chaque ligne
+
+        for balle in balles or []:
+            self.append(balle)
+
+    # --- Comportement de liste -------------------------------------------------
+
+    def __len__(self):
+        """Nombre de balles dans le magasin."""
+        return len(self.vues)
+
+    def __iter__(self):
+        """Parcourt les balles (vues) dans l'ordre."""
+        return iter(self.vues)
+
+    def __getitem__(self, indice):
+        """Renvoie la balle (vue) à l'indice donné."""
+        return self.vues[indice]
+
+    def _agrandir(self, capacite):
+        """Agrandit les tableaux pour contenir au moins capacite lignes."""
+        if capacite <= len(self.donnees):
+            return
+        nouvelle_capacite = max(capacite, 2 * len(self.donnees))
+        donnees = np.zeros((nouvelle_capacite, NB_COLONNES))
+        donnees[:, X_PREC:Y_PREC + 1] = np.nan
+        donnees[:len(self.vues)] = self.donnees[:len(self.vues)]
+        sur_raquette = np.zeros(nouvelle_capacite, dtype=bool)
+        sur_raquette[:len(self.vues)] = self.sur_raquette[:len(self.vues)]
+        self.donnees = donnees
+        self.sur_raquette = sur_raquette
+
+    def append(self, balle):
+        """
+        Ajoute une balle au magasin: ses données sont copiées et la balle devient une vue sur sa ligne.
+
+        Args:
+            balle (Balle): La balle à ajouter
+        """
+        if balle._magasin is self:
+            return
+        ancien, indice = balle._magasin, balle._indice
+        ligne = ancien.donnees[indice].copy()
+        sur_raquette = ancien.sur_raquette[indice]
+        ancien.retirer_indices([indice])
+
+        n = len(self.vues)
+        self._agrandir(n + 1)
+        self.donnees[n] = ligne
+        self.sur_raquette[n] = sur_raquette
+        self.vues.append(balle)
+        balle._magasin = self
+        balle._indice = n
+
+    def extend(self, balles):
+        """
+        Ajoute plusieurs balles au magasin.
+
+        Args:
+            balles (iterable): Les balles à ajouter
+        """
+        balles = list(balles)
+        self._agrandir(len(self.vues) + len(balles))
+        for balle in balles:
+            self.append(balle)
+
+    def pop(self, indice=-1):
+        """
+        Retire et renvoie une balle. La balle retirée reçoit son propre magasin et reste utilisable.
+
+        Args:
+            indice (int): Indice de la balle à retirer
+
+        Returns:
+            Balle: La balle retirée
+        """
+        indice = range(len(self.vues))[indice]
+        balle = self.vues[indice]
+        MagasinBalles(capacite=1).append(balle)
+        return balle
+
+    def retirer_indices(self, indices):
+        """
+        Supprime plusieurs lignes en une seule passe, en conservant l'ordre des balles restantes.
+
+        Args:
+            indices (iterable): Indices des lignes à supprimer
+        """
+        n = len(self.vues)
+        garder = np.ones(n, dtype=bool)
+        garder[list(indices)] = False
+        m = int(garder.sum())
+        if m == n:
+            return
+        self.donnees[:m] = self.donnees[:n][garder]
+        self.sur_raquette[:m] = self.sur_raquette[:n][garder]
+        self.vues = [balle for balle, garde in zip(self.vues, garder) if garde]
+        for i, balle in enumerate(self.vues):
+            balle._indice = i
+
+    # --- Passes vectorisées -----------------------------------------------------
+
+    def memoriser_positions(self):
+        """Mémorise la position de toutes les balles avant un pas de simulation (interpolation)."""
+        n = len(self.vues)
+        self.donnees[:n, X_PREC] = self.donnees[:n, X]
+        self.donnees[:n, Y_PREC] = self.donnees[:n, Y]
+
+    def _proches_des_briques(self, indices, grille, demi_largeur, demi_hauteur):
+        """
+        Détermine quelles balles en mouvement peuvent toucher une brique pendant cette image.
+
+        Args:
+            indices (ndarray): Indices des balles en mouvement
+            grille (GrilleSpatiale): Grille des briques en vie
+            demi_largeur, demi_hauteur (float): Demi-dimensions d'une balle
+
+        Returns:
+            ndarray: Masque booléen (aligné sur indices) des balles à résoudre une par une
+        """
+        if grille is None or len(grille) == 0:
+            return np.zeros(len(indices), dtype=bool)
+
+        d = self.donnees[indices]
+        xmin = np.minimum(d[:, X], d[:, X] + d[:, VX]) - demi_largeur - XMIN
+        xmax = np.maximum(d[:, X], d[:, X] + d[:, VX]) + demi_largeur - XMIN
+        ymin = np.minimum(d[:, Y], d[:, Y] + d[:, VY]) - demi_hauteur - YMIN
+        ymax = np.maximum(d[:, Y], d[:, Y] + d[:, VY]) + demi_hauteur - YMIN
+
+        # Cellules couvertes par le rectangle balayé (bornées à la grille)
+        derniere_colonne = grille.nb_colonnes - 1
+        derniere_ligne = grille.nb_lignes - 1
+        col_min = np.minimum(np.maximum((xmin // grille.taille_x).astype(int), 0), derniere_colonne)
+        col_max = np.minimum(np.maximum((xmax // grille.taille_x).astype(int), 0), derniere_colonne)
+        lig_min = np.minimum(np.maximum((ymin // grille.taille_y).astype(int), 0), derniere_ligne)
+        lig_max = np.minimum(np.maximum((ymax // grille.taille_y).astype(int), 0), derniere_ligne)
+
+        # Un rectangle couvre au plus 2x2 cellules à vitesse normale: ses 4 coins suffisent
+        occupation = grille.occupation()
+        proches = (occupation[lig_min, col_min] | occupation[lig_min, col_max]
+                   | occupation[lig_max, col_min] | occupation[lig_max, col_max])
+
+        # Balle très rapide: son rectangle peut couvrir plus de 2 cellules, on la traite une par une
+        proches |= (col_max - col_min > 1) | (lig_max - lig_min > 1)
+        return proches
+
+    def _proches_de_la_raquette(self, indices, raquette, demi_largeur, demi_hauteur):
+        """
+        Détermine quelles balles en mouvement peuvent toucher la raquette pendant cette image.
+
+        Le rectangle balayé est élargi de tout le déplacement horizontal de part et d'autre,
+        pour couvrir aussi un rebond sur un mur pendant l'image.
+
+        Args:
+            indices (ndarray): Indices des balles en mouvement
+            raquette (Raquette): La raquette du joueur
+            demi_largeur, demi_hauteur (float): Demi-dimensions d'une balle
+
+        Returns:
+            ndarray: Masque booléen (aligné sur indices) des balles à résoudre une par une
+        """
+        d = self.donnees[indices]
+        x, y, vy = d[:, X], d[:, Y], d[:, VY]
+        ecart_x = np.abs(d[:, VX]) + demi_largeur + raquette.width / 2
+        haut = raquette.y - raquette.height / 2 - demi_hauteur
+        bas = raquette.y + raquette.height / 2 + demi_hauteur
+        # Bornes incluses: un contact à la fin exacte du déplacement compte pour Balle.deplacer
+        return (vy > 0) & (np.abs(x - raquette.x) <= ecart_x) & (y + vy >= haut) & (y <= bas)
+
+    def deplacer(self, raquette, grille=None, impacts=None, rng=random):
+        """
+        Déplace toutes les balles et gère les rebonds sur les murs, la raquette et les briques.
+
+        Args:
+            raquette (Raquette): La raquette du joueur
+            grille (GrilleSpatiale, optional): Grille des briques en vie
+            impacts (list, optional): Liste où ajouter (brique, bonus_genere, x, y) pour chaque brique touchée
+            rng (random.Random, optional): Générateur aléatoire des tirages de bonus
+
+        Returns:
+            list: Indices des balles perdues (sorties par le bas de l'écran)
+        """
+        n = len(self.vues)
+        if n < SEUIL_VECTORISATION:
+            return [i for i, balle in enumerate(self.vues) if balle.deplacer(raquette, grille, impacts, rng)]
+        demi_largeur = self.vues[0].width / 2
+        demi_hauteur = self.vues[0].height / 2
+        d = self.donnees
+
+        # Balles posées sur la raquette
+        sur_raquette = self.sur_raquette[:n]
+        d[:n, X][sur_raquette] = raquette.x
+        d[:n, Y][sur_raquette] = raquette.y - demi_hauteur - raquette.height / 2
+
+        en_mouvement = np.flatnonzero(~sur_raquette)
+        proches = self._proches_des_briques(en_mouvement, grille, demi_largeur, demi_hauteur)
+        proches |= self._proches_de_la_raquette(en_mouvement, raquette, demi_largeur, demi_hauteur)
+
+        perdues = []
+
+        # Balles proches des briques ou de la raquette: résolution continue, une balle à la fois
+        for i in en_mouvement[proches]:
+            if self.vues[i].deplacer(raquette, grille, impacts, rng):
+                perdues.append(int(i))
+
+        # Toutes les autres balles: déplacement vectorisé
+        libres = en_mouvement[~proches]
+        if len(libres):
+            perdues.extend(self._deplacer_libres(libres, demi_largeur, demi_hauteur))
+
+        perdues.sort()
+        return perdues
+
+    def _deplacer_libres(self, indices, demi_largeur, demi_hauteur):
+        """
+        Déplace en une passe vectorisée des balles qui ne peuvent toucher ni brique ni raquette.
+
+        Args:
+            indices (ndarray): Indices des balles à déplacer
+            demi_largeur, demi_hauteur (float): Demi-dimensions d'une balle
+
+        Returns:
+            list: Indices des balles perdues
+        """
+        d = self.donnees
+        x = d[indices, X] + d[indices, VX]
+        y = d[indices, Y] + d[indices, VY]
+        vx = d[indices, VX]
+        vy = d[indices, VY]
+
+        # Rebonds sur les murs: la partie du déplacement au-delà du mur est réfléchie
+        droite = x + demi_largeur > XMAX
+        x[droite] = 2 * (XMAX - demi_largeur) - x[droite]
+        gauche = x - demi_largeur < XMIN
+        x[gauche] = 2 * (XMIN + demi_largeur) - x[gauche]
+        vx[droite | gauche] *= -1
+        haut = y - demi_hauteur < YMIN
+        y[haut] = 2 * (YMIN + demi_hauteur) - y[haut]
+        vy[haut] *= -1
+
+        if droite.any() or gauche.any() or haut.any():
+            jouer_son_rebond()
+
+        d[indices, X] = x
+        d[indices, Y] = y
+        d[indices, VX] = vx
+        d[indices, VY] = vy
+
+        # Sortie par le bas de l'écran
+        perdues = indices[y + demi_hauteur > YMAX]
+        self.sur_raquette[perdues] = True
+        return perdues.tolist()
+
+    def afficher(self, alpha=1.0):
+        """
+        Affiche toutes les balles en un seul appel à blits.
+
+        Args:
+            alpha (float): Fraction écoulée du pas de simulation en cours
+
+        Returns:
+            list: Zones de l'écran occupées par les balles
+        """
+        n = len(self.vues)
+        if n == 0:
+            return []
+        balle = self.vues[0]
+        d = self.donnees[:n]
+        x = d[:, X]
+        y = d[:, Y]
+
+        # Interpolation entre les deux derniers pas (sauf pour les balles sans position précédente)
+        if alpha < 1.0:
+            connue = ~np.isnan(d[:, X_PREC])
+            x = np.where(connue, d[:, X_PREC] + (x - d[:, X_PREC]) * alpha, x)
+            y = np.where(connue, d[:, Y_PREC] + (y - d[:, Y_PREC]) * alpha, y)
+
+        gauches = np.floor(x - balle.width / 2).astype(int).tolist()
+        hauts = np.floor(y - balle.height / 2).astype(int).tolist()
+        sprite = balle.sprite
+        return ecran().blits([(sprite, (g, h)) for g, h in zip(gauches, hauts)])
@@ -0,0 +1,70 @@
+"""
+Module d'initialisation du moteur (pygame) et d'accès à la fenêtre du jeu
+
+Aucun module du jeu n'initialise pygame ni ne crée de fenêtre à l'import: la fenêtre
+est créée par initialiser(), ou au premier appel d'ecran() ou de fenetre().
+
+Le jeu dessine toujours dans ecran(): la fenêtre, ou une surface hors écran choisie
+avec definir_cible() (capture d'images sans affichage).
+"""
+import pygame
+from src.constantes import XMAX, YMAX
+
+TITRE_FENETRE = "Brick Breaker"
+
+# Surface de la fenêtre (créée au premier appel d'ecran ou de fenetre)
+_ecran = None
+
+# Surface hors écran qui remplace la fenêtre pour le dessin (None: la fenêtre)
+_cible = None
+
+def initialiser():
+    """
+    Initialise pygame et crée la fenêtre du jeu.
+    
+    Returns:
+        Surface: La surface de la fenêtre
+    """
+    pygame.init()
+    pygame.display.set_caption(TITRE_FENETRE)
+    return fenetre()
+
+def definir_cible(surface):
+    """
+    Choisit la surface où le jeu dessine.
+    
+    Args:
+        surface (Surface): Surface hors écran, ou None pour dessiner de nouveau dans la fenêtre
+    
+    Returns:
+        Surface: La cible précédente (None si c'était la fenêtre)
+    """
+    global _cible
+    precedente = _cible
+    _cible = surface
+    return precedente
+
+def ecran():
+    """
+    Renvoie la surface où le jeu dessine: la cible hors écran si elle est définie, sinon la fenêtre.
+    
+    Returns:
+        Surface: La surface de dessin
+    """
+    if _cible is not None:
+        return _cible
+    return fenetre()
+
+def fenetre():
+    """
+    Renvoie la surface de la fenêtre du jeu, créée au premier appel.
+    
+    Returns:
+        Surface: La surface de la fenêtre
+    """
+    global _ecran
+    if _ecran is None or pygame.display.get_surface() is not _ecran:
+        if not pygame.display.get_init():
+            pygame.display.init()
+        _ecran = pygame.display.set_mode((XMAX, YMAX), pygame.SCALED)
+    return _ecran
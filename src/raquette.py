@@ -2,25 +2,54 @@
 Module pour la classe Raquette
 """
 import pygame
-from src.constantes import screen, XMAX, XMIN, YMAX, YMIN
+from src.constantes import XMAX, XMIN, YMAX, YMIN, FREQUENCE_SIMULATION
+from src.moteur import ecran
+from src.gestion_affichage import position_interpolee, rectangle_objet
 
-from src.sprites import sprite_images
+from src.sprites import sprite_images, taille_sprite, CacheBorne
+
+TAILLE_CACHE_SURFACES = 32  # Surfaces composées gardées (largeurs normale, élargie et intermédiaires)
+VITESSE_ANIMATION_LARGEUR = 1.5  # Variation de la largeur affichée par pas de simulation (pixels)
+
+def composer_raquette(largeur):
+    """
+    Compose la surface d'une raquette: bord gauche, sections du milieu répétées, bord droit.
+    
+    Args:
+        largeur (int): Largeur totale en pixels (la dernière section du milieu est coupée
+                       si la largeur n'est pas un nombre entier de sections)
+    
+    Returns:
+        Surface: La raquette complète, à afficher en un seul blit
+    """
+    gauche = sprite_images['raquette_gauche']
+    milieu = sprite_images['raquette_milieu']
+    droite = sprite_images['raquette_droite']
+    surface = pygame.Surface((largeur, milieu.get_height()), pygame.SRCALPHA)
+    surface.blit(gauche, (0, 0))
+    
+    # Les sections du milieu ne doivent pas déborder sous le bord droit (transparent par endroits)
+    fin_milieu = largeur - droite.get_width()
+    surface.set_clip(pygame.Rect(0, 0, fin_milieu, surface.get_height()))
+    for x in range(gauche.get_width(), fin_milieu, milieu.get_width()):
+        surface.blit(milieu, (x, 0))
+    surface.set_clip(None)
+    
+    surface.blit(droite, (fin_milieu, 0))
+    return surface.convert_alpha()
+
+# Surfaces composées par largeur, partagées par toutes les raquettes
+surfaces_raquette = CacheBorne(composer_raquette, TAILLE_CACHE_SURFACES)
 
 class Raquette:
     """Classe représentant la raquette contrôlée par le joueur."""
     
     def __init__(self):
         """Initialise une nouvelle raquette."""
-        # Utilisation des sprites individuels
-        self.sprite_gauche = sprite_images['raquette_gauche']
-        self.sprite_milieu = sprite_images['raquette_milieu']
-        self.sprite_droite = sprite_images['raquette_droite']
-        
-        # Dimensions des parties constituantes
-        self.larg_gauche = self.sprite_gauche.get_width()
-        self.larg_milieu = self.sprite_milieu.get_width()
-        self.larg_droite = self.sprite_droite.get_width()
-        self.height = self.sprite_milieu.get_height()  # La hauteur est la même pour tous
+        # Dimensions des parties constituantes (les sprites ne sont chargés qu'à l'affichage)
+        self.larg_gauche = taille_sprite('raquette_gauche')[0]
+        self.larg_milieu, self.height = taille_sprite('raquette_milieu')  # La hauteur est la même pour tous
+        self.larg_droite = taille_sprite('raquette_droite')[0]
         
         # Par défaut - raquette normale avec 8 sections milieu
         self.nb_sections_milieu = 8
@@ -29,6 +58,11 @@ class Raquette:
         # Calcul de la largeur totale
         self.width = self.larg_gauche + (self.nb_sections_milieu * self.larg_milieu) + self.larg_droite
         
+        # Largeur affichée: rejoint la largeur réelle en quelques pas quand elle s'élargit (en
+        # rétrécissement, la largeur réelle diminue elle aussi pas à pas), jamais plus large qu'elle
+        self.largeur_affichee = self.width
+        self.largeur_affichee_prec = self.width
+        
         # Position
         self.x = XMAX / 2
         self.y = YMAX - self.height/2
@@ -36,23 +70,23 @@ class Raquette:
         # Temps d'élargissement
         self.temps_elargie = 0
 
-    def afficher(self):
-        """Affiche la raquette composée de plusieurs sprites."""
-        # Position de début (partie gauche)
-        x_debut = self.x - self.width/2
-        y_pos = self.y - self.height/2
+    def afficher(self, alpha=1.0):
+        """
+        Affiche la raquette à sa position et sa largeur interpolées, en un seul blit
+        (surface composée une fois par largeur, voir surfaces_raquette).
         
-        # Afficher la partie gauche
-        screen.blit(self.sprite_gauche, (x_debut, y_pos))
-        x_courant = x_debut + self.larg_gauche
+        Args:
+            alpha (float): Fraction écoulée du pas de simulation en cours
         
-        # Afficher les sections du milieu
-        for i in range(self.nb_sections_milieu):
-            screen.blit(self.sprite_milieu, (x_courant, y_pos))
-            x_courant += self.larg_milieu
-            
-        # Afficher la partie droite
-        screen.blit(self.sprite_droite, (x_courant, y_pos))
+        Returns:
+            Rect: Zone de l'écran occupée par la raquette
+        """
+        x, y = position_interpolee(self, alpha)
+        largeur = round(self.largeur_affichee_prec + (self.largeur_affichee - self.largeur_affichee_prec) * alpha)
+        # Jamais plus large que la zone de collision (en rétrécissement, l'interpolation la dépasserait)
+        largeur = min(largeur, int(self.width))
+        ecran().blit(surfaces_raquette[largeur], (x - largeur/2, y - self.height/2))
+        return rectangle_objet(self, x, y, largeur)
     
     def elargir(self):
         """Élargit temporairement la raquette en augmentant le nombre de sections milieu."""
@@ -64,18 +98,26 @@ class Raquette:
             self.width = self.larg_gauche + (self.nb_sections_milieu * self.larg_milieu) + self.larg_droite
             
             self.elargie = True
-            self.temps_elargie = 600  # 10 secondes à 60 FPS
+            self.temps_elargie = 10 * FREQUENCE_SIMULATION  # 10 secondes (en pas de simulation)
     
     def mise_a_jour(self):
-        """Met à jour l'état de la raquette (bonus temporaires)."""
+        """Met à jour l'état de la raquette (bonus temporaires, animation de la largeur)."""
+        self.largeur_affichee_prec = self.largeur_affichee
         if self.elargie:
             self.temps_elargie -= 1
             if self.temps_elargie <= 0:
-                # Revenir à la taille normale
+                # Revenir à la taille normale (la largeur diminue ensuite en quelques pas)
                 self.nb_sections_milieu = 8
-                # Recalculer la largeur totale
-                self.width = self.larg_gauche + (self.nb_sections_milieu * self.larg_milieu) + self.larg_droite
                 self.elargie = False
+        
+        largeur_cible = self.larg_gauche + (self.nb_sections_milieu * self.larg_milieu) + self.larg_droite
+        if self.width > largeur_cible:
+            # Rétrécissement: la zone de collision rétrécit avec la raquette dessinée
+            self.width = max(largeur_cible, self.width - VITESSE_ANIMATION_LARGEUR)
+            self.largeur_affichee = self.width
+        elif self.largeur_affichee < self.width:
+            # Élargissement: la zone de collision est déjà élargie, la raquette dessinée la rejoint
+            self.largeur_affichee = min(self.width, self.largeur_affichee + VITESSE_ANIMATION_LARGEUR)
 
     def deplacer(self, x):
         """
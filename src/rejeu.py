@@ -0,0 +1,328 @@
+"""
+Module d'enregistrement et de rejeu des parties: les entrées du joueur (position visée par
+la raquette, lancers, pauses) sont enregistrées dans un fichier binaire compact avec la graine
+de la partie, puis rejouées sans rendu et sans limite de fréquence.
+
+Une partie rejouée doit aboutir exactement au même état que la partie enregistrée: l'empreinte
+de l'état final, écrite à la fin du fichier, sert de test de non-régression de la physique.
+
+Utilisation: python -m src.rejeu partie.rejeu [--repetitions 5]
+"""
+import argparse
+import hashlib
+import os
+import struct
+import time
+import zlib
+
+import numpy as np
+import pygame
+from src.jeu import Jeu
+from src.sons import activer_sons
+
+# Format du fichier (entiers petit-boutistes), compressé par zlib après l'en-tête:
+#   en-tête: signature, version, graine
+#   image:   nombre d'événements, nombre de pas, événements, abscisse visée à chaque pas (float32)
+#   fin:     FIN_ENREGISTREMENT, nombre d'images, empreinte de l'état final (SHA-256)
+SIGNATURE = b'BBRJ'
+VERSION = 2  # Changée quand la simulation change (2: la raquette rétrécit pas à pas)
+FORMAT_EN_TETE = '<4sBQ'
+FORMAT_IMAGE = '<BB'
+FORMAT_POSITION = '<hh'
+FIN_ENREGISTREMENT = 0xFF
+MAX_EVENEMENTS_PAR_IMAGE = FIN_ENREGISTREMENT - 1
+
+# Codes des événements enregistrés (les autres n'ont pas d'effet sur la partie)
+LANCER = 1  # Touche espace
+PAUSE = 2   # Touche P ou Échap
+CLIC = 3    # Clic gauche, suivi de sa position
+
+def encoder_evenements(evenements):
+    """
+    Encode les événements qui agissent sur la partie.
+
+    Args:
+        evenements (list): Événements pygame d'une image
+
+    Returns:
+        list: Couples (code, position ou None)
+    """
+    codes = []
+    for event in evenements:
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                codes.append((LANCER, None))
+            elif event.key in (pygame.K_p, pygame.K_ESCAPE):
+                codes.append((PAUSE, None))
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            codes.append((CLIC, tuple(event.pos)))
+    return codes[:MAX_EVENEMENTS_PAR_IMAGE]
+
+def decoder_evenements(codes):
+    """
+    Recrée les événements pygame correspondant aux codes enregistrés.
+
+    Args:
+        codes (list): Couples (code, position ou None)
+
+    Returns:
+        list: Événements à passer à Jeu.gestion_evenements
+    """
+    evenements = []
+    for code, position in codes:
+        if code == LANCER:
+            evenements.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        elif code == PAUSE:
+            evenements.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        elif code == CLIC:
+            evenements.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=position))
+    return evenements
+
+def empreinte_etat(jeu):
+    """
+    Calcule l'empreinte de l'état de la simulation (niveau, vies, balles, briques, raquette, bonus).
+
+    Les positions et vitesses sont comparées au bit près: le moindre écart de calcul change l'empreinte.
+
+    Args:
+        jeu (Jeu): La partie
+
+    Returns:
+        str: Empreinte SHA-256 en hexadécimal
+    """
+    empreinte = hashlib.sha256()
+    empreinte.update(struct.pack('<iiBBB', jeu.niveau, jeu.vies, jeu.partie_terminee,
+                                 jeu.victoire_totale, jeu.en_pause))
+    n = len(jeu.balles)
+    empreinte.update(jeu.balles.donnees[:n, :5].tobytes())  # Sans les positions précédentes (affichage)
+    empreinte.update(jeu.balles.sur_raquette[:n].tobytes())
+    m = len(jeu.liste_briques)
+    empreinte.update(jeu.liste_briques.vies[:m].tobytes())
+    empreinte.update(struct.pack('<ddd', jeu.raquette.x, jeu.raquette.y, jeu.raquette.width))
+    for bonus in jeu.liste_bonus:
+        empreinte.update(bonus.type.encode())
+        empreinte.update(struct.pack('<dd?', bonus.x, bonus.y, bonus.actif))
+    empreinte.update(repr(jeu.rng.getstate()).encode())
+    return empreinte.hexdigest()
+
+# --- Enregistrement -----------------------------------------------------------------
+
+class ControleurEnregistre:
+    """Contrôleur qui enregistre chaque position visée par un autre contrôleur."""
+
+    def __init__(self, controleur, enregistreur):
+        """
+        Initialise le contrôleur.
+
+        Args:
+            controleur: Contrôleur enregistré (souris, scripté...)
+            enregistreur (Enregistreur): Destination des positions
+        """
+        self.controleur = controleur
+        self.enregistreur = enregistreur
+
+    def position_x(self, jeu):
+        """Renvoie la position visée par le contrôleur enregistré, arrondie comme dans le fichier."""
+        x = np.float32(self.controleur.position_x(jeu)).item()
+        self.enregistreur.positions.append(x)
+        return x
+
+class Enregistreur:
+    """
+    Enregistre les entrées d'une partie, image par image.
+
+    Utilisation: créer la partie avec controleur=enregistreur.controleur(...), appeler image()
+    avec les événements de chaque image avant Jeu.gestion_evenements, puis sauvegarder().
+    """
+
+    def __init__(self, graine):
+        """
+        Initialise un enregistrement vide.
+
+        Args:
+            graine (int): Graine de la partie enregistrée (Jeu.graine)
+        """
+        self.graine = graine
+        self.donnees = bytearray()
+        self.nb_images = 0
+        self.codes = []       # Événements de l'image en cours
+        self.positions = []   # Positions visées à chaque pas de l'image en cours
+
+    def controleur(self, controleur):
+        """
+        Enveloppe le contrôleur de la partie pour enregistrer ses positions.
+
+        Args:
+            controleur: Contrôleur de la raquette
+
+        Returns:
+            ControleurEnregistre: Le contrôleur à donner à la partie
+        """
+        return ControleurEnregistre(controleur, self)
+
+    def image(self, evenements):
+        """
+        Commence une nouvelle image.
+
+        Args:
+            evenements (list): Événements pygame de l'image
+        """
+        self._ranger_image()
+        self.codes = encoder_evenements(evenements)
+
+    def _ranger_image(self):
+        """Ajoute l'image en cours aux données (les images sans événement ni pas sont omises)."""
+        if not self.codes and not self.positions:
+            return
+        donnees = self.donnees
+        donnees += struct.pack(FORMAT_IMAGE, len(self.codes), len(self.positions))
+        for code, position in self.codes:
+            donnees.append(code)
+            if position is not None:
+                donnees += struct.pack(FORMAT_POSITION, *position)
+        donnees += struct.pack(f'<{len(self.positions)}f', *self.positions)
+        self.nb_images += 1
+        self.codes = []
+        self.positions = []
+
+    def sauvegarder(self, chemin, jeu):
+        """
+        Écrit l'enregistrement et l'empreinte de l'état final de la partie.
+
+        Args:
+            chemin (str): Fichier de destination
+            jeu (Jeu): La partie enregistrée, dans son état final
+        """
+        self._ranger_image()
+        fin = struct.pack('<BI', FIN_ENREGISTREMENT, self.nb_images) + bytes.fromhex(empreinte_etat(jeu))
+        with open(chemin, 'wb') as fichier:
+            fichier.write(struct.pack(FORMAT_EN_TETE, SIGNATURE, VERSION, self.graine))
+            fichier.write(zlib.compress(bytes(self.donnees) + fin))
+
+# --- Rejeu ----------------------------------------------------------------------
+
+class ControleurRejeu:
+    """Contrôleur qui renvoie les positions lues dans un enregistrement."""
+
+    def __init__(self):
+        """Initialise le contrôleur (la position est fixée avant chaque pas par rejouer)."""
+        self.x = 0.0
+
+    def position_x(self, jeu):
+        """Renvoie la position enregistrée pour le pas en cours."""
+        return self.x
+
+def lire_enregistrement(chemin):
+    """
+    Lit un fichier d'enregistrement.
+
+    Args:
+        chemin (str): Fichier à lire
+
+    Returns:
+        tuple: (graine, images, empreinte) - images est une liste de couples
+               (événements pygame, positions visées à chaque pas)
+
+    Raises:
+        ValueError: Si le fichier n'est pas un enregistrement de cette version, ou s'il est
+                    tronqué ou corrompu
+    """
+    with open(chemin, 'rb') as fichier:
+        contenu = fichier.read()
+    try:
+        return _decoder_enregistrement(chemin, contenu)
+    except (struct.error, zlib.error, IndexError) as erreur:
+        raise ValueError(f"{chemin}: enregistrement corrompu ({erreur})") from erreur
+
+def _decoder_enregistrement(chemin, contenu):
+    """Décode le contenu d'un fichier d'enregistrement (voir lire_enregistrement)."""
+    taille_en_tete = struct.calcsize(FORMAT_EN_TETE)
+    signature, version, graine = struct.unpack_from(FORMAT_EN_TETE, contenu)
+    if signature != SIGNATURE or version != VERSION:
+        raise ValueError(f"{chemin} n'est pas un enregistrement de partie (version {VERSION})")
+    donnees = zlib.decompress(contenu[taille_en_tete:])
+
+    images = []
+    position = 0
+    while True:
+        nb_evenements, nb_pas = struct.unpack_from(FORMAT_IMAGE, donnees, position)
+        if nb_evenements == FIN_ENREGISTREMENT:
+            break
+        position += struct.calcsize(FORMAT_IMAGE)
+        codes = []
+        for _ in range(nb_evenements):
+            code = donnees[position]
+            position += 1
+            if code == CLIC:
+                codes.append((code, struct.unpack_from(FORMAT_POSITION, donnees, position)))
+                position += struct.calcsize(FORMAT_POSITION)
+            else:
+                codes.append((code, None))
+        positions = struct.unpack_from(f'<{nb_pas}f', donnees, position)
+        position += 4 * nb_pas
+        images.append((decoder_evenements(codes), positions))
+
+    _, nb_images = struct.unpack_from('<BI', donnees, position)
+    if nb_images != len(images):
+        raise ValueError(f"{chemin}: {len(images)} image(s) lue(s) au lieu de {nb_images}")
+    empreinte = donnees[position + struct.calcsize('<BI'):]
+    if len(empreinte) != hashlib.sha256().digest_size:
+        raise ValueError(f"{chemin}: empreinte de l'état final tronquée")
+    return graine, images, empreinte.hex()
+
+def rejouer(graine, images, apres_image=None):
+    """
+    Rejoue une partie enregistrée sans rendu, sans son et sans limite de fréquence.
+
+    Args:
+        graine (int): Graine de la partie
+        images (list): Images lues par lire_enregistrement
+        apres_image (callable, optional): Appelée avec la partie après chaque image (pour
+                                          comparer l'état image par image)
+
+    Returns:
+        Jeu: La partie dans son état final
+    """
+    activer_sons(False)
+    controleur = ControleurRejeu()
+    jeu = Jeu(controleur=controleur, affichage_actif=False, verbeux=False, graine=graine)
+    for evenements, positions in images:
+        jeu.gestion_evenements(evenements)
+        for x in positions:
+            controleur.x = x
+            jeu.mise_a_jour()
+        if apres_image is not None:
+            apres_image(jeu)
+    return jeu
+
+def main():
+    """Point d'entrée en ligne de commande: rejoue un enregistrement et vérifie son empreinte."""
+    # Pas de fenêtre ni de carte son (le module est aussi importé par main.py pour l'enregistrement)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    parser = argparse.ArgumentParser(description="Rejeu d'une partie enregistrée (main.py --enregistrer)")
+    parser.add_argument('fichier', help="enregistrement à rejouer")
+    parser.add_argument('--repetitions', type=int, default=1, help="nombre de rejeux (mesure du débit)")
+    options = parser.parse_args()
+
+    graine, images, empreinte_attendue = lire_enregistrement(options.fichier)
+    nb_pas = sum(len(positions) for _, positions in images)
+    print(f"Graine {graine}: {len(images)} images, {nb_pas} pas de simulation")
+
+    identiques = True
+    for _ in range(options.repetitions):
+        debut = time.perf_counter()
+        jeu = rejouer(graine, images)
+        duree = time.perf_counter() - debut
+        empreinte = empreinte_etat(jeu)
+        identiques &= empreinte == empreinte_attendue
+        print(f"  {duree:.3f} s, {nb_pas / duree:.0f} pas/s, niveau {jeu.niveau}, vies {jeu.vies}, "
+              f"état final {'identique' if empreinte == empreinte_attendue else 'DIFFÉRENT'}")
+
+    if not identiques:
+        print(f"Empreinte attendue {empreinte_attendue}, obtenue {empreinte}")
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
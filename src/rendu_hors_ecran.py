@@ -0,0 +1,150 @@
+"""
+Module de rendu hors écran: Jeu.affichage dessine dans une surface 240x160 dont les pixels
+sont un tableau NumPy, lu sans copie (observations des agents, capture d'images)
+"""
+import numpy as np
+import pygame
+from src.constantes import XMAX, YMAX
+from src.moteur import definir_cible, fenetre
+
+# Poids (sur 256) de la luminance ITU-R BT.601: 0,299 R + 0,587 G + 0,114 B
+POIDS_GRIS = (77, 150, 29)
+
+# Réduction maximale: la somme d'un bloc (au plus 255 x REDUCTION_MAX²) tient dans 16 bits
+REDUCTION_MAX = 16
+
+class RenduHorsEcran:
+    """
+    Surface de rendu hors écran dont les pixels sont stockés dans un tableau NumPy.
+
+    pygame.surfarray.pixels3d verrouille la surface tant que la vue existe (aucun blit possible):
+    la surface est donc créée sur le tableau (pygame.image.frombuffer) et les vues sont prises
+    sur le tableau lui-même. Elles restent valides d'une image à l'autre et ne copient rien.
+
+    Attributs:
+        pixels (ndarray): Vue (XMAX, YMAX, 3) en RVB, indexée [x, y] comme surfarray.pixels3d
+        image (ndarray): Vue (YMAX, XMAX, 3) en RVB, indexée [ligne, colonne]
+    """
+
+    def __init__(self, niveaux_de_gris=False, reduction=1):
+        """
+        Crée la surface et les tampons de sortie.
+
+        Args:
+            niveaux_de_gris (bool): Si True, capturer() renvoie la luminance (uint8) au lieu du RVB
+            reduction (int): Facteur de réduction (moyenne de blocs reduction x reduction pixels);
+                             puissance de 2 qui divise XMAX et YMAX, au plus REDUCTION_MAX
+        """
+        if reduction & (reduction - 1) or XMAX % reduction or YMAX % reduction or reduction > REDUCTION_MAX:
+            raise ValueError(f"La réduction {reduction} doit être une puissance de 2 qui divise {XMAX} et {YMAX}, "
+                             f"au plus {REDUCTION_MAX}")
+        self.niveaux_de_gris = niveaux_de_gris
+        self.reduction = reduction
+        self._decalage = 2 * (reduction.bit_length() - 1)  # Division par le nombre de pixels d'un bloc
+
+        fenetre()  # Le format des sprites convertis dépend de la fenêtre (factice sans affichage)
+        self.tampon = np.zeros((YMAX, XMAX, 4), dtype=np.uint8)
+        self.surface = pygame.image.frombuffer(self.tampon, (XMAX, YMAX), 'RGBX')
+        self.image = self.tampon[:, :, :3]
+        self.pixels = self.image.transpose(1, 0, 2)
+
+        # Image réduite: sommes des blocs en entiers de 16 bits, les quatre canaux d'un pixel formant
+        # un entier de 64 bits (les colonnes d'un bloc s'additionnent alors en une opération par colonne)
+        hauteur, largeur = YMAX // reduction, XMAX // reduction
+        if reduction > 1:
+            self._lignes = np.zeros((hauteur, XMAX, 4), dtype=np.uint16)
+            self._sommes = np.zeros((hauteur, largeur, 4), dtype=np.uint16)
+            self.tampon_reduit = np.zeros((hauteur, largeur, 4), dtype=np.uint8)
+        else:
+            self.tampon_reduit = self.tampon
+
+        # Tampons des niveaux de gris, alloués une seule fois
+        self._luminance = np.zeros((hauteur, largeur), dtype=np.uint32)
+        self._canal = np.zeros((hauteur, largeur), dtype=np.uint32)
+        self._gris = np.zeros((hauteur, largeur), dtype=np.uint8)
+
+    def dessiner(self, jeu, alpha=1.0):
+        """
+        Dessine une image du jeu dans la surface hors écran.
+
+        Args:
+            jeu (Jeu): La partie (créée avec affichage_actif=True)
+            alpha (float): Fraction écoulée du pas de simulation en cours
+        """
+        precedente = definir_cible(self.surface)
+        try:
+            jeu.affichage(alpha)
+        finally:
+            definir_cible(precedente)
+
+    def capturer(self, jeu, alpha=1.0):
+        """
+        Dessine une image du jeu et renvoie ses pixels, sans allocation.
+
+        Args:
+            jeu (Jeu): La partie (créée avec affichage_actif=True)
+            alpha (float): Fraction écoulée du pas de simulation en cours
+
+        Returns:
+            ndarray: image (YMAX, XMAX, 3), ou l'image réduite et/ou en niveaux de gris.
+                     Le tableau est réutilisé à chaque appel: le copier pour le conserver.
+        """
+        self.dessiner(jeu, alpha)
+        return self.sortie()
+
+    def sortie(self):
+        """
+        Calcule la sortie demandée (réduction puis niveaux de gris) dans les tampons préalloués.
+
+        Returns:
+            ndarray: Voir capturer
+        """
+        if self.reduction > 1:
+            # Moyenne des blocs: somme divisée (décalage) par le nombre de pixels, ou luminance de la somme
+            sommes = self._sommer_blocs()
+            if not self.niveaux_de_gris:
+                np.right_shift(sommes, self._decalage, out=self.tampon_reduit, casting='unsafe')
+                return self.tampon_reduit[:, :, :3]
+            luminance, canal = self._luminance, self._canal
+            np.multiply(sommes[:, :, 0], POIDS_GRIS[0], out=luminance, dtype=np.uint32)
+            for indice in (1, 2):
+                np.multiply(sommes[:, :, indice], POIDS_GRIS[indice], out=canal, dtype=np.uint32)
+                luminance += canal
+            np.right_shift(luminance, 8 + self._decalage, out=self._gris, casting='unsafe')
+            return self._gris
+        if not self.niveaux_de_gris:
+            return self.image
+
+        # Luminance en arithmétique entière, (77 R + 150 G + 29 B) / 256, sur les pixels vus comme des
+        # entiers de 32 bits (R dans l'octet de poids faible): trois passes contiguës sur le tableau
+        pixels = self.tampon.view(np.uint32)[:, :, 0]
+        luminance, canal = self._luminance, self._canal
+        for decalage, poids in zip((0, 8, 16), POIDS_GRIS):
+            np.right_shift(pixels, decalage, out=canal)
+            canal &= 0xFF
+            canal *= poids
+            if decalage == 0:
+                luminance[:] = canal
+            else:
+                luminance += canal
+        np.right_shift(luminance, 8, out=self._gris, casting='unsafe')
+        return self._gris
+
+    def _sommer_blocs(self):
+        """
+        Somme les blocs reduction x reduction pixels de l'image, canal par canal, sans allocation:
+        les lignes de chaque bloc par np.add.reduce sur la vue (hauteur, reduction, ...), puis les
+        colonnes par tranches (une réduction NumPy sur un axe court est bien plus lente).
+
+        Returns:
+            ndarray: Sommes (YMAX / reduction, XMAX / reduction, 4) en uint16
+        """
+        pas, lignes, sommes = self.reduction, self._lignes, self._sommes
+        hauteur = len(lignes)
+        np.add.reduce(self.tampon.reshape(hauteur, pas, XMAX * 4), axis=1, dtype=np.uint16,
+                      out=lignes.reshape(hauteur, XMAX * 4))
+        pixels, somme = lignes.view(np.uint64)[:, :, 0], sommes.view(np.uint64)[:, :, 0]
+        np.add(pixels[:, 0::pas], pixels[:, 1::pas], out=somme)
+        for decalage in range(2, pas):
+            somme += pixels[:, decalage::pas]
+        return sommes
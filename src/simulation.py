@@ -0,0 +1,108 @@
+"""
+Module de simulation sans fenêtre: joue des parties complètes sans rendu, sans son et
+sans limite de fréquence, avec une raquette pilotée par un contrôleur scripté.
+
+Utilisation: python -m src.simulation --parties 100
+"""
+import argparse
+import os
+import time
+
+# Pas de fenêtre ni de carte son (doit être défini avant l'initialisation de pygame)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from src.jeu import Jeu
+from src.controleurs import ControleurAutomatique, ControleurScripte
+from src.sons import activer_sons
+
+# Nombre maximal d'images simulées par partie (évite les parties infinies)
+MAX_IMAGES_PAR_PARTIE = 100000
+
+def simuler_partie(controleur=None, max_images=MAX_IMAGES_PAR_PARTIE, graine=None):
+    """
+    Joue une partie complète sans rendu.
+
+    Args:
+        controleur (optional): Contrôleur de la raquette. Si None, un ControleurScripte.
+        max_images (int): Nombre maximal d'images simulées avant d'abandonner la partie
+        graine (int, optional): Graine de la partie (et du contrôleur par défaut). Si None, aléatoire.
+
+    Returns:
+        dict: Statistiques de la partie (images, niveau atteint, vies, victoire, terminée)
+    """
+    if controleur is None:
+        controleur = ControleurScripte(graine=graine)
+
+    jeu = Jeu(controleur=controleur, affichage_actif=False, verbeux=False, graine=graine)
+
+    images = 0
+    while not jeu.partie_terminee and images < max_images:
+        # Le contrôleur remplace les touches et les clics de lancement
+        if controleur.doit_lancer(jeu):
+            jeu.lancer_balles(30, 150)
+        jeu.mise_a_jour()
+        images += 1
+
+    return {
+        'images': images,
+        'niveau': jeu.niveau,
+        'vies': jeu.vies,
+        'victoire': jeu.victoire_totale,
+        'terminee': jeu.partie_terminee,
+    }
+
+def simuler_parties(nb_parties, max_images=MAX_IMAGES_PAR_PARTIE, graine=None, automatique=False):
+    """
+    Joue plusieurs parties sans rendu et mesure le débit de la simulation.
+
+    Args:
+        nb_parties (int): Nombre de parties à jouer
+        max_images (int): Nombre maximal d'images par partie
+        graine (int, optional): Graine de la première partie (les suivantes prennent graine + 1, + 2...).
+                                Si None, chaque partie est aléatoire.
+        automatique (bool): Si True, la raquette est pilotée par ControleurAutomatique
+                            (prédiction des trajectoires) au lieu de ControleurScripte
+
+    Returns:
+        dict: Débit (parties/s, images/s) et statistiques agrégées
+    """
+    activer_sons(False)
+
+    debut = time.perf_counter()
+    resultats = [simuler_partie(ControleurAutomatique() if automatique else None, max_images,
+                                None if graine is None else graine + i)
+                 for i in range(nb_parties)]
+    duree = time.perf_counter() - debut
+
+    total_images = sum(resultat['images'] for resultat in resultats)
+    return {
+        'parties': nb_parties,
+        'duree': duree,
+        'parties_par_seconde': nb_parties / duree,
+        'images_par_seconde': total_images / duree,
+        'images_par_partie': total_images / nb_parties,
+        'niveau_moyen': sum(resultat['niveau'] for resultat in resultats) / nb_parties,
+        'victoires': sum(1 for resultat in resultats if resultat['victoire']),
+        'abandons': sum(1 for resultat in resultats if not resultat['terminee']),
+    }
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Simulation de parties sans fenêtre")
+    parser.add_argument('--parties', type=int, default=10, help="nombre de parties à jouer")
+    parser.add_argument('--max-images', type=int, default=MAX_IMAGES_PAR_PARTIE,
+                        help="nombre maximal d'images par partie")
+    parser.add_argument('--graine', type=int, help="graine de la première partie (résultats reproductibles)")
+    parser.add_argument('--automatique', action='store_true',
+                        help="raquette pilotée par prédiction des trajectoires (au lieu de suivre la balle)")
+    options = parser.parse_args()
+
+    rapport = simuler_parties(options.parties, options.max_images, options.graine, options.automatique)
+    print(f"{rapport['parties']} parties en {rapport['duree']:.2f} s")
+    print(f"  {rapport['parties_par_seconde']:.2f} parties/s, {rapport['images_par_seconde']:.0f} images/s")
+    print(f"  {rapport['images_par_partie']:.0f} images par partie, niveau moyen atteint {rapport['niveau_moyen']:.2f}")
+    print(f"  {rapport['victoires']} victoire(s), {rapport['abandons']} partie(s) interrompue(s)")
+
+if __name__ == '__main__':
+    main()
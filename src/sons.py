@@ -3,10 +3,6 @@ Module pour la gestion des sons et de la musique du jeu
 """
 import pygame
 
-# Initialisation du module son si nécessaire
-if not pygame.mixer.get_init():
-    pygame.mixer.init()
-
 # Chemins des fichiers musique
 MUSIQUES = {
     'demarrage': 'assets/sound/take_five.mp3',
@@ -15,19 +11,51 @@ MUSIQUES = {
     'victoire': 'assets/sound/i_wish.mp3'
 }
 
-# Chargement des effets sonores
-son_bonus = pygame.mixer.Sound('assets/sound/bonus2.wav')
-son_rebond = pygame.mixer.Sound('assets/sound/bounce.wav')
-son_explosion = pygame.mixer.Sound('assets/sound/explosion.wav')
-son_win = pygame.mixer.Sound('assets/sound/win.wav')
-son_lose = pygame.mixer.Sound('assets/sound/lose.wav')
+# Effets sonores: fichier et volume (valeurs entre 0.0 et 1.0), chargés au premier usage
+EFFETS_SONORES = {
+    'bonus': ('assets/sound/bonus2.wav', 0.7),
+    'rebond': ('assets/sound/bounce.wav', 0.5),
+    'explosion': ('assets/sound/explosion.wav', 0.6),
+    'win': ('assets/sound/win.wav', 0.8),
+    'lose': ('assets/sound/lose.wav', 0.8),
+}
+sons_charges = {}
+
+# Les sons peuvent être coupés (simulations sans fenêtre, tests de charge)
+sons_actifs = True
+
+def activer_sons(actif):
+    """Active ou coupe la musique et les effets sonores
+    
+    Args:
+        actif (bool): True pour jouer les sons, False pour les couper
+    """
+    global sons_actifs
+    sons_actifs = actif
+    if not actif and pygame.mixer.get_init():
+        pygame.mixer.music.stop()
+
+def initialiser_audio():
+    """Initialise le module son s'il ne l'est pas encore"""
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
 
-# Réglage du volume des effets sonores (valeurs entre 0.0 et 1.0)
-son_bonus.set_volume(0.7)
-son_rebond.set_volume(0.5)
-son_explosion.set_volume(0.6)
-son_win.set_volume(0.8)
-son_lose.set_volume(0.8)
+def charger_son(nom_son):
+    """Renvoie un effet sonore, chargé et réglé au premier appel
+    
+    Args:
+        nom_son (str): Identifiant de l'effet sonore (clé de EFFETS_SONORES)
+    
+    Returns:
+        Sound: L'effet sonore
+    """
+    son = sons_charges.get(nom_son)
+    if son is None:
+        initialiser_audio()
+        fichier, volume = EFFETS_SONORES[nom_son]
+        son = sons_charges[nom_son] = pygame.mixer.Sound(fichier)
+        son.set_volume(volume)
+    return son
 
 def jouer_musique(nom_musique):
     """Joue une musique spécifique
@@ -35,7 +63,13 @@ def jouer_musique(nom_musique):
     Args:
         nom_musique (str): Identifiant de la musique à jouer ('demarrage', 'jeu', 'game_over', 'victoire')
     """
+    if not sons_actifs:
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+        return
+    
     # Arrêter toute musique en cours
+    initialiser_audio()
     pygame.mixer.music.stop()
     
     # Vérifier que le nom de musique est valide
@@ -70,20 +104,24 @@ def jouer_musique_victoire():
 
 def jouer_son_bonus():
     """Joue le son lorsqu'un bonus est récupéré"""
-    son_bonus.play()
+    if sons_actifs:
+        charger_son('bonus').play()
 
 def jouer_son_rebond():
     """Joue le son lorsque la balle rebondit"""
-    #son_rebond.play() # Commenté pour éviter le bruit constant
+    #charger_son('rebond').play() # Commenté pour éviter le bruit constant
 
 def jouer_son_explosion():
     """Joue le son lorsqu'une brique se casse"""
-    son_explosion.play()
+    if sons_actifs:
+        charger_son('explosion').play()
 
 def jouer_son_win():
     """Joue le son lorsqu'un niveau est terminé"""
-    son_win.play()
+    if sons_actifs:
+        charger_son('win').play()
 
 def jouer_son_lose():
     """Joue le son lorsqu'une vie est perdue"""
-    son_lose.play() 
\ No newline at end of file
+    if sons_actifs:
+        charger_son('lose').play() 
\ No newline at end of file
@@ -1,8 +1,9 @@
 """
 Module de gestion des sprites pour le jeu Brick Breaker
 """
+from collections import OrderedDict
 import pygame
-from src.constantes import screen
+from src.moteur import fenetre
 
 # Liste des couleurs disponibles pour les briques
 COULEURS_DISPONIBLES = ['bleue', 'verte', 'jaune', 'orange', 'rouge', 'violette']
@@ -71,19 +72,78 @@ for type_brique, (largeur, hauteur, nb_vies, positions) in TYPES_BRIQUES.items()
             nom_sprite = f'brique{type_brique}_{niveau}_{couleur}'
             sprites[nom_sprite] = ('bricks', x, y_base, largeur, hauteur)
 
-# Dictionnaire pour stocker les différentes sprite sheets
-sprite_sheets = {
-    'sprites': pygame.image.load('assets/paddles_and_balls.png').convert_alpha(),
-    'hearts': pygame.image.load('assets/hearts.png').convert_alpha(),
-    'bricks': pygame.image.load('assets/bricks.png').convert_alpha(),
-    'raquette': pygame.image.load('assets/paddle_part.png').convert_alpha(),
+# Fichiers des sprite sheets (chargées au premier accès)
+FICHIERS_SPRITE_SHEETS = {
+    'sprites': 'assets/paddles_and_balls.png',
+    'hearts': 'assets/hearts.png',
+    'bricks': 'assets/bricks.png',
+    'raquette': 'assets/paddle_part.png',
 }
 
+class ChargementParesseux(dict):
+    """Dictionnaire dont chaque valeur est calculée au premier accès à sa clé, puis conservée."""
+    
+    def __init__(self, fabrique):
+        """
+        Args:
+            fabrique (callable): Fonction qui calcule la valeur associée à une clé
+        """
+        super().__init__()
+        self.fabrique = fabrique
+    
+    def __missing__(self, cle):
+        valeur = self[cle] = self.fabrique(cle)
+        return valeur
+
+class CacheBorne(OrderedDict):
+    """
+    Comme ChargementParesseux, mais limité à capacite valeurs: au-delà, la valeur utilisée
+    le moins récemment est oubliée (pour des clés trop nombreuses pour être toutes gardées).
+    """
+    
+    def __init__(self, fabrique, capacite):
+        """
+        Args:
+            fabrique (callable): Fonction qui calcule la valeur associée à une clé
+            capacite (int): Nombre maximal de valeurs conservées
+        """
+        super().__init__()
+        self.fabrique = fabrique
+        self.capacite = capacite
+    
+    def __getitem__(self, cle):
+        if cle in self:
+            self.move_to_end(cle)
+            return super().__getitem__(cle)
+        valeur = self[cle] = self.fabrique(cle)
+        if len(self) > self.capacite:
+            self.popitem(last=False)
+        return valeur
+
+def charger_sprite_sheet(sheet_name):
+    """
+    Charge une sprite sheet et la convertit au format de la fenêtre (créée si nécessaire).
+    
+    Args:
+        sheet_name (str): Nom de la sprite sheet
+        
+    Returns:
+        Surface: La sprite sheet convertie
+    """
+    fenetre()
+    return pygame.image.load(FICHIERS_SPRITE_SHEETS[sheet_name]).convert_alpha()
+
+# Dictionnaire pour stocker les différentes sprite sheets
+sprite_sheets = ChargementParesseux(charger_sprite_sheet)
+
 # Fonction pour extraire un sprite de la sprite sheet
 def get_sprite(name):
     """
     Extrait un sprite spécifique d'une sprite sheet.
     
+    Le sprite est une vue (subsurface) sur la sprite sheet: aucun pixel n'est copié.
+    Une copie n'est faite que si le rectangle dépasse de la sprite sheet.
+    
     Args:
         name (str): Nom du sprite à extraire
         
@@ -93,9 +153,59 @@ def get_sprite(name):
     sheet_name, x, y, width, height = sprites[name]
     sprite_sheet = sprite_sheets[sheet_name]
     rect = pygame.Rect(x, y, width, height)
+    if sprite_sheet.get_rect().contains(rect):
+        return sprite_sheet.subsurface(rect)
+    return copier_sprite(name)
+
+def taille_sprite(name):
+    """
+    Renvoie la taille d'un sprite, lue dans la table des sprites: sans charger la sprite sheet,
+    ni donc créer la fenêtre (une simulation sans affichage n'a besoin que des tailles).
+    
+    Args:
+        name (str): Nom du sprite
+        
+    Returns:
+        tuple: (largeur, hauteur) en pixels
+    """
+    _, _, _, width, height = sprites[name]
+    return width, height
+
+def copier_sprite(name):
+    """
+    Extrait une copie indépendante d'un sprite (à utiliser si le sprite doit être modifié).
+    
+    Args:
+        name (str): Nom du sprite à copier
+        
+    Returns:
+        Surface: Nouvelle surface contenant les pixels du sprite
+    """
+    sheet_name, x, y, width, height = sprites[name]
+    sprite_sheet = sprite_sheets[sheet_name]
+    rect = pygame.Rect(x, y, width, height)
     image = pygame.Surface(rect.size, pygame.SRCALPHA)
     image.blit(sprite_sheet, (0, 0), rect)
     return image
 
-# Précharger les images des sprites
-sprite_images = {name: get_sprite(name) for name in sprites} 
\ No newline at end of file
+def sprites_par_vie(cle):
+    """
+    Renvoie les sprites d'une brique pour chaque niveau de vie.
+    
+    Args:
+        cle (tuple): (type de brique, couleur)
+        
+    Returns:
+        tuple: Sprite pour chaque vie (l'indice 0, brique détruite, vaut None)
+    """
+    type_brique, couleur = cle
+    if type_brique not in TYPES_BRIQUES or couleur not in TYPES_BRIQUES[type_brique][3]:
+        return (None,)
+    nb_vies = TYPES_BRIQUES[type_brique][2]
+    return (None,) + tuple(sprite_images[f'brique{type_brique}_{vie}_{couleur}'] for vie in range(1, nb_vies + 1))
+
+# Images des sprites, extraites au premier accès
+sprite_images = ChargementParesseux(get_sprite)
+
+# Sprites de chaque brique par niveau de vie: SPRITES_BRIQUES[(type, couleur)][vie]
+SPRITES_BRIQUES = ChargementParesseux(sprites_par_vie)
@@ -0,0 +1,165 @@
+"""
+Module de surveillance des images trop longues: échantillonne la pile du thread principal
+pendant une image qui dépasse son budget et enregistre un rapport horodaté
+"""
+import collections
+import os
+import sys
+import threading
+import time
+
+from src.chronometrage import PHASES
+
+SEUIL_DEFAUT_MS = 25.0  # Une image à 60 FPS dure 16,7 ms: marge pour les variations normales
+DOSSIER_RAPPORTS = 'images_lentes'
+PERIODE_ECHANTILLONNAGE = 0.001  # Secondes entre deux échantillons de pile
+MAX_ECHANTILLONS = 500  # Par image lente
+NB_PILES_RAPPORT = 10  # Piles les plus fréquentes écrites dans le rapport
+
+class SurveillantImages:
+    """
+    Chien de garde du budget des images.
+
+    Un thread dort jusqu'à l'échéance de l'image en cours. Si l'image n'est pas terminée à
+    l'échéance, il relève la pile du thread principal (sys._current_frames) jusqu'à la fin de
+    l'image. Une image rapide ne coûte que quelques affectations et un réveil du thread.
+
+    Seul le travail de l'image est mesuré (de debut_image à fin_travail): l'attente de la
+    limitation de fréquence (clock.tick) n'est ni comptée ni échantillonnée, quelle que soit
+    la fréquence visée.
+    """
+
+    def __init__(self, seuil_ms=SEUIL_DEFAUT_MS, dossier=DOSSIER_RAPPORTS):
+        """
+        Initialise le surveillant et démarre son thread d'échantillonnage.
+
+        Args:
+            seuil_ms (float): Durée d'image au-delà de laquelle un rapport est écrit
+            dossier (str): Dossier des rapports
+        """
+        self.seuil = seuil_ms / 1000
+        self.dossier = dossier
+        self.id_thread_principal = threading.get_ident()
+
+        # État de l'image en cours (écrit par le thread principal, lu par le thread de surveillance)
+        self.numero_image = 0
+        self.image_en_cours = False
+        self.debut_image_courante = time.perf_counter()
+        self.duree_image = None  # Durée du travail de l'image en cours, fixée par fin_travail
+        self.echantillons = []
+        self.rapports = []  # Chemins des rapports écrits
+
+        self.actif = True
+        self.thread = threading.Thread(target=self._surveiller, name='surveillance-images', daemon=True)
+        self.thread.start()
+
+    def debut_image(self):
+        """Signale le début d'une image au surveillant."""
+        self.echantillons = []
+        self.duree_image = None
+        self.debut_image_courante = time.perf_counter()
+        self.numero_image += 1
+        self.image_en_cours = True
+
+    def fin_travail(self):
+        """
+        Signale la fin du travail de l'image (après la présentation, avant clock.tick): arrête
+        l'échantillonnage et fixe la durée comparée au seuil.
+        """
+        self.duree_image = time.perf_counter() - self.debut_image_courante
+        self.image_en_cours = False  # Arrête l'échantillonnage de cette image
+
+    def fin_image(self, jeu, chronometre=None):
+        """
+        Signale la fin d'une image et écrit un rapport si son travail a dépassé le seuil
+        (appelle fin_travail si ce n'est pas déjà fait).
+
+        Args:
+            jeu (Jeu): La partie en cours (pour le nombre de balles, briques et bonus)
+            chronometre (Chronometre, optional): Durées des phases de l'image qui vient de se terminer
+
+        Returns:
+            str: Chemin du rapport écrit, ou None si l'image est dans le budget
+        """
+        if self.image_en_cours:
+            self.fin_travail()
+        duree = self.duree_image
+        if duree <= self.seuil:
+            return None
+        return self._ecrire_rapport(self.numero_image, duree, jeu, chronometre)
+
+    def arreter(self):
+        """Arrête le thread de surveillance."""
+        self.actif = False
+        self.thread.join()
+
+    def _surveiller(self):
+        """Boucle du thread de surveillance: attend l'échéance de chaque image, puis échantillonne."""
+        while self.actif:
+            numero = self.numero_image
+            if not self.image_en_cours:
+                # Hors de la boucle de jeu (menus): pas d'échéance à surveiller
+                time.sleep(self.seuil)
+                continue
+            attente = self.debut_image_courante + self.seuil - time.perf_counter()
+            if attente > 0:
+                time.sleep(attente)
+                continue
+
+            # Échéance dépassée: échantillonner tant que la même image est en cours
+            echantillons = self.echantillons
+            while self._image_toujours_en_cours(numero) and len(echantillons) < MAX_ECHANTILLONS:
+                pile = sys._current_frames().get(self.id_thread_principal)
+                if pile is not None:
+                    echantillons.append(self._decrire_pile(pile))
+                time.sleep(PERIODE_ECHANTILLONNAGE)
+
+            # Attendre l'image suivante
+            while self._image_toujours_en_cours(numero):
+                time.sleep(PERIODE_ECHANTILLONNAGE)
+
+    def _image_toujours_en_cours(self, numero):
+        """Indique si l'image numero est toujours en cours."""
+        return self.actif and self.image_en_cours and self.numero_image == numero
+
+    @staticmethod
+    def _decrire_pile(pile):
+        """Renvoie la pile sous forme de tuple (fichier, ligne, fonction), de l'appel le plus externe au plus interne."""
+        appels = []
+        while pile is not None:
+            code = pile.f_code
+            appels.append((code.co_filename, pile.f_lineno, code.co_name))
+            pile = pile.f_back
+        return tuple(reversed(appels))
+
+    def _ecrire_rapport(self, numero, duree, jeu, chronometre):
+        """Écrit le rapport d'une image lente et renvoie son chemin."""
+        os.makedirs(self.dossier, exist_ok=True)
+        horodatage = time.strftime('%Y%m%d-%H%M%S') + f'-{int(time.time() * 1000) % 1000:03d}'
+        chemin = os.path.join(self.dossier, f'image_lente_{horodatage}_{numero}.txt')
+
+        lignes = [
+            f"Image {numero}: {duree * 1000:.2f} ms (seuil {self.seuil * 1000:.2f} ms)",
+            f"Niveau {jeu.niveau}, balles: {len(jeu.balles)}, briques en vie: {jeu.liste_briques.nb_en_vie}, "
+            f"bonus: {len(jeu.liste_bonus)}",
+        ]
+
+        if chronometre is not None and chronometre.image > 0:
+            durees = chronometre.dernieres_images(1)[0]
+            lignes.append("")
+            lignes.append("Durée des phases (ms):")
+            lignes.extend(f"  {phase:<14}{ns / 1e6:8.3f}" for phase, ns in zip(PHASES, durees))
+
+        # Les piles les plus fréquentes parmi les échantillons
+        echantillons = self.echantillons
+        lignes.append("")
+        lignes.append(f"{len(echantillons)} échantillon(s) de pile après l'échéance")
+        for pile, nombre in collections.Counter(echantillons).most_common(NB_PILES_RAPPORT):
+            lignes.append("")
+            lignes.append(f"{nombre} échantillon(s):")
+            lignes.extend(f"  {fichier}:{ligne} {fonction}" for fichier, ligne, fonction in pile)
+
+        with open(chemin, 'w', encoding='utf-8') as fichier:
+            fichier.write('\n'.join(lignes) + '\n')
+        self.rapports.append(chemin)
+        return chemin
@@ -0,0 +1,155 @@
+"""
+Module contenant la table contiguë (tableaux NumPy) des briques d'un niveau
+"""
+import numpy as np
+
+# Colonnes du tableau des positions et dimensions des briques
+X, Y, DEMI_LARGEUR, DEMI_HAUTEUR = range(4)
+NB_COLONNES = 4
+
+class TableBriques:
+    """
+    Stocke les centres, demi-dimensions, vies, types et couleurs des briques d'un niveau.
+
+    La table se comporte comme une liste de Brique: chaque Brique n'est qu'une vue sur
+    une ligne des tableaux. Les briques détruites restent dans la table (vie <= 0);
+    le nombre de briques en vie est tenu à jour à chaque changement de vie, ce qui rend
+    le test de fin de niveau immédiat.
+    """
+
+    def __init__(self, briques=None, capacite=64):
+        """
+        Initialise une table, éventuellement avec des briques existantes.
+
+        Args:
+            briques (list, optional): Briques à ranger dans la table
+            capacite (int): Nombre de lignes allouées au départ
+        """
+        capacite = max(capacite, 1)
+        self.donnees = np.zeros((capacite, NB_COLONNES))
+        self.vies = np.zeros(capacite, dtype=np.int64)
+        self.indices_types = np.zeros(capacite, dtype=np.int16)
+        self.indices_couleurs = np.zeros(capacite, dtype=np.int16)
+
+        # Correspondance entre les indices numériques et les noms de types et de couleurs
+        self.types = []
+        self.couleurs = []
+
+        self.vues = []  # Brique associée à chaque ligne
+        self.nb_en_vie = 0
+
+        for brique in briques or []:
+            self.append(brique)
+
+    # --- Comportement de liste -------------------------------------------------
+
+    def __len__(self):
+        """Nombre de briques (en vie ou détruites) dans la table."""
+        return len(self.vues)
+
+    def __iter__(self):
+        """Parcourt les briques (vues) dans l'ordre d'ajout."""
+        return iter(self.vues)
+
+    def __getitem__(self, indice):
+        """Renvoie la brique (vue) à l'indice donné."""
+        return self.vues[indice]
+
+    def _agrandir(self, capacite):
+        """Agrandit les tableaux pour contenir au moins capacite lignes."""
+        if capacite <= len(self.donnees):
+            return
+        nouvelle_capacite = max(capacite, 2 * len(self.donnees))
+        n = len(self.vues)
+        for nom in ('donnees', 'vies', 'indices_types', 'indices_couleurs'):
+            ancien = getattr(self, nom)
+            nouveau = np.zeros((nouvelle_capacite,) + ancien.shape[1:], dtype=ancien.dtype)
+            nouveau[:n] = ancien[:n]
+            setattr(self, nom, nouveau)
+
+    def _indice_nom(self, noms, nom):
+        """Renvoie l'indice numérique d'un nom de type ou de couleur (ajouté s'il est nouveau)."""
+        if nom not in noms:
+            noms.append(nom)
+        return noms.index(nom)
+
+    def ajouter_ligne(self, brique, x, y, largeur, hauteur, vie):
+        """
+        Range une nouvelle brique dans la table: la brique devient une vue sur la ligne créée.
+
+        Args:
+            brique (Brique): La brique à ranger
+            x, y (float): Centre de la brique
+            largeur, hauteur (float): Dimensions de la brique
+            vie (int): Vie de la brique
+        """
+        n = len(self.vues)
+        self._agrandir(n + 1)
+        self.donnees[n] = (x, y, largeur / 2, hauteur / 2)
+        self.vies[n] = vie
+        self.indices_types[n] = self._indice_nom(self.types, brique.type_brique)
+        self.indices_couleurs[n] = self._indice_nom(self.couleurs, brique.couleur)
+        self.vues.append(brique)
+        if vie > 0:
+            self.nb_en_vie += 1
+
+        brique._table = self
+        brique._indice = n
+
+    def append(self, brique):
+        """
+        Ajoute une brique existante à la table: ses données sont copiées depuis sa table d'origine.
+
+        Args:
+            brique (Brique): La brique à ajouter
+        """
+        if brique._table is self:
+            return
+        ancienne, indice = brique._table, brique._indice
+        x, y, demi_largeur, demi_hauteur = ancienne.donnees[indice]
+        self.ajouter_ligne(brique, x, y, 2 * demi_largeur, 2 * demi_hauteur, int(ancienne.vies[indice]))
+
+    def extend(self, briques):
+        """
+        Ajoute plusieurs briques à la table.
+
+        Args:
+            briques (iterable): Les briques à ajouter
+        """
+        for brique in briques:
+            self.append(brique)
+
+    # --- Vies ---------------------------------------------------------------------
+
+    def modifier_vie(self, indice, vie):
+        """
+        Change la vie d'une brique en tenant à jour le nombre de briques en vie.
+
+        Args:
+            indice (int): Ligne de la brique dans la table
+            vie (int): Nouvelle vie de la brique
+        """
+        vie_avant = self.vies[indice]
+        self.vies[indice] = vie
+        if vie_avant > 0 and vie <= 0:
+            self.nb_en_vie -= 1
+        elif vie_avant <= 0 and vie > 0:
+            self.nb_en_vie += 1
+
+    def niveau_termine(self):
+        """
+        Indique si toutes les briques de la table sont détruites.
+
+        Returns:
+            bool: True s'il ne reste aucune brique en vie
+        """
+        return self.nb_en_vie == 0
+
+    def en_vie(self):
+        """
+        Renvoie les briques encore en vie, dans l'ordre de la table.
+
+        Returns:
+            list: Les briques dont la vie est strictement positive
+        """
+        return [self.vues[i] for i in np.flatnonzero(self.vies[:len(self.vues)] > 0)]
@@ -0,0 +1,17 @@
+"""
+Configuration commune des tests: sans fenêtre ni son, depuis la racine du dépôt
+"""
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(RACINE)
+if RACINE not in sys.path:
+    sys.path.insert(0, RACINE)
+
+from src.sons import activer_sons  # noqa: E402
+
+activer_sons(False)
@@ -0,0 +1,38 @@
+"""
+Tests du chronomètre: mémoire bornée et percentiles lus dans les histogrammes
+"""
+import numpy as np
+
+from src.chronometrage import PHASES, Chronometre
+
+def remplir(chronometre, nb_images, graine=0):
+    """Enregistre nb_images images de durées aléatoires, sur deux niveaux."""
+    rng = np.random.default_rng(graine)
+    durees = rng.lognormal(np.log(2e6), 0.5, size=(nb_images, len(PHASES))).astype(np.int64)
+    niveaux = np.where(np.arange(nb_images) < nb_images // 3, 1, 2)
+    for ligne, niveau in zip(durees, niveaux):
+        chronometre.image_courante = ligne.tolist()
+        chronometre.fin_image(int(niveau))
+    return niveaux, durees
+
+def test_percentiles_proches_des_valeurs_exactes():
+    """Plusieurs tours du tampon: percentiles (rang le plus proche) à 1 % près."""
+    chronometre = Chronometre(capacite=256)
+    niveaux, durees = remplir(chronometre, 2000)
+    statistiques = chronometre.statistiques()
+    for niveau in (1, 2):
+        durees_niveau = durees[niveaux == niveau]
+        exactes = {'image': durees_niveau.sum(axis=1), **dict(zip(PHASES, durees_niveau.T))}
+        for phase, valeurs in exactes.items():
+            resultat = statistiques[niveau][phase]
+            assert resultat['images'] == len(valeurs)
+            for p in (50, 95, 99):
+                assert abs(resultat[f'p{p}'] - np.percentile(valeurs, p, method='inverted_cdf') / 1e6) <= 0.01 * resultat[f'p{p}']
+
+def test_memoire_independante_de_la_duree():
+    """Les images sorties du tampon ne sont pas gardées une à une."""
+    chronometre = Chronometre(capacite=64)
+    remplir(chronometre, 100)
+    taille = sum(compte.nbytes for compte in chronometre.histogrammes.values())
+    remplir(chronometre, 5000, graine=1)
+    assert sum(compte.nbytes for compte in chronometre.histogrammes.values()) == taille
@@ -0,0 +1,81 @@
+"""
+Tests des collisions continues (balayage): pas de traversée à grande vitesse, coins, contacts multiples
+"""
+import random
+
+import pytest
+
+from src.balle import Balle, MAX_CONTACTS_PAR_IMAGE
+from src.brique import Brique
+from src.collisions import temps_impact
+from src.grille_spatiale import GrilleSpatiale
+from src.raquette import Raquette
+from src.table_briques import TableBriques
+
+def monde(briques, vie=10):
+    """
+    Range des briques dans une table et une grille, avec assez de vies pour ne pas être détruites.
+
+    Returns:
+        GrilleSpatiale: La grille à passer à Balle.deplacer
+    """
+    for brique in briques:
+        brique.vie = vie
+    return GrilleSpatiale(TableBriques(briques))
+
+def test_temps_impact_rapide():
+    """Un déplacement bien plus long que l'épaisseur de la cible la touche sur sa face d'entrée."""
+    # Balle 8x8 montant de 50 px en une image vers une brique 32x9 centrée 30 px plus haut
+    t, nx, ny = temps_impact(100, 100, 0, -50, 4, 4, 100, 70, 16, 4.5)
+    assert t == pytest.approx((30 - 4 - 4.5) / 50)
+    assert (nx, ny) == (0, 1)
+    # Trop court pour l'atteindre, ou dans l'autre sens: pas de contact
+    assert temps_impact(100, 100, 0, -20, 4, 4, 100, 70, 16, 4.5) is None
+    assert temps_impact(100, 100, 0, 50, 4, 4, 100, 70, 16, 4.5) is None
+
+def test_temps_impact_coin():
+    """Arrivée exacte sur un coin: un seul contact, sur une face; juste à côté, la face atteinte en dernier."""
+    # Le coin bas-gauche de la cible agrandie est à (84 - 16 - 4, 70 + 4.5 + 4) = (64, 78.5)
+    t, nx, ny = temps_impact(54, 88.5, 20, -20, 4, 4, 84, 70, 16, 4.5)
+    assert t == pytest.approx(0.5)
+    assert (nx, ny) in ((-1, 0), (0, 1))
+    assert temps_impact(53.9, 88.5, 20, -20, 4, 4, 84, 70, 16, 4.5)[1:] == (-1, 0)  # Face gauche
+    assert temps_impact(54.1, 88.5, 20, -20, 4, 4, 84, 70, 16, 4.5)[1:] == (0, 1)   # Face du bas
+
+def test_balle_rapide_ne_traverse_pas_un_mur_de_briques():
+    """Une balle plus rapide que l'épaisseur d'un mur d'une brique rebondit dessus au lieu de le traverser."""
+    grille = monde([Brique(16 + 32 * i, 60, 'standard', 'bleue') for i in range(7)])
+    balle = Balle(120, 85, 0, -30)
+    impacts = []
+    assert not balle.deplacer(Raquette(), grille, impacts, random.Random(0))
+
+    assert balle.vy == 30
+    assert balle.y == pytest.approx(85 - 16.5 + (30 - 16.5))  # Contact à 16,5 px, puis le reste vers le bas
+    assert [brique.vie for brique, _, _, _ in impacts] == [9]
+
+def test_rebond_sur_un_coin_de_brique():
+    """Sur le coin d'une brique, la balle ne rebondit qu'une fois et ne change qu'une composante de vitesse."""
+    brique = Brique(84, 70, 'standard', 'bleue')
+    grille = monde([brique])
+    balle = Balle(54, 88.5, 20, -20)
+    impacts = []
+    balle.deplacer(Raquette(), grille, impacts, random.Random(0))
+
+    assert len(impacts) == 1 and brique.vie == 9
+    assert (balle.vx, balle.vy) in ((-20, -20), (20, 20))
+    # Le reste du déplacement éloigne la balle de la brique (aucun chevauchement)
+    assert temps_impact(balle.x, balle.y, 0, 0, 4, 4, 84, 70, 16, 4.5) is None
+
+def test_contacts_limites_par_image():
+    """Entre deux briques proches, une balle très rapide rebondit au plus MAX_CONTACTS_PAR_IMAGE fois par image."""
+    # Deux briques 16x16 dont les faces en regard sont à 10 px: la balle (8 px) n'a que 2 px de jeu
+    gauche, droite = Brique(92, 80, 'petite', 'verte'), Brique(118, 80, 'petite', 'verte')
+    grille = monde([gauche, droite])
+    balle = Balle(105, 80, 30, 0)
+    impacts = []
+    balle.deplacer(Raquette(), grille, impacts, random.Random(0))
+
+    assert len(impacts) == MAX_CONTACTS_PAR_IMAGE
+    assert [brique for brique, _, _, _ in impacts] == [droite, gauche] * (MAX_CONTACTS_PAR_IMAGE // 2)
+    # Le reste du déplacement est abandonné: la balle reste entre les deux briques
+    assert 100 + 4 <= balle.x <= 110 - 4
@@ -0,0 +1,49 @@
+"""
+Tests du contrôleur automatique (prédiction des trajectoires)
+"""
+import numpy as np
+
+from benchmarks.commun import creer_balles_aleatoires
+from src.balle import Balle
+from src.controleurs import ControleurAutomatique, ControleurScripte
+from src.jeu import Jeu
+
+def test_balles_perdues_en_un_pas():
+    """Toutes les balles perdues au même pas: les appels suivants ne doivent pas échouer."""
+    controleur = ControleurAutomatique()
+    jeu = Jeu(controleur=controleur, affichage_actif=False, verbeux=False, graine=0)
+    jeu.balles.pop()
+    jeu.balles.extend([Balle(x, 155, vx, 3) for x, vx in ((20, 0.5), (60, -0.7), (220, 1.1))])
+    for _ in range(6):
+        jeu.mise_a_jour()
+    assert jeu.vies == 2
+    assert controleur.position_x(jeu) == jeu.raquette.x
+
+def test_balle_la_plus_urgente():
+    """Les balles complétées à la demande: la balle visée est celle qu'une prédiction de toutes désigne."""
+    # Le contrôleur suit la partie sans la piloter: un appel par pas, après le pas
+    controleur = ControleurAutomatique()
+    jeu = Jeu(controleur=ControleurScripte(graine=3), affichage_actif=False, verbeux=False, graine=3)
+    jeu.balles.pop()
+    jeu.balles.extend(creer_balles_aleatoires(80, graine=3))
+    for _ in range(60):
+        jeu.vies = 3
+        jeu.mise_a_jour()
+        controleur.position_x(jeu)
+        n = len(jeu.balles)
+        arrivee = controleur._arrivee
+        visee = int(np.where(controleur._incomplet, np.inf, arrivee).argmin())
+
+        # Prédiction complète de chaque balle, sans borne
+        complete = ControleurAutomatique()
+        complete._pas = controleur._pas
+        complete._preparer_briques(jeu)
+        arrivees = np.full(n, np.inf)
+        for indice in np.flatnonzero(~jeu.balles.sur_raquette[:n]):
+            complete._x_arrivee, complete._arrivee = np.full(n, np.nan), np.full(n, np.inf)
+            complete._incomplet = np.zeros(n, dtype=bool)
+            complete._predire(jeu, int(indice))
+            arrivees[indice] = complete._arrivee[indice]
+        arrivees[arrivees < controleur._pas] = np.inf
+        if np.isfinite(arrivees).any():
+            assert arrivee[visee] == arrivees.min()
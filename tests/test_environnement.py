@@ -0,0 +1,52 @@
+"""
+Tests de l'environnement d'apprentissage vectorisé (parties dans le processus courant ou réparties)
+"""
+import os
+
+import numpy as np
+
+from src.constantes import XMAX
+from src.environnement import EnvironnementsVectorises
+
+NOMBRE = 4
+NB_PAS = 400
+
+def jouer(envs):
+    """
+    Joue NB_PAS pas avec des actions tirées d'une graine fixe.
+
+    Returns:
+        tuple: (observations, récompenses, terminés) de chaque pas, copiés
+    """
+    actions = np.random.default_rng(0).uniform(0, XMAX, (NB_PAS, NOMBRE))
+    try:
+        resultats = [envs.reset(7).copy()], [], []
+        for action in actions:
+            observations, recompenses, termines, _ = envs.step(action)
+            for liste, tableau in zip(resultats, (observations, recompenses, termines)):
+                liste.append(tableau.copy())
+    finally:
+        envs.close()
+    return tuple(np.array(liste) for liste in resultats)
+
+def test_processus_identiques_au_processus_courant(monkeypatch):
+    """Réparties sur des processus, les parties donnent les mêmes observations et récompenses."""
+    monkeypatch.setattr(os, 'cpu_count', lambda: 8)  # Répartition même sur une machine à un cœur
+    envs = EnvironnementsVectorises(NOMBRE, processus=2, max_pas=150)
+    assert envs.processus == 2
+    reparties = jouer(envs)
+    courant = jouer(EnvironnementsVectorises(NOMBRE, processus=0, max_pas=150))
+
+    observations, recompenses, termines = courant
+    assert termines.any() and recompenses.any()  # Épisodes renouvelés et briques détruites
+    for a, b in zip(reparties, courant):
+        assert np.array_equal(a, b)
+
+def test_repli_dans_le_processus_courant(monkeypatch):
+    """Un seul processus, ou autant que de cœurs: les parties restent dans le processus courant."""
+    monkeypatch.setattr(os, 'cpu_count', lambda: 4)
+    assert EnvironnementsVectorises(NOMBRE, processus=1).processus == 0
+    assert EnvironnementsVectorises(NOMBRE, processus=4).processus == 0
+    envs = EnvironnementsVectorises(NOMBRE, processus=3)
+    assert envs.processus == 3
+    envs.close()
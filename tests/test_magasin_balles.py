@@ -0,0 +1,52 @@
+"""
+Tests du magasin de balles: le déplacement vectorisé suit la même physique que Balle.deplacer
+"""
+import random
+
+import numpy as np
+
+from src.balle import Balle
+from src.constantes import XMAX, YMAX
+from src.jeu import Jeu
+from src.magasin_balles import SEUIL_VECTORISATION, X, Y, VX, VY
+
+NB_BALLES = 4 * SEUIL_VECTORISATION
+NB_PAS = 40
+
+def creer_partie(graine):
+    """Partie du niveau 1 dont les balles, nombreuses et parfois très rapides, descendent vers la raquette."""
+    jeu = Jeu(affichage_actif=False, verbeux=False, graine=graine)
+    rng = random.Random(graine)
+    jeu.balles.pop()
+    jeu.balles.extend(Balle(rng.uniform(8, XMAX - 8), rng.uniform(YMAX / 2, YMAX - 8),
+                            rng.uniform(-6, 6), rng.uniform(-3, 12))
+                      for _ in range(NB_BALLES))
+    return jeu
+
+def test_deplacement_vectorise_identique_a_balle_deplacer():
+    """Mêmes positions, vitesses, balles perdues et briques touchées que balle par balle."""
+    vectorisee, scalaire = creer_partie(3), creer_partie(3)
+    for _ in range(NB_PAS):
+        impacts_vectorises, impacts_scalaires = [], []
+        perdues_vectorisees = vectorisee.balles.deplacer(vectorisee.raquette, vectorisee.grille,
+                                                         impacts_vectorises, vectorisee.rng)
+        perdues_scalaires = [i for i, balle in enumerate(scalaire.balles)
+                             if balle.deplacer(scalaire.raquette, scalaire.grille, impacts_scalaires, scalaire.rng)]
+
+        assert perdues_vectorisees == perdues_scalaires
+        assert [(x, y) for _, _, x, y in impacts_vectorises] == [(x, y) for _, _, x, y in impacts_scalaires]
+        n = len(vectorisee.balles)
+        np.testing.assert_allclose(vectorisee.balles.donnees[:n, [X, Y, VX, VY]],
+                                   scalaire.balles.donnees[:n, [X, Y, VX, VY]], rtol=0, atol=1e-9)
+
+def test_balle_rapide_ne_traverse_pas_la_raquette():
+    """Une balle qui franchit la raquette en un pas rebondit, même parmi de nombreuses balles."""
+    jeu = creer_partie(0)
+    raquette = jeu.raquette
+    # Touche déjà le haut de la raquette et finirait l'image en dessous (sans en sortir par le bas)
+    rapide = Balle(raquette.x, 0, 0, 17)
+    rapide.y = raquette.y - raquette.height / 2 - rapide.height / 2 + 1
+    jeu.balles.append(rapide)
+    jeu.balles.deplacer(raquette, jeu.grille)
+    assert rapide.vy < 0
+    assert not rapide.sur_raquette
@@ -0,0 +1,38 @@
+"""
+Tests de la génération des niveaux (disposition des briques selon la graine)
+"""
+from src.jeu import Jeu
+from src.niveaux import NOMBRE_MAX_NIVEAUX
+
+def disposition(jeu):
+    """Contenu de la table des briques du niveau chargé: positions, tailles, vies, types et couleurs."""
+    table = jeu.liste_briques
+    n = len(table)
+    return (table.donnees[:n].tolist(), table.vies[:n].tolist(),
+            [table.types[indice] for indice in table.indices_types[:n]],
+            [table.couleurs[indice] for indice in table.indices_couleurs[:n]])
+
+def dispositions(graine, niveaux=range(1, NOMBRE_MAX_NIVEAUX + 1)):
+    """Dispositions des niveaux demandés, chargés dans l'ordre par une partie de cette graine."""
+    jeu = Jeu(affichage_actif=False, verbeux=False, graine=graine)
+    resultats = []
+    for niveau in niveaux:
+        jeu.charger_niveau(niveau)
+        resultats.append(disposition(jeu))
+    return resultats
+
+def test_meme_graine_memes_niveaux():
+    """Deux parties de même graine ont les mêmes briques à chaque niveau."""
+    premiere = dispositions(3)
+    assert len(premiere) == NOMBRE_MAX_NIVEAUX
+    assert all(briques for briques, _, _, _ in premiere)
+    assert dispositions(3) == premiere
+
+def test_autre_graine_autres_niveaux():
+    """Une autre graine change la disposition des niveaux."""
+    assert all(a != b for a, b in zip(dispositions(3), dispositions(4)))
+
+def test_niveau_independant_des_precedents():
+    """La disposition d'un niveau ne dépend pas des niveaux chargés (ou joués) avant lui."""
+    dernier = NOMBRE_MAX_NIVEAUX
+    assert dispositions(3, [dernier]) == dispositions(3, [2, 5, dernier])[-1:]
@@ -0,0 +1,54 @@
+"""
+Tests de la raquette (animation de la largeur)
+"""
+from src import raquette as module_raquette
+from src.raquette import Raquette, VITESSE_ANIMATION_LARGEUR
+
+class SurfacesEspionnees:
+    """Remplace surfaces_raquette: note la largeur de chaque surface dessinée."""
+
+    def __init__(self, surfaces):
+        self.surfaces = surfaces
+        self.largeurs = []
+
+    def __getitem__(self, largeur):
+        self.largeurs.append(largeur)
+        return self.surfaces[largeur]
+
+def largeurs_dessinees(raquette):
+    """Largeurs dessinées par Raquette.afficher pendant le pas qui vient d'être joué (début, milieu et fin)."""
+    espion = module_raquette.surfaces_raquette
+    espion.largeurs.clear()
+    for alpha in (0.0, 0.5, 1.0):
+        raquette.afficher(alpha)
+    return list(espion.largeurs)
+
+def test_largeur_animee_dans_la_zone_de_collision(monkeypatch):
+    """Élargissement puis retour à la normale, animés: la raquette dessinée ne dépasse jamais sa zone de collision."""
+    monkeypatch.setattr(module_raquette, 'surfaces_raquette', SurfacesEspionnees(module_raquette.surfaces_raquette))
+    raquette = Raquette()
+    normale = raquette.width
+    raquette.elargir()
+    elargie = raquette.width
+
+    # Élargissement: la zone de collision est élargie d'emblée, la raquette dessinée la rejoint
+    dessinees = []
+    while raquette.largeur_affichee < elargie:
+        raquette.mise_a_jour()
+        assert raquette.width == elargie
+        dessinees += largeurs_dessinees(raquette)
+    assert all(largeur <= elargie for largeur in dessinees)
+    assert any(normale < largeur < elargie for largeur in dessinees)
+
+    # Rétrécissement: zone de collision et raquette dessinée diminuent ensemble, pas à pas
+    while raquette.elargie:
+        raquette.mise_a_jour()
+    collisions = [raquette.width]
+    while raquette.width > normale:
+        precedente = raquette.width
+        raquette.mise_a_jour()
+        assert precedente - VITESSE_ANIMATION_LARGEUR <= raquette.width < precedente
+        assert all(largeur <= raquette.width for largeur in largeurs_dessinees(raquette))
+        collisions.append(raquette.width)
+    assert len(collisions) > 2 and any(normale < largeur < elargie for largeur in collisions)
+    assert raquette.width == raquette.largeur_affichee == normale
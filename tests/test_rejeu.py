@@ -0,0 +1,102 @@
+"""
+Tests de l'enregistrement et du rejeu des parties
+"""
+import struct
+import zlib
+
+import pygame
+import pytest
+
+from src.controleurs import ControleurScripte
+from src.jeu import Jeu
+from src.rejeu import (Enregistreur, FORMAT_EN_TETE, FORMAT_IMAGE, LANCER, PAUSE, empreinte_etat,
+                       lire_enregistrement, rejouer)
+
+GRAINE = 5
+NB_IMAGES = 600
+PAS_PAR_IMAGE = 2
+IMAGES_EN_PAUSE = range(200, 210)
+
+def enregistrer_partie(chemin):
+    """
+    Enregistre une partie jouée par le contrôleur scripté (lancers, et une pause en cours de partie).
+
+    Returns:
+        list: Empreinte de l'état après chaque image enregistrée (les images de la pause, sans
+              événement ni pas de simulation, ne sont pas dans le fichier)
+    """
+    enregistreur = Enregistreur(GRAINE)
+    jeu = Jeu(controleur=enregistreur.controleur(ControleurScripte(graine=1)), affichage_actif=False,
+              verbeux=False, graine=GRAINE)
+    empreintes = []
+    for indice in range(NB_IMAGES):
+        evenements = []
+        if indice in (IMAGES_EN_PAUSE.start, IMAGES_EN_PAUSE.stop):
+            evenements.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        if all(balle.sur_raquette for balle in jeu.balles):
+            evenements.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        enregistreur.image(evenements)
+        jeu.gestion_evenements(evenements)
+        for _ in range(PAS_PAR_IMAGE):
+            jeu.mise_a_jour()
+        if evenements or not jeu.en_pause:
+            empreintes.append(empreinte_etat(jeu))
+    enregistreur.sauvegarder(chemin, jeu)
+    return empreintes
+
+@pytest.fixture(scope='module')
+def enregistrement(tmp_path_factory):
+    """Fichier d'une partie enregistrée et empreintes de ses états successifs."""
+    chemin = tmp_path_factory.mktemp('rejeu') / 'partie.rejeu'
+    return chemin, enregistrer_partie(chemin)
+
+def test_rejeu_identique_image_par_image(enregistrement):
+    """La partie rejouée passe par les mêmes états que la partie enregistrée, image par image."""
+    chemin, empreintes = enregistrement
+    graine, images, empreinte_finale = lire_enregistrement(chemin)
+    assert graine == GRAINE
+    assert len(images) == len(empreintes) == NB_IMAGES - (len(IMAGES_EN_PAUSE) - 1)
+    assert empreinte_finale == empreintes[-1]
+
+    empreintes_rejeu = []
+    jeu = rejouer(graine, images, lambda jeu: empreintes_rejeu.append(empreinte_etat(jeu)))
+    assert empreintes_rejeu == empreintes
+    assert len(set(empreintes)) > NB_IMAGES / 2  # La partie a bien avancé
+    assert jeu.niveau > 1 or jeu.liste_briques.nb_en_vie < len(jeu.liste_briques)
+
+def modifier(chemin, destination, modification):
+    """Écrit dans destination le contenu de chemin transformé par modification(bytearray)."""
+    contenu = bytearray(chemin.read_bytes())
+    modification(contenu)
+    destination.write_bytes(bytes(contenu))
+    return destination
+
+@pytest.mark.parametrize('nom, modification', [
+    ('signature', lambda contenu: contenu.__setitem__(0, ord('X'))),
+    ('version', lambda contenu: contenu.__setitem__(4, contenu[4] + 1)),
+    ('octet inversé', lambda contenu: contenu.__setitem__(len(contenu) // 2, contenu[len(contenu) // 2] ^ 0xFF)),
+    ('tronqué', lambda contenu: contenu.__delitem__(slice(len(contenu) - 20, None))),
+    ('en-tête seul', lambda contenu: contenu.__delitem__(slice(struct.calcsize(FORMAT_EN_TETE), None))),
+    ('vide', lambda contenu: contenu.clear()),
+])
+def test_fichier_corrompu_refuse(enregistrement, tmp_path, nom, modification):
+    """Un fichier corrompu ou d'une autre version est refusé par une ValueError."""
+    chemin = modifier(enregistrement[0], tmp_path / 'corrompu.rejeu', modification)
+    with pytest.raises(ValueError):
+        lire_enregistrement(chemin)
+
+def test_fichier_falsifie_detecte(enregistrement, tmp_path):
+    """Un événement falsifié (fichier bien formé) donne un état final différent de l'empreinte enregistrée."""
+    taille_en_tete = struct.calcsize(FORMAT_EN_TETE)
+
+    def falsifier(contenu):
+        donnees = bytearray(zlib.decompress(contenu[taille_en_tete:]))
+        # Le premier événement (le lancer de la première image) devient une pause
+        position = struct.calcsize(FORMAT_IMAGE)
+        assert donnees[position] == LANCER
+        donnees[position] = PAUSE
+        contenu[taille_en_tete:] = zlib.compress(bytes(donnees))
+
+    chemin = modifier(enregistrement[0], tmp_path / 'falsifie.rejeu', falsifier)
+    graine, images, empreinte = lire_enregistrement(chemin)
+    assert empreinte_etat(rejouer(graine, images)) != empreinte
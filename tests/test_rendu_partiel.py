@@ -0,0 +1,27 @@
+"""
+Tests du rendu partiel (zones modifiées renvoyées par Jeu.affichage)
+"""
+import random
+
+from src.balle import Balle
+from src.constantes import XMAX
+from src.jeu import Jeu
+
+def test_zones_modifiees_peu_d_objets():
+    """Avec une balle, seules de petites zones sont présentées après la première image."""
+    jeu = Jeu(rendu_partiel=True, verbeux=False, graine=1)
+    jeu.affichage()  # Première image: écran entier
+    jeu.mise_a_jour()
+    zones = jeu.affichage()
+    assert zones is not None
+    assert sum(zone.w * zone.h for zone in zones) < XMAX * 40
+
+def test_image_complete_si_les_zones_couvrent_l_ecran():
+    """Quand les zones à effacer couvrent la plus grande partie de l'écran, l'image est présentée en entier."""
+    rng = random.Random(0)
+    jeu = Jeu(rendu_partiel=True, verbeux=False, graine=1)
+    jeu.affichage()
+    jeu.balles.extend([Balle(rng.uniform(10, XMAX - 10), rng.uniform(20, 140), 1, -1) for _ in range(400)])
+    assert jeu.affichage() is not None  # Zones de l'image précédente encore petites: rendu partiel
+    assert jeu.affichage() is None
+    assert Jeu(verbeux=False, graine=1).affichage() is None  # Sans rendu partiel, toujours None
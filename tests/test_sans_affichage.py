@@ -0,0 +1,29 @@
+"""
+Tests d'une partie sans affichage (simulation seule, sans fenêtre)
+"""
+import subprocess
+import sys
+
+from tests.conftest import RACINE
+
+# Exécuté dans un processus neuf: dans celui des tests, d'autres tests ont pu créer la fenêtre
+PARTIE_SANS_AFFICHAGE = """
+import pygame
+from src.controleurs import ControleurAutomatique
+from src.jeu import Jeu
+from src.sons import activer_sons
+activer_sons(False)
+jeu = Jeu(controleur=ControleurAutomatique(), affichage_actif=False, verbeux=False, graine=3)
+for _ in range(3000):
+    if all(balle.sur_raquette for balle in jeu.balles):
+        jeu.lancer_balles(30, 150)
+    jeu.mise_a_jour()
+assert jeu.niveau > 1, "la partie devrait avoir avancé"
+print(pygame.display.get_surface())
+"""
+
+def test_aucune_fenetre_sans_affichage():
+    """Balles, raquette, briques et bonus d'une partie sans affichage ne créent pas de fenêtre."""
+    resultat = subprocess.run([sys.executable, '-c', PARTIE_SANS_AFFICHAGE], cwd=RACINE, capture_output=True, text=True,
+                              check=True)
+    assert resultat.stdout.splitlines()[-1] == 'None'
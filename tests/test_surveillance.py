@@ -0,0 +1,39 @@
+"""
+Tests du surveillant des images lentes
+"""
+import os
+import time
+
+from src.jeu import Jeu
+from src.surveillance import SurveillantImages, SEUIL_DEFAUT_MS
+
+def jouer_image(surveillant, jeu, travail, attente):
+    """Une image de la boucle de jeu: travail (s), présentation, puis attente de clock.tick (s)."""
+    surveillant.debut_image()
+    time.sleep(travail)
+    surveillant.fin_travail()
+    time.sleep(attente)
+    return surveillant.fin_image(jeu)
+
+def test_image_inactive_a_basse_frequence(tmp_path):
+    """À 30 FPS une image dure ~33 ms, surtout d'attente: aucun rapport sous le seuil de 25 ms."""
+    jeu = Jeu(affichage_actif=False, verbeux=False, graine=0)
+    surveillant = SurveillantImages(SEUIL_DEFAUT_MS, dossier=str(tmp_path / 'rapports'))
+    try:
+        rapports = [jouer_image(surveillant, jeu, 0.002, 1 / 30) for _ in range(3)]
+    finally:
+        surveillant.arreter()
+    assert rapports == [None] * 3
+    assert not os.path.exists(tmp_path / 'rapports')
+
+def test_image_lente(tmp_path):
+    """Une image dont le travail dépasse le seuil écrit un rapport avec les piles échantillonnées."""
+    jeu = Jeu(affichage_actif=False, verbeux=False, graine=0)
+    surveillant = SurveillantImages(10, dossier=str(tmp_path))
+    try:
+        chemin = jouer_image(surveillant, jeu, 0.05, 0)
+    finally:
+        surveillant.arreter()
+    assert chemin is not None and os.path.exists(chemin)
+    with open(chemin, encoding='utf-8') as fichier:
+        assert 'jouer_image' in fichier.read()
@@ -0,0 +1,55 @@
+"""
+Tests de la table des briques (compteur des briques en vie, briques détruites en partie)
+"""
+import pygame
+
+from src.balle import Balle
+from src.brique import Brique
+from src.couche_briques import CoucheBriques
+from src.gestion_affichage import rectangle_objet
+from src.jeu import Jeu
+from src.table_briques import TableBriques
+
+def test_compteur_briques_en_vie():
+    """Le compteur suit chaque changement de vie, sans parcourir la table."""
+    briques = [Brique(40 + 40 * i, 30, 'standard', 'bleue') for i in range(3)]
+    table = TableBriques(briques)
+    assert table.nb_en_vie == 3 and not table.niveau_termine()
+
+    briques[0].vie = 0
+    briques[1].vie -= 1
+    assert table.nb_en_vie == 2
+    briques[0].vie = -1  # Déjà détruite: pas de second décompte
+    assert table.nb_en_vie == 2
+    briques[0].vie = 1
+    assert table.nb_en_vie == 3
+
+    for brique in briques:
+        brique.vie = 0
+    assert table.nb_en_vie == 0 and table.niveau_termine()
+    assert table.en_vie() == []
+
+def test_brique_detruite_en_partie():
+    """Une brique détruite quitte la grille et sa zone de la couche statique est redessinée."""
+    jeu = Jeu(verbeux=False, graine=0)
+    brique = max(jeu.liste_briques.en_vie(), key=lambda brique: brique.y)  # Rien dessous
+    brique.vie = 1
+    en_vie = jeu.liste_briques.nb_en_vie
+    zone = rectangle_objet(brique)
+
+    jeu.balles.pop()
+    jeu.balles.append(Balle(brique.x, brique.y + brique.height / 2 + 6, 0, -3))
+    for _ in range(5):
+        jeu.mise_a_jour()
+        if not brique.en_vie():
+            break
+
+    assert not brique.en_vie()
+    assert jeu.liste_briques.nb_en_vie == en_vie - 1
+    assert brique not in jeu.grille.briques_proches(zone.left, zone.top, zone.right, zone.bottom)
+    assert zone in jeu.zones_briques
+
+    # La zone redessinée est celle d'une couche composée après la destruction
+    neuve = CoucheBriques(jeu.background_image, jeu.bg_x, jeu.bg_y, jeu.liste_briques)
+    assert (pygame.image.tobytes(jeu.couche_briques.surface.subsurface(zone), 'RGB')
+            == pygame.image.tobytes(neuve.surface.subsurface(zone), 'RGB'))